@@ -1,10 +1,16 @@
 """Game Constants and Configuration for Monster-Weapon-2d"""
 
 # Map Tile Types
-WALL = '#'
-FLOOR = ' '
-CORRIDOR = 'C'
-DOOR = 'D'
+# Cells are stored as small ints (the byte code of each tile's map character),
+# so maze tests are plain integer compares instead of string comparisons
+WALL = ord('#')
+FLOOR = ord(' ')
+CORRIDOR = ord('C')
+DOOR = ord('D')         # Locked door (needs a key)
+DOOR_CLOSED = ord('R')  # Room door shut while monsters are inside
+DOOR_OPEN = ord('O')    # Room door the player can walk through
+START = ord('S')
+END = ord('E')
 
 # Display Settings
 WINDOW_WIDTH = 1400
@@ -12,6 +12,9 @@ from enums import ItemType, MonsterType as EnemyType
 class Obstacle:
     """Represents a rock or obstacle in a room that blocks movement and bullets."""
     
+    # Fixed field layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('x', 'y', 'size', 'pixel_size')
+    
     SIZE_MAP = {
         "small": 20,
         "medium": 30,
@@ -38,6 +41,24 @@ class SwordSwing:
     Represents a melee sword swing attack with animation and collision.
     """
     
+    # Base angle of the swing arc for each (direction_x, direction_y)
+    BASE_ANGLES = {
+        (1, 0): 0,              # East
+        (-1, 0): math.pi,       # West
+        (0, -1): -math.pi / 2,  # North
+        (0, 1): math.pi / 2,    # South
+    }
+    
+    # Arc offsets from the swing's start for each direction: two rings of reach
+    # times five angles, so the trig runs once at import instead of per call
+    ARC_OFFSETS = {
+        direction: tuple((r * math.cos(base_angle + angle_offset),
+                          r * math.sin(base_angle + angle_offset))
+                         for r in (1.0, 1.5)
+                         for angle_offset in (-math.pi/4, -math.pi/8, 0, math.pi/8, math.pi/4))
+        for direction, base_angle in BASE_ANGLES.items()
+    }
+    
     def __init__(self, x: float, y: float, direction_x: float, direction_y: float, damage: int = 2):
         """
         Initialize a sword swing.
@@ -81,42 +102,22 @@ class SwordSwing:
         if not self.active:
             return []
         
-        import math
-        
-        # Calculate swing progress (0.0 to 1.0)
-        progress = self.frame / self.duration
-        
         # Swing covers an arc in front of player
-        positions = []
-        
-        # Base angle from direction
-        if self.direction_x == 1 and self.direction_y == 0:  # East
-            base_angle = 0
-        elif self.direction_x == -1 and self.direction_y == 0:  # West
-            base_angle = math.pi
-        elif self.direction_x == 0 and self.direction_y == -1:  # North
-            base_angle = -math.pi / 2
-        elif self.direction_x == 0 and self.direction_y == 1:  # South
-            base_angle = math.pi / 2
-        else:
+        arc_offsets = self.ARC_OFFSETS.get((self.direction_x, self.direction_y))
+        if arc_offsets is None:
             return []  # Invalid direction
         
         # Swing arc positions
-        for r in [1.0, 1.5]:  # Two rings of reach
-            for angle_offset in [-math.pi/4, -math.pi/8, 0, math.pi/8, math.pi/4]:
-                angle = base_angle + angle_offset
-                x = self.start_x + r * math.cos(angle)
-                y = self.start_y + r * math.sin(angle)
-                grid_x = int(round(x))
-                grid_y = int(round(y))
-                positions.append((grid_x, grid_y))
-        
-        return positions
+        return [(int(round(self.start_x + offset_x)), int(round(self.start_y + offset_y)))
+                for offset_x, offset_y in arc_offsets]
 
 
 class Item:
     """Represents a collectible item in the game world."""
     
+    # Fixed field layout: no per-instance __dict__, faster attribute access
+    __slots__ = ('x', 'y', 'type', 'value', 'collected')
+    
     def __init__(self, x: int, y: int, item_type: ItemType, value: int = 1):
         """
         Initialize a new item at the specified position.
@@ -134,14 +135,22 @@ class Item:
         self.collected = False
 
 
-class Room:
+class Room(pygame.Rect):
     """
     Represents a room in the dungeon with geometric and semantic properties.
     
     Rooms are the main building blocks of the dungeon, connected by corridors.
     Each room has a specific type that determines its content and connectivity.
+    
+    Room is a pygame.Rect, so its edges, centers and collidepoint() come
+    straight from the C implementation instead of Python-level wrappers.
     """
     
+    # Rooms are distinct objects even if two ever share the same geometry
+    __eq__ = object.__eq__
+    __ne__ = object.__ne__
+    __hash__ = object.__hash__
+    
     def __init__(self, x: int, y: int, width: int, height: int, room_type: str = 'main', room_index: int = 0):
         """
         Create a new room with specified dimensions and properties.
@@ -154,11 +163,12 @@ class Room:
             room_type: Room category ('main', 'treasure', 'key')
             room_index: Unique room identifier
         """
-        self.rect = pygame.Rect(x, y, width, height)
+        super().__init__(x, y, width, height)
         self.room_type = room_type
         self.room_index = room_index
         self.connected_to = None
         self.doors = []  # List of door positions for this room
+        self.adjacent_doors = []  # Doors on this room's boundary (subset of doors)
         self.monsters_in_room = []  # List of monsters inside this room
         self.doors_closed = False  # Whether doors are closed (enemies present) - default open
         self.entry_door = None  # The door the player entered from (stays open)
@@ -171,51 +181,11 @@ class Room:
         self.obstacle_data = []  # Stored obstacle spawn data: list of (x, y, size) tuples
         self.is_starting_room = False  # Flag to prevent monster spawns in starting room
     
-    def collidepoint(self, x: int, y: int) -> bool:
-        """Check if a point is inside this room."""
-        return self.rect.collidepoint(x, y)
-    
-    def colliderect(self, other) -> bool:
-        """Check if this room overlaps with another room or rectangle."""
-        if isinstance(other, Room):
-            return self.rect.colliderect(other.rect)
-        return self.rect.colliderect(other)
-    
     def inflate(self, dx: int, dy: int):
         """Create a new room with expanded/contracted dimensions."""
-        new_rect = self.rect.inflate(dx, dy)
+        new_rect = pygame.Rect.inflate(self, dx, dy)
         new_room = Room(new_rect.x, new_rect.y, new_rect.width, new_rect.height, self.room_type, self.room_index)
         return new_room
-    
-    @property
-    def centerx(self):
-        """Horizontal center coordinate of the room."""
-        return self.rect.centerx
-    
-    @property
-    def centery(self):
-        """Vertical center coordinate of the room."""
-        return self.rect.centery
-    
-    @property
-    def right(self):
-        """Right edge X coordinate of the room."""
-        return self.rect.right
-    
-    @property
-    def left(self):
-        """Left edge X coordinate of the room."""
-        return self.rect.left
-    
-    @property
-    def top(self):
-        """Top edge Y coordinate of the room."""
-        return self.rect.top
-    
-    @property
-    def bottom(self):
-        """Bottom edge Y coordinate of the room."""
-        return self.rect.bottom
 
 
 class Monster:
@@ -224,6 +194,15 @@ class Monster:
     All enemies are now skeletons with the same behavior but different difficulty scaling.
     """
     
+    # Fixed field layout: the per-frame AI, collision and draw loops read these
+    # attributes on every monster, so skip the per-instance __dict__
+    __slots__ = ('x', 'y', 'real_x', 'real_y', 'spawn_room', 'difficulty',
+                 'speed', 'hp', 'max_hp', 'damage', 'size',
+                 'vel_x', 'vel_y', 'last_dx', 'last_dy',
+                 'alive', 'last_move_time', 'move_delay',
+                 'attack_state', 'attack_timer', 'windup_duration', 'attack_duration',
+                 'cooldown_duration', 'attack_range', 'flash_timer', 'windup_flash')
+    
     def __init__(self, x: int, y: int, difficulty: int = 1):
         """
         Create a new skeleton monster at the specified position.
@@ -294,8 +273,6 @@ class Monster:
             player_x: Player's real X position
             player_y: Player's real Y position
         """
-        import math
-        
         # Calculate direction to player
         dx = player_x - self.real_x
         dy = player_y - self.real_y
@@ -357,20 +334,11 @@ class Monster:
         if self.windup_flash > 0:
             self.windup_flash -= 1
     
-    def get_attack_area(self):
-        """Get the positions that will be hit if this skeleton attacks now."""
-        if self.attack_state != "attacking":
-            return []
-        
-        # Attack hits adjacent cells
-        positions = []
-        for dx in [-1, 0, 1]:
-            for dy in [-1, 0, 1]:
-                if dx == 0 and dy == 0:
-                    continue  # Skip self position
-                positions.append((self.x + dx, self.y + dy))
-        
-        return positions
+    def hits_cell(self, x: int, y: int) -> bool:
+        """Check whether an attack right now hits cell (x, y): any of the 8 cells around the skeleton."""
+        return (self.attack_state == "attacking" and
+                abs(x - self.x) <= 1 and abs(y - self.y) <= 1 and
+                (x, y) != (self.x, self.y))
     
     def take_damage(self, damage: int):
         """Take damage and flash red."""
@@ -379,15 +347,15 @@ class Monster:
         if self.hp <= 0:
             self.alive = False
     
-    def update_position(self, maze, all_monsters, obstacles=[]):
+    def update_position(self, maze, all_monsters, obstacle_mask=None):
         """
         Update monster position based on velocity with collision.
         Monsters are confined to their spawn room and cannot leave.
         
         Args:
-            maze: 2D grid representing the dungeon layout
+            maze: Dungeon rows, one bytearray of tile codes per row
             all_monsters: List of all monsters for collision detection
-            obstacles: List of obstacles to avoid
+            obstacle_mask: Rows of bytes, non-zero where an obstacle blocks the cell
         """
         if self.vel_x == 0 and self.vel_y == 0:
             return
@@ -413,13 +381,7 @@ class Monster:
             maze[new_grid_y][new_grid_x] != WALL):
             
             # Check obstacle collision
-            obstacle_collision = False
-            for obstacle in obstacles:
-                if obstacle.x == new_grid_x and obstacle.y == new_grid_y:
-                    obstacle_collision = True
-                    break
-            
-            if obstacle_collision:
+            if obstacle_mask is not None and obstacle_mask[new_grid_y][new_grid_x]:
                 return  # Blocked by obstacle
             
             # Check enemy collision
@@ -430,10 +392,10 @@ class Monster:
                 
                 dx = new_real_x - other.real_x
                 dy = new_real_y - other.real_y
-                distance = (dx * dx + dy * dy) ** 0.5
                 min_dist = (self.size + other.size) / 55.0 * 0.4  # Collision radius
                 
-                if distance < min_dist:
+                # Compare squared distances, no square root needed
+                if dx * dx + dy * dy < min_dist * min_dist:
                     collision = True
                     break
             
@@ -479,8 +441,6 @@ class Player:
         
         self.prev_x = start_x  # Track previous position for entry door detection
         self.prev_y = start_y
-        self.visited_cells = set()
-        self.visited_cells.add((start_x, start_y))
         
         # Player stats
         self.hp = 6  # Isaac-style: start with 3 hearts (6 half-hearts)
@@ -624,12 +584,12 @@ class Player:
             if abs(self.vel_y) < 0.001:
                 self.vel_y = 0
     
-    def update_position(self, maze: List[List[str]], game=None):
+    def update_position(self, maze: List[bytearray], game=None):
         """
         Update player position based on velocity with smooth wall sliding collision.
         
         Args:
-            maze: 2D grid representing the dungeon layout
+            maze: Dungeon rows, one bytearray of tile codes per row
             game: Game instance for door state management
         """
         if self.vel_x == 0 and self.vel_y == 0:
@@ -653,11 +613,9 @@ class Player:
                 if new_grid_x != self.x:
                     self.prev_x = self.x
                     self.x = new_grid_x
-                    self.visited_cells.add((self.x, self.y))
                 if new_grid_y != self.y:
                     self.prev_y = self.y
                     self.y = new_grid_y
-                    self.visited_cells.add((self.x, self.y))
                 return
             
             # Diagonal blocked, try sliding along one axis
@@ -667,7 +625,6 @@ class Player:
                 if new_grid_x != self.x:
                     self.prev_x = self.x
                     self.x = new_grid_x
-                    self.visited_cells.add((self.x, self.y))
                 # Don't move vertically but keep position
                 return
             
@@ -677,7 +634,6 @@ class Player:
                 if new_grid_y != self.y:
                     self.prev_y = self.y
                     self.y = new_grid_y
-                    self.visited_cells.add((self.x, self.y))
                 # Don't move horizontally but keep position
                 return
             
@@ -695,7 +651,6 @@ class Player:
                 if new_grid_x != self.x:
                     self.prev_x = self.x
                     self.x = new_grid_x
-                    self.visited_cells.add((self.x, self.y))
             # If blocked, just don't move (stay at current position)
         
         if self.vel_y != 0:
@@ -708,17 +663,16 @@ class Player:
                 if new_grid_y != self.y:
                     self.prev_y = self.y
                     self.y = new_grid_y
-                    self.visited_cells.add((self.x, self.y))
             # If blocked, just don't move (stay at current position)
     
-    def _can_move_to(self, grid_x: int, grid_y: int, maze: List[List[str]], game=None) -> bool:
+    def _can_move_to(self, grid_x: int, grid_y: int, maze: List[bytearray], game=None) -> bool:
         """
         Check if player can move to the specified grid position.
         
         Args:
             grid_x: Target grid X coordinate
             grid_y: Target grid Y coordinate
-            maze: 2D grid representing the dungeon layout
+            maze: Dungeon rows, one bytearray of tile codes per row
             game: Game instance for door state management and obstacles
             
         Returns:
@@ -731,20 +685,18 @@ class Player:
         cell = maze[grid_y][grid_x]
         
         # Check walls
-        if cell == '#':
+        if cell == WALL:
             return False
         
         # Check obstacles
-        if game:
-            for obstacle in game.obstacles:
-                if obstacle.x == grid_x and obstacle.y == grid_y:
-                    return False
+        if game and game.obstacle_mask[grid_y][grid_x]:
+            return False
         
         # Check locked doors
-        if cell == 'D':
+        if cell == DOOR:
             if self.keys > 0:
                 self.keys -= 1
-                maze[grid_y][grid_x] = 'O'  # Change to open door
+                maze[grid_y][grid_x] = DOOR_OPEN  # Change to open door
                 if game:
                     game.locked_doors = [(x, y) for (x, y) in game.locked_doors if (x, y) != (grid_x, grid_y)]
                 # Teleport through the door
@@ -754,48 +706,30 @@ class Player:
                 return False
         
         # Check open doors - teleport through them
-        if cell == 'O':
+        if cell == DOOR_OPEN:
             self._teleport_through_door(grid_x, grid_y, maze, game)
             return False  # Don't move to door position, we teleported
         
         # Check room doors
-        if cell == 'R':
+        if cell == DOOR_CLOSED:
             # Closed room door - blocked by monsters, cannot pass
             return False
         
         # Empty spaces are passable
         return True
     
-    def _teleport_through_door(self, door_x: int, door_y: int, maze: List[List[str]], game=None):
+    def _teleport_through_door(self, door_x: int, door_y: int, maze: List[bytearray], game=None):
         """Teleport player through a door to the adjacent room."""
         if not game:
             return
         
-        # Find which room is on the other side of this door
-        target_room = None
-        current_room = game.current_room
-        
-        # Check all rooms to find which ones have this door
-        all_rooms = []
-        if hasattr(game, 'rooms'):
-            all_rooms.extend(game.rooms)
-        if hasattr(game, 'treasure_rooms'):
-            all_rooms.extend(game.treasure_rooms)
-        if hasattr(game, 'shop_rooms'):
-            all_rooms.extend(game.shop_rooms)
-        if hasattr(game, 'secret_rooms'):
-            all_rooms.extend(game.secret_rooms)
-        if hasattr(game, 'super_secret_rooms'):
-            all_rooms.extend(game.super_secret_rooms)
-        
-        # Find the room on the other side
-        for room in all_rooms:
-            if (door_x, door_y) in room.doors and room != current_room:
-                target_room = room
-                break
-        
-        if not target_room:
+        # Find which room is on the other side of this door through the
+        # door -> (room1, room2) index instead of scanning every room
+        joined_rooms = game.door_rooms.get((door_x, door_y))
+        if not joined_rooms:
             return
+        room1, room2 = joined_rooms
+        target_room = room2 if room1 == game.current_room else room1
         
         # Determine teleport position based on door location relative to target room
         if door_y == target_room.top - 1:  # Door is north of target room
@@ -823,7 +757,7 @@ class Player:
             self.real_x = float(self.x)
             self.real_y = float(self.y)
     
-    def move(self, dx: int, dy: int, maze: List[List[str]], game=None) -> bool:
+    def move(self, dx: int, dy: int, maze: List[bytearray], game=None) -> bool:
         """
         DEPRECATED: Kept for compatibility. Use set_velocity() and update_position() instead.
         
@@ -832,7 +766,7 @@ class Player:
         Args:
             dx: Horizontal movement (-1, 0, or 1)
             dy: Vertical movement (-1, 0, or 1) 
-            maze: 2D grid representing the dungeon layout
+            maze: Dungeon rows, one bytearray of tile codes per row
             game: Game instance for door state management
             
         Returns:
@@ -847,7 +781,6 @@ class Player:
             self.y = new_y
             self.real_x = float(new_x)
             self.real_y = float(new_y)
-            self.visited_cells.add((new_x, new_y))
             return True
         
         return False
@@ -6,6 +6,27 @@ from GameEntities import Item, ItemType, Room
 from GameConstants import *
 
 
+def _apply_treasure(player, item: Item):
+    player.treasure += item.value
+    player.score += item.value
+
+
+def _apply_health_potion(player, item: Item):
+    player.heal(item.value)
+
+
+def _apply_key(player, item: Item):
+    player.keys += 1
+
+
+def _apply_sword(player, item: Item):
+    player.attack += item.value * 5
+
+
+def _apply_shield(player, item: Item):
+    player.defense += item.value * 3
+
+
 class ItemManager:
     """Manages item generation and placement in the dungeon."""
     
@@ -58,6 +79,15 @@ class ItemManager:
         'weights': [4, 2, 1, 1]
     }
     
+    # Effect applied to the player when an item of each type is collected
+    _HANDLERS = {
+        ItemType.TREASURE: _apply_treasure,
+        ItemType.HEALTH_POTION: _apply_health_potion,
+        ItemType.KEY: _apply_key,
+        ItemType.SWORD: _apply_sword,
+        ItemType.SHIELD: _apply_shield,
+    }
+    
     def __init__(self):
         """Initialize the item manager."""
         self.items = []
@@ -213,17 +243,18 @@ class ItemManager:
             return False
         
         item.collected = True
-        
-        if item.type == ItemType.TREASURE:
-            player.treasure += item.value
-            player.score += item.value
-        elif item.type == ItemType.HEALTH_POTION:
-            player.heal(item.value)
-        elif item.type == ItemType.KEY:
-            player.keys += 1
-        elif item.type == ItemType.SWORD:
-            player.attack += item.value * 5
-        elif item.type == ItemType.SHIELD:
-            player.defense += item.value * 3
-        
+        self.apply_effect(item, player)
         return True
+    
+    @classmethod
+    def apply_effect(cls, item: Item, player):
+        """
+        Apply an item's effect to the player without touching its collected state.
+        
+        Args:
+            item: Item whose effect to apply
+            player: Player object
+        """
+        handler = cls._HANDLERS.get(item.type)
+        if handler:
+            handler(player, item)
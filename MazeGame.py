@@ -21,12 +21,15 @@ import pygame
 import sys
 import random
 import math
+from array import array
+from collections import deque
 from typing import Tuple, List, Optional
 
 # Import constants and entities from modular files
 from GameConstants import *
 from GameEntities import ItemType, Item, Room, Monster, Player, Camera, SwordSwing, EnemyType, Obstacle
 from PixelArtAssets import PixelArtRenderer
+from ItemManager import ItemManager
 
 # Initialize Pygame
 pygame.init()
@@ -63,11 +66,92 @@ class EnhancedMazeGame:
         shop_rooms: List of shop rooms (contain keys)
         secret_rooms: List of secret rooms (premium loot)
         super_secret_rooms: List of super secret rooms (ultra loot)
+        all_rooms: Every room of the lists above, in that order
+        room_of: Per-cell index into all_rooms (-1 outside rooms)
+        visited_room_mask: Per-cell flags, set inside every visited room
+        total_paths: Number of non-wall cells, the basis of map completion
         items: List of all collectible items
         monsters: List of all enemy creatures
         locked_doors: List of door positions requiring keys
     """
     
+    # Door cell for a connection leaving a room in each cardinal direction
+    DOOR_OFFSETS = {
+        'N': lambda room: (room.centerx, room.top - 1),
+        'S': lambda room: (room.centerx, room.bottom),
+        'E': lambda room: (room.right, room.centery),
+        'W': lambda room: (room.left - 1, room.centery)
+    }
+    
+    # Loot tables per placement site: item types, their cumulative weights (so
+    # random.choices can skip rebuilding the running totals on every call) and the
+    # value range of each type
+    LOOT_TABLES = {
+        'treasure': ((ItemType.TREASURE, ItemType.SWORD, ItemType.SHIELD, ItemType.HEALTH_POTION),
+                     (5, 8, 10, 12),
+                     {ItemType.TREASURE: range(100, 301), ItemType.HEALTH_POTION: range(40, 81),
+                      ItemType.SWORD: range(3, 7), ItemType.SHIELD: range(3, 6)}),
+        'main': ((ItemType.TREASURE, ItemType.HEALTH_POTION, ItemType.SWORD, ItemType.SHIELD),
+                 (3, 6, 7, 8),
+                 {ItemType.TREASURE: range(20, 61), ItemType.HEALTH_POTION: range(20, 41),
+                  ItemType.SWORD: range(1, 3), ItemType.SHIELD: range(1, 3)}),
+        'secret': ((ItemType.TREASURE, ItemType.SWORD, ItemType.SHIELD),
+                   (3, 5, 7),
+                   {ItemType.TREASURE: range(50, 151), ItemType.SWORD: range(2, 5),
+                    ItemType.SHIELD: range(2, 5)}),
+        'super_secret': ((ItemType.TREASURE, ItemType.SWORD, ItemType.SHIELD, ItemType.HEALTH_POTION),
+                         (4, 7, 10, 12),
+                         {ItemType.TREASURE: range(100, 301), ItemType.HEALTH_POTION: range(50, 101),
+                          ItemType.SWORD: range(4, 8), ItemType.SHIELD: range(4, 7)}),
+        'corridor': ((ItemType.TREASURE, ItemType.HEALTH_POTION),
+                     (2, 3),
+                     {ItemType.TREASURE: range(5, 21), ItemType.HEALTH_POTION: range(10, 26)}),
+    }
+    
+    # Byte translation tables for fog-of-war reveal: a maze row slice translated
+    # through one of these becomes the matching visited_mask slice. Rooms show
+    # every non-wall cell, corridors hide walls and doors as well
+    ROOM_REVEAL = bytes(0 if code == WALL else 1 for code in range(256))
+    CORRIDOR_REVEAL = bytes(0 if code in (WALL, DOOR_CLOSED, DOOR_OPEN, DOOR) else 1
+                            for code in range(256))
+    
+    # Door labels drawn by draw_maze: tile code -> (text, text color,
+    # background color, max player distance at which the label shows)
+    DOOR_LABELS = {
+        DOOR: ("LOCKED", COLORS['RED'], COLORS['BLACK'], 1),
+        DOOR_CLOSED: ("ENEMIES", COLORS['WHITE'], COLORS['RED'], 2),
+        DOOR_OPEN: ("CLEAR", COLORS['WHITE'], COLORS['GREEN'], 2),
+    }
+    
+    # Minimap door cells: tile code -> (fill color, border color)
+    MINIMAP_DOOR_COLORS = {
+        DOOR: (COLORS['DARK_BROWN'], COLORS['GOLD']),
+        DOOR_CLOSED: (COLORS['RED'], COLORS['DARK_BROWN']),
+        DOOR_OPEN: (COLORS['GREEN'], COLORS['BROWN']),
+    }
+    
+    # Side panel stat rows: label and accent color
+    STAT_PANELS = (
+        ("ATTACK", COLORS['YELLOW']),
+        ("DEFENSE", COLORS['CYAN']),
+        ("KEYS", COLORS['GOLD']),
+        ("TREASURE", COLORS['GREEN']),
+    )
+    
+    # Map completion bar (below 30%, below 70%, rest): (fill color, shine color)
+    PROGRESS_BAR_COLORS = tuple((color, tuple(min(255, c + 50) for c in color[:3]))
+                                for color in (COLORS['RED'], COLORS['YELLOW'], COLORS['LIME']))
+    
+    # Diameter in pixels of the player's round body
+    PLAYER_BODY_SIZE = 24
+    
+    # Armor shine highlights on the player, relative to the player's center
+    PLAYER_SHINE_OFFSETS = ((-4, -6), (2, -4))
+    
+    # Cells within Manhattan distance 2 of an obstacle, which no other obstacle may use
+    OBSTACLE_SPACING = tuple((dx, dy) for dy in range(-2, 3) for dx in range(-2, 3)
+                             if abs(dx) + abs(dy) < 3)
+    
     def __init__(self):
         """Initialize the game with default settings and generate initial dungeon."""
         print("🔧 Initializing pygame display...")
@@ -80,6 +164,10 @@ class EnhancedMazeGame:
         # ---- UI Layout Configuration ----
         self.ui_width = DEFAULT_UI_WIDTH           # Right panel width for stats/minimap
         self.minimap_size = DEFAULT_MINIMAP_SIZE   # Minimap dimensions in pixels
+        self._minimap_frame = self._layout_minimap_frame()  # Constant minimap chrome rects
+        # Full-window black surface, faded in and out during room transitions
+        self._transition_overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT)).convert()
+        self._transition_overlay.fill(COLORS['BLACK'])
         
         # ---- Dungeon Dimensions ----  
         self.maze_width = DEFAULT_MAZE_WIDTH       # Dungeon width in grid cells
@@ -88,14 +176,31 @@ class EnhancedMazeGame:
         # Initialize game lists before dungeon generation
         self.items = []
         self.monsters = []
+        # Per-cell indexes of live items/monsters: (x, y) -> list of entities
+        self.item_at = {}
+        self.monster_at = {}
         self.locked_doors = []
         # No bullets needed for melee combat
         self.obstacles = []  # Room obstacles/rocks
+        # One byte per cell, non-zero where a rock stands (O(1) collision checks)
+        self.obstacle_mask = [bytearray(self.maze_width) for _ in range(self.maze_height)]
         self.frame_counter = 0  # For fire rate timing
         
+        # Room lists are rebuilt by every dungeon generation
+        self.rooms = []
+        self.treasure_rooms = []
+        self.shop_rooms = []
+        self.secret_rooms = []
+        self.super_secret_rooms = []
+        self.all_rooms = []  # Every room above, in that order
+        self.room_of = []  # Per-cell index into all_rooms (-1 outside rooms)
+        self.door_rooms = {}  # (x, y) of each open/closable door -> the two rooms it joins
+        self._minimap_dirty = True  # Rebuild the cached minimap layer on next draw
+        
         # ---- Camera System Initialization ----
         self.cell_size = DEFAULT_CELL_SIZE         # Pixels per grid cell (large for detail)
         self.current_room = None  # Track which room player is in for camera
+        self._build_sprite_caches()  # Pre-rendered tiles/items/rocks for this cell size
         
         print("🏗️ Generating initial dungeon...")
         self.generate_new_maze()
@@ -127,6 +232,15 @@ class EnhancedMazeGame:
         self.font = pygame.font.Font(None, FONT_SIZE_NORMAL)     # Standard text
         self.small_font = pygame.font.Font(None, FONT_SIZE_SMALL)   # Small details  
         self.large_font = pygame.font.Font(None, FONT_SIZE_LARGE)   # Headers/titles
+        self.tiny_font = pygame.font.Font(None, FONT_SIZE_TINY)     # Legend/debug notes
+        self.mini_font = pygame.font.Font(None, FONT_SIZE_MINI)     # Key button captions
+        self._door_label_cache = self._build_door_label_cache()  # Pre-rendered door labels
+        self._text_cache = {}  # (font, text, color) -> rendered fixed UI label
+        self._ui_icons = self._build_ui_icons()  # Pre-rendered hearts and stat icons
+        self._ui_background = None  # Static side panel chrome, built by draw_ui
+        self._ui_background_rows = 0  # Heart rows the chrome was laid out for
+        self._ui_panel = pygame.Surface((self.ui_width, WINDOW_HEIGHT)).convert()  # Last drawn side panel
+        self._ui_panel_state = None  # Values the cached side panel shows
         
         # ---- Input Handling ---- 
         self.last_move_time = 0
@@ -161,6 +275,9 @@ class EnhancedMazeGame:
         """
         # Generate roguelike dungeon instead of maze
         self.maze = self.generate_roguelike_dungeon()
+        # Walls never change after generation (doors only switch between door
+        # states), so the walkable cell count for map completion is fixed
+        self.total_paths = sum(len(row) - row.count(WALL) for row in self.maze)
         
         # Find positions
         self.start_pos = self.find_start_position()
@@ -169,24 +286,34 @@ class EnhancedMazeGame:
         # Initialize player
         self.player = Player(self.start_pos[0], self.start_pos[1])
         
+        # Fog of war: one byte per cell, non-zero where the cell is currently visible
+        self.visited_mask = [bytearray(self.maze_width) for _ in range(self.maze_height)]
+        # One byte per cell, non-zero inside any room the player has entered
+        self.visited_room_mask = [bytearray(self.maze_width) for _ in range(self.maze_height)]
+        
         # Items and monsters already initialized above
         
         # Clear game lists for fresh generation
         self.items.clear()
         self.monsters.clear()
+        self.item_at.clear()
+        self.monster_at.clear()
         self.locked_doors.clear()
             
         self.generate_items_and_monsters()
         
         # Set ALL doors to OPEN initially (will close when entering rooms with monsters)
-        for y in range(len(self.maze)):
-            for x in range(len(self.maze[0])):
-                if self.maze[y][x] == 'R':
-                    self.maze[y][x] = 'O'
+        # Row membership tests run in C, so only rows holding a closed door are rebuilt
+        for row in self.maze:
+            if DOOR_CLOSED in row:
+                row[:] = row.replace(bytes((DOOR_CLOSED,)), bytes((DOOR_OPEN,)))
         
         # Auto-reveal and load the starting room
         self.reveal_room_at_position(self.player.x, self.player.y)
         
+        # Resync every visited room's doors with the freshly loaded content
+        self._update_room_doors()
+        
         # Reset game state
         self.game_won = False
         self.game_over = False
@@ -204,10 +331,12 @@ class EnhancedMazeGame:
         - Central progression: Start in center, expand outward
         
         Returns:
-            List[List[str]]: 2D grid of dungeon cells ('#'=wall, ' '=floor, 'S'=start, 'E'=end, 'D'=door)
+            List[bytearray]: One contiguous byte row per dungeon row, holding tile
+            codes (WALL, FLOOR, START, END, DOOR, ...) indexed as dungeon[y][x]
         """
-        # Initialize dungeon filled with walls
-        dungeon = [['#' for _ in range(self.maze_width)] for _ in range(self.maze_height)]
+        # Initialize dungeon filled with walls (each row is a flat bytearray, so
+        # cells are unboxed bytes and whole spans can be written with one slice store)
+        dungeon = [bytearray((WALL,)) * self.maze_width for _ in range(self.maze_height)]
         
         # Isaac-style grid layout parameters - larger rooms for better combat
         room_width = 13   # Each room is 13x11 cells (much larger for Isaac-style combat)
@@ -254,12 +383,26 @@ class EnhancedMazeGame:
         self.shop_rooms = shop_rooms
         self.secret_rooms = secret_rooms
         self.super_secret_rooms = super_secret_rooms
+        self.all_rooms = main_rooms + treasure_rooms + shop_rooms + secret_rooms + super_secret_rooms
+        self.room_of = self._build_room_index()
         self.locked_doors = []
+        self.door_rooms = {}
         
         # Create doors between rooms (Isaac style)
         self.create_isaac_doors(dungeon, room_grid, grid_width, grid_height, 
             start_x, start_y, room_width, room_height, corridor_length)
         
+        # Cache the doors that sit directly on each room's boundary; reveal shows
+        # only these when the player is inside the room
+        for room in self.all_rooms:
+            room.adjacent_doors = [
+                (door_x, door_y) for door_x, door_y in room.doors
+                if (door_x == room.left - 1 and room.top <= door_y < room.bottom) or    # Left edge
+                   (door_x == room.right and room.top <= door_y < room.bottom) or       # Right edge
+                   (door_y == room.top - 1 and room.left <= door_x < room.right) or     # Top edge
+                   (door_y == room.bottom and room.left <= door_x < room.right)         # Bottom edge
+            ]
+        
         # Room door states will be initialized after monsters are placed
         # (No need to call _update_room_doors here since there are no monsters yet)
         
@@ -297,11 +440,11 @@ class EnhancedMazeGame:
         self.starting_room = start_room
         
         # Place start marker
-        dungeon[start_room.centery][start_room.centerx] = 'S'
+        dungeon[start_room.centery][start_room.centerx] = START
         
         # Generate normal rooms using Isaac's branching algorithm
         rooms_to_generate = random.randint(10, 16)  # Normal rooms
-        available_positions = []
+        available_positions = deque()  # FIFO frontier of free grid slots
         
         # Add adjacent positions to starting room
         for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:  # N, S, E, W
@@ -317,10 +460,12 @@ class EnhancedMazeGame:
             
             # Isaac-style branching: Prefer positions further from existing rooms
             if random.random() < branch_probability and len(available_positions) > 2:
+                # Index is in the back half, so deque deletion only shifts the short tail
                 idx = random.randint(len(available_positions) // 2, len(available_positions) - 1)
-                grid_x, grid_y = available_positions.pop(idx)
+                grid_x, grid_y = available_positions[idx]
+                del available_positions[idx]
             else:
-                grid_x, grid_y = available_positions.pop(0)
+                grid_x, grid_y = available_positions.popleft()
             
             # Create room at this grid position
             room_x = start_x + grid_x * (room_width + corridor_length)
@@ -340,21 +485,18 @@ class EnhancedMazeGame:
                     available_positions.append((new_gx, new_gy))
         
         # Place boss room (end) at the furthest corner from start
+        def distance_from_center(pos):
+            return abs(pos[0] - center_x) + abs(pos[1] - center_y)
+        
         boss_positions = [
             (0, 0), (grid_width-1, 0), (0, grid_height-1), (grid_width-1, grid_height-1)
         ]
-        best_boss_pos = None
-        max_distance = 0
-        for gx, gy in boss_positions:
-            if room_grid[gy][gx] is None:
-                distance = abs(gx - center_x) + abs(gy - center_y)
-                if distance > max_distance:
-                    max_distance = distance
-                    best_boss_pos = (gx, gy)
+        free_corners = [(gx, gy) for gx, gy in boss_positions if room_grid[gy][gx] is None]
+        best_boss_pos = max(free_corners, key=distance_from_center, default=None)
         
         if not best_boss_pos and available_positions:
             # Use furthest available position
-            best_boss_pos = max(available_positions, key=lambda pos: abs(pos[0] - center_x) + abs(pos[1] - center_y))
+            best_boss_pos = max(available_positions, key=distance_from_center)
             available_positions.remove(best_boss_pos)
         
         if best_boss_pos:
@@ -368,27 +510,14 @@ class EnhancedMazeGame:
             main_rooms.append(boss_room)
             
             # Place end marker
-            dungeon[boss_room.centery][boss_room.centerx] = 'E'
+            dungeon[boss_room.centery][boss_room.centerx] = END
         
         # Create EXACTLY 1 treasure room at a dead end
-        dead_ends = []
-        for gy in range(grid_height):
-            for gx in range(grid_width):
-                if room_grid[gy][gx] is not None:
-                    # Count adjacent rooms
-                    adjacent_count = 0
-                    for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
-                        adj_x, adj_y = gx + dx, gy + dy
-                        if (0 <= adj_x < grid_width and 0 <= adj_y < grid_height and 
-                            room_grid[adj_y][adj_x] is not None):
-                            adjacent_count += 1
-                    
-                    if adjacent_count == 1:  # Dead end
-                        dead_ends.append((gx, gy))
+        dead_ends = self._find_dead_ends(room_grid)
         
         # Place 1 treasure room
         if dead_ends:
-            grid_x, grid_y = dead_ends.pop(random.randint(0, len(dead_ends)-1))
+            grid_x, grid_y = random.choice(dead_ends)
             # Find adjacent empty position for treasure room
             for dx, dy in [(0, 1), (0, -1), (1, 0), (-1, 0)]:
                 new_gx, new_gy = grid_x + dx, grid_y + dy
@@ -406,7 +535,7 @@ class EnhancedMazeGame:
         
         # Create EXACTLY 1 shop room
         if available_positions:
-            grid_x, grid_y = available_positions.pop(0)
+            grid_x, grid_y = available_positions.popleft()
             room_x = start_x + grid_x * (room_width + corridor_length)
             room_y = start_y + grid_y * (room_height + corridor_length)
             
@@ -417,7 +546,7 @@ class EnhancedMazeGame:
         
         # Create EXACTLY 1 secret room
         if available_positions:
-            grid_x, grid_y = available_positions.pop(0)
+            grid_x, grid_y = available_positions.popleft()
             room_x = start_x + grid_x * (room_width + corridor_length)
             room_y = start_y + grid_y * (room_height + corridor_length)
             
@@ -428,7 +557,7 @@ class EnhancedMazeGame:
         
         # Create EXACTLY 1 super secret room
         if available_positions:
-            grid_x, grid_y = available_positions.pop(0)
+            grid_x, grid_y = available_positions.popleft()
             room_x = start_x + grid_x * (room_width + corridor_length)
             room_y = start_y + grid_y * (room_height + corridor_length)
             
@@ -437,15 +566,67 @@ class EnhancedMazeGame:
             room_grid[grid_y][grid_x] = super_secret_room
             super_secret_rooms.append(super_secret_room)
 
+    def _find_dead_ends(self, room_grid):
+        """
+        Find grid cells holding a room with exactly one neighbouring room.
+        
+        The occupancy grid is padded with an empty border, and each row's
+        4-neighbour counts are summed from shifted copies of the rows above,
+        below and beside it, so no per-cell bounds checks or index math is needed.
+        
+        Args:
+            room_grid: 2D grid of Room objects (None for empty slots)
+            
+        Returns:
+            List of (grid_x, grid_y) dead-end positions in row-major order
+        """
+        empty_row = [False] * (len(room_grid[0]) + 2)
+        occupied = [empty_row]
+        occupied.extend([False] + [room is not None for room in row] + [False] for row in room_grid)
+        occupied.append(empty_row)
+        
+        dead_ends = []
+        for gy in range(len(room_grid)):
+            above, here, below = occupied[gy], occupied[gy + 1], occupied[gy + 2]
+            neighbour_counts = map(sum, zip(above[1:-1], below[1:-1], here[:-2], here[2:]))
+            dead_ends.extend((gx, gy) for gx, (is_room, count) in enumerate(zip(here[1:-1], neighbour_counts))
+                             if is_room and count == 1)
+        return dead_ends
+    
+    def _build_room_index(self):
+        """
+        Build a per-cell map of which room owns each dungeon cell.
+        
+        Each row is an int16 array holding the owning room's index in
+        self.all_rooms, or -1 for cells outside every room, so "which room is
+        (x, y) in?" becomes a single lookup: self.room_of[y][x].
+        
+        Returns:
+            List of array('h') rows, one per dungeon row
+        """
+        room_of = [array('h', [-1]) * self.maze_width for _ in range(self.maze_height)]
+        # Written back to front so that, where rooms overlap, the earliest room in
+        # all_rooms owns the cell (same priority as scanning the room lists in order)
+        for index in range(len(self.all_rooms) - 1, -1, -1):
+            room = self.all_rooms[index]
+            left, right = max(0, room.left), min(self.maze_width, room.right)
+            if left >= right:
+                continue
+            room_span = array('h', [index]) * (right - left)
+            for row in room_of[max(0, room.top):min(self.maze_height, room.bottom)]:
+                row[left:right] = room_span
+        return room_of
+    
     def create_isaac_room(self, dungeon, x, y, width, height):
         """Create a simple rectangular room (Isaac style) with bounds checking."""
-        for dy in range(height):
-            for dx in range(width):
-                room_x = x + dx
-                room_y = y + dy
-                # Bounds checking to prevent index errors
-                if (0 <= room_x < len(dungeon[0]) and 0 <= room_y < len(dungeon)):
-                    dungeon[room_y][room_x] = ' '
+        # Clip the rectangle to the dungeon once, then carve each row with a slice store
+        dungeon_height, dungeon_width = len(dungeon), len(dungeon[0])
+        left, right = max(0, x), min(dungeon_width, x + width)
+        if left >= right:
+            return
+        floor_span = bytes((FLOOR,)) * (right - left)
+        for room_row in dungeon[max(0, y):min(dungeon_height, y + height)]:
+            room_row[left:right] = floor_span
 
     def create_isaac_doors(self, dungeon, room_grid, grid_width, grid_height, 
         start_x, start_y, room_width, room_height, corridor_length):
@@ -485,29 +666,24 @@ class EnhancedMazeGame:
         start_x, start_y, room_width, room_height, corridor_length):
         """Create a door connection between two adjacent rooms (no corridor - direct teleport)."""
         
-        # Calculate door position based on direction
-        door_positions = {
-            'N': (room1.centerx, room1.top - 1),
-            'S': (room1.centerx, room1.bottom),
-            'E': (room1.right, room1.centery),
-            'W': (room1.left - 1, room1.centery)
-        }
+        # Calculate door position based on direction (only the needed formula runs)
+        door_x, door_y = self.DOOR_OFFSETS[direction](room1)
         
-        door_x, door_y = door_positions.get(direction, (0, 0))
+        # Create door with bounds checking (the dungeon always spans the configured maze size)
+        if not (0 <= door_y < self.maze_height and 0 <= door_x < self.maze_width):
+            return
         
-        # Create door with bounds checking
-        if 0 <= door_y < len(dungeon) and 0 <= door_x < len(dungeon[0]):
-            # Determine if door should be locked (treasure room requirement)
-            is_treasure_door = room1.room_type == 'treasure' or room2.room_type == 'treasure'
-            
-            if is_treasure_door:
-                dungeon[door_y][door_x] = 'D'  # Locked door
-                self.locked_doors.append((door_x, door_y))
-            else:
-                dungeon[door_y][door_x] = 'O'  # Open door
-                # Add door to BOTH rooms so both can control it
-                room1.doors.append((door_x, door_y))
-                room2.doors.append((door_x, door_y))
+        # Determine if door should be locked (treasure room requirement)
+        door = (door_x, door_y)
+        if room1.room_type == 'treasure' or room2.room_type == 'treasure':
+            dungeon[door_y][door_x] = DOOR  # Locked door
+            self.locked_doors.append(door)
+        else:
+            dungeon[door_y][door_x] = DOOR_OPEN  # Open door
+            # Add door to BOTH rooms so both can control it
+            room1.doors.append(door)
+            room2.doors.append(door)
+            self.door_rooms[door] = (room1, room2)
 
 
 
@@ -517,18 +693,16 @@ class EnhancedMazeGame:
     def find_start_position(self) -> Tuple[int, int]:
         """Find start position"""
         for y, row in enumerate(self.maze):
-            for x, cell in enumerate(row):
-                if cell == 'S':
-                    return (x, y)
+            if START in row:
+                return (row.index(START), y)
         return (1, 1)
     
     def find_end_position(self) -> Tuple[int, int]:
         """Find end position"""
         for y, row in enumerate(self.maze):
-            for x, cell in enumerate(row):
-                if cell == 'E':
-                    return (x, y)
-        return (len(self.maze[0]) - 2, len(self.maze) - 2)
+            if END in row:
+                return (row.index(END), y)
+        return (self.maze_width - 2, self.maze_height - 2)
     
     def generate_items_and_monsters(self):
         """
@@ -539,89 +713,58 @@ class EnhancedMazeGame:
         the room for the first time. This improves performance and allows for proper
         room-based door management.
         """
+        # Hoisted out of the per-cell loops below: a local maze alias and the
+        # unpacked start/end coordinates avoid attribute loads and tuple building
+        maze = self.maze
+        start_x, start_y = self.start_pos
+        end_x, end_y = self.end_pos
+        
         # Get all floor positions organized by room type
         treasure_room_positions = []
         main_room_positions = []  # Store (x, y, room) tuples
+        shop_room_positions = []
+        secret_room_positions = []
+        super_secret_room_positions = []
         key_room_positions = []
         corridor_positions = []
         
-        # Collect positions for treasure rooms
-        for room in self.treasure_rooms:
-            for y in range(room.top + 1, room.bottom - 1):
-                for x in range(room.left + 1, room.right - 1):
-                    if (self.maze[y][x] == ' ' and 
-                        (x, y) != self.start_pos and 
-                        (x, y) != self.end_pos):
-                        treasure_room_positions.append((x, y))
+        # Start, normal and boss rooms all fall through to the main room list
+        positions_by_type = {
+            'treasure': treasure_room_positions,
+            'shop': shop_room_positions,
+            'secret': secret_room_positions,
+            'super_secret': super_secret_room_positions
+        }
         
-        # Collect positions for main rooms
-        for room in self.rooms:
+        # Collect the interior floor of every room in a single pass
+        for room in self.all_rooms:
             room_positions = []
             for y in range(room.top + 1, room.bottom - 1):
+                row = maze[y]
                 for x in range(room.left + 1, room.right - 1):
-                    if (self.maze[y][x] == ' ' and 
-                        (x, y) != self.start_pos and 
-                        (x, y) != self.end_pos):
-                        main_room_positions.append((x, y, room))
+                    if (row[x] == FLOOR and 
+                        (x != start_x or y != start_y) and 
+                        (x != end_x or y != end_y)):
                         room_positions.append((x, y))
+            
+            if room.room_type in positions_by_type:
+                positions_by_type[room.room_type].extend(room_positions)
+            else:
+                main_room_positions.extend((x, y, room) for x, y in room_positions)
         
-        # Collect positions for shop rooms
-        shop_room_positions = []
-        if hasattr(self, 'shop_rooms'):
-            for room in self.shop_rooms:
-                for y in range(room.top + 1, room.bottom - 1):
-                    for x in range(room.left + 1, room.right - 1):
-                        if (self.maze[y][x] == ' ' and 
-                            (x, y) != self.start_pos and 
-                            (x, y) != self.end_pos):
-                            shop_room_positions.append((x, y))
-        
-        # Collect positions for secret rooms
-        secret_room_positions = []
-        if hasattr(self, 'secret_rooms'):
-            for room in self.secret_rooms:
-                for y in range(room.top + 1, room.bottom - 1):
-                    for x in range(room.left + 1, room.right - 1):
-                        if (self.maze[y][x] == ' ' and 
-                            (x, y) != self.start_pos and 
-                            (x, y) != self.end_pos):
-                            secret_room_positions.append((x, y))
-        
-        # Collect positions for super secret rooms
-        super_secret_room_positions = []
-        if hasattr(self, 'super_secret_rooms'):
-            for room in self.super_secret_rooms:
-                for y in range(room.top + 1, room.bottom - 1):
-                    for x in range(room.left + 1, room.right - 1):
-                        if (self.maze[y][x] == ' ' and 
-                            (x, y) != self.start_pos and 
-                            (x, y) != self.end_pos):
-                            super_secret_room_positions.append((x, y))
-        
-        # Collect corridor positions
-        for y in range(len(self.maze)):
-            for x in range(len(self.maze[0])):
-                if (self.maze[y][x] == ' ' and 
-                    (x, y) != self.start_pos and 
-                    (x, y) != self.end_pos):
-                    # Check if it's not in any room
-                    in_room = False
-                    all_special_rooms = self.rooms + self.treasure_rooms
-                    if hasattr(self, 'shop_rooms'):
-                        all_special_rooms += self.shop_rooms
-                    if hasattr(self, 'secret_rooms'):
-                        all_special_rooms += self.secret_rooms
-                    if hasattr(self, 'super_secret_rooms'):
-                        all_special_rooms += self.super_secret_rooms
-                    
-                    for room in all_special_rooms:
-                        if room.collidepoint(x, y):
-                            in_room = True
-                            break
-                    if not in_room:
-                        corridor_positions.append((x, y))
-        
-        # Track used positions to avoid overlaps
+        # Collect corridor positions (floor cells the room index map leaves unowned)
+        for y, row in enumerate(maze):
+            room_row = self.room_of[y]
+            for x, cell in enumerate(row):
+                if (cell == FLOOR and room_row[x] < 0 and 
+                    (x != start_x or y != start_y) and 
+                    (x != end_x or y != end_y)):
+                    corridor_positions.append((x, y))
+        
+        # Track used positions to avoid overlaps, packed as y * width + x so the
+        # set hashes plain ints instead of (x, y) tuples. Positions within a phase
+        # never collide, so each phase merges its placements in one update
+        width = self.maze_width
         used_positions = set()
         
         # === STORE ITEM DATA IN ROOMS ===
@@ -629,217 +772,160 @@ class EnhancedMazeGame:
         # Store items in treasure rooms
         random.shuffle(treasure_room_positions)
         treasure_item_count = len(treasure_room_positions) // TREASURE_ITEM_DENSITY
-        for i in range(min(treasure_item_count, len(treasure_room_positions))):
-            x, y = treasure_room_positions[i]
-            
-            # Find which treasure room this position belongs to
-            for room in self.treasure_rooms:
-                if room.collidepoint(x, y):
-                    item_types = [ItemType.TREASURE, ItemType.SWORD, ItemType.SHIELD, ItemType.HEALTH_POTION]
-                    weights = [5, 3, 2, 2]
-                    item_type = random.choices(item_types, weights=weights)[0]
-                    
-                    value = 1
-                    if item_type == ItemType.TREASURE:
-                        value = random.randint(100, 300)
-                    elif item_type == ItemType.HEALTH_POTION:
-                        value = random.randint(40, 80)
-                    elif item_type == ItemType.SWORD:
-                        value = random.randint(3, 6)
-                    elif item_type == ItemType.SHIELD:
-                        value = random.randint(3, 5)
-                    
-                    room.item_data.append((x, y, item_type, value))
-                    used_positions.add((x, y))
-                    break
+        # Item types are drawn in one batched random.choices call per room type,
+        # from the precomputed cumulative weights in LOOT_TABLES
+        item_types, cum_weights, value_ranges = self.LOOT_TABLES['treasure']
+        drawn_types = random.choices(item_types, cum_weights=cum_weights, 
+                                     k=min(treasure_item_count, len(treasure_room_positions)))
+        values = [random.choice(value_ranges[item_type]) for item_type in drawn_types]
+        for (x, y), item_type, value in zip(treasure_room_positions, drawn_types, values):
+            # Look up which treasure room this position belongs to
+            room = self.all_rooms[self.room_of[y][x]]
+            
+            room.item_data.append((x, y, item_type, value))
+        used_positions.update(y * width + x for x, y in treasure_room_positions[:len(drawn_types)])
         
         # Store items in main rooms
-        available_main_positions = [(x, y, room) for x, y, room in main_room_positions if (x, y) not in used_positions]
+        available_main_positions = [(x, y, room) for x, y, room in main_room_positions if y * width + x not in used_positions]
         random.shuffle(available_main_positions)
         main_item_count = len(available_main_positions) // MAIN_ITEM_DENSITY
         
-        for i in range(min(main_item_count, len(available_main_positions))):
-            x, y, room = available_main_positions[i]
-            
-            item_types = [ItemType.TREASURE, ItemType.HEALTH_POTION, ItemType.SWORD, ItemType.SHIELD]
-            weights = [3, 3, 1, 1]
-            item_type = random.choices(item_types, weights=weights)[0]
-            
-            value = 1
-            if item_type == ItemType.TREASURE:
-                value = random.randint(20, 60)
-            elif item_type == ItemType.HEALTH_POTION:
-                value = random.randint(20, 40)
-            elif item_type == ItemType.SWORD:
-                value = random.randint(1, 2)
-            elif item_type == ItemType.SHIELD:
-                value = random.randint(1, 2)
-            
+        item_types, cum_weights, value_ranges = self.LOOT_TABLES['main']
+        drawn_types = random.choices(item_types, cum_weights=cum_weights, 
+                                     k=min(main_item_count, len(available_main_positions)))
+        values = [random.choice(value_ranges[item_type]) for item_type in drawn_types]
+        for (x, y, room), item_type, value in zip(available_main_positions, drawn_types, values):
             room.item_data.append((x, y, item_type, value))
-            used_positions.add((x, y))
+        used_positions.update(y * width + x for x, y, _ in available_main_positions[:len(drawn_types)])
         
         # Store items in shop rooms (keys)
-        if hasattr(self, 'shop_rooms') and len(shop_room_positions) > 0:
-            for room in self.shop_rooms:
-                # Place a key in shop room
-                if shop_room_positions:
-                    x, y = random.choice([pos for pos in shop_room_positions if pos not in used_positions])
-                    room.item_data.append((x, y, ItemType.KEY, 1))
-                    used_positions.add((x, y))
+        # Each block filters its free positions once, then consumes them, instead of
+        # re-filtering the whole position list for every room
+        available_shop_positions = [(x, y) for x, y in shop_room_positions if y * width + x not in used_positions]
+        shop_used = []
+        for room in self.shop_rooms:
+            # Place a key in shop room
+            if available_shop_positions:
+                x, y = available_shop_positions.pop(random.randrange(len(available_shop_positions)))
+                room.item_data.append((x, y, ItemType.KEY, 1))
+                shop_used.append(y * width + x)
+        used_positions.update(shop_used)
         
         # Store items in secret rooms (premium loot)
-        if hasattr(self, 'secret_rooms') and len(secret_room_positions) > 0:
-            for room in self.secret_rooms:
-                # Place high-value items in secret rooms
-                available_secret_positions = [pos for pos in secret_room_positions if pos not in used_positions]
-                for i in range(min(2, len(available_secret_positions))):
-                    x, y = available_secret_positions[i]
-                    item_types = [ItemType.TREASURE, ItemType.SWORD, ItemType.SHIELD]
-                    weights = [3, 2, 2]
-                    item_type = random.choices(item_types, weights=weights)[0]
-                    
-                    value = 1
-                    if item_type == ItemType.TREASURE:
-                        value = random.randint(50, 150)
-                    elif item_type == ItemType.SWORD:
-                        value = random.randint(2, 4)
-                    elif item_type == ItemType.SHIELD:
-                        value = random.randint(2, 4)
-                    
-                    room.item_data.append((x, y, item_type, value))
-                    used_positions.add((x, y))
+        available_secret_positions = [(x, y) for x, y in secret_room_positions if y * width + x not in used_positions]
+        item_types, cum_weights, value_ranges = self.LOOT_TABLES['secret']
+        secret_used = 0  # Rooms consume the free positions front to back
+        for room in self.secret_rooms:
+            # Place high-value items in secret rooms
+            drawn_types = random.choices(item_types, cum_weights=cum_weights, 
+                                         k=min(2, len(available_secret_positions) - secret_used))
+            room_positions = available_secret_positions[secret_used:secret_used + len(drawn_types)]
+            secret_used += len(drawn_types)
+            values = [random.choice(value_ranges[item_type]) for item_type in drawn_types]
+            for (x, y), item_type, value in zip(room_positions, drawn_types, values):
+                room.item_data.append((x, y, item_type, value))
+        used_positions.update(y * width + x for x, y in available_secret_positions[:secret_used])
         
         # Store items in super secret rooms (ultra premium loot)
-        if hasattr(self, 'super_secret_rooms') and len(super_secret_room_positions) > 0:
-            for room in self.super_secret_rooms:
-                # Place ultra high-value items
-                available_super_positions = [pos for pos in super_secret_room_positions if pos not in used_positions]
-                for i in range(min(3, len(available_super_positions))):
-                    x, y = available_super_positions[i]
-                    item_types = [ItemType.TREASURE, ItemType.SWORD, ItemType.SHIELD, ItemType.HEALTH_POTION]
-                    weights = [4, 3, 3, 2]
-                    item_type = random.choices(item_types, weights=weights)[0]
-                    
-                    value = 1
-                    if item_type == ItemType.TREASURE:
-                        value = random.randint(100, 300)
-                    elif item_type == ItemType.HEALTH_POTION:
-                        value = random.randint(50, 100)
-                    elif item_type == ItemType.SWORD:
-                        value = random.randint(4, 7)
-                    elif item_type == ItemType.SHIELD:
-                        value = random.randint(4, 6)
-                    
-                    room.item_data.append((x, y, item_type, value))
-                    used_positions.add((x, y))
+        available_super_positions = [(x, y) for x, y in super_secret_room_positions if y * width + x not in used_positions]
+        item_types, cum_weights, value_ranges = self.LOOT_TABLES['super_secret']
+        super_used = 0
+        for room in self.super_secret_rooms:
+            # Place ultra high-value items
+            drawn_types = random.choices(item_types, cum_weights=cum_weights, 
+                                         k=min(3, len(available_super_positions) - super_used))
+            room_positions = available_super_positions[super_used:super_used + len(drawn_types)]
+            super_used += len(drawn_types)
+            values = [random.choice(value_ranges[item_type]) for item_type in drawn_types]
+            for (x, y), item_type, value in zip(room_positions, drawn_types, values):
+                room.item_data.append((x, y, item_type, value))
+        used_positions.update(y * width + x for x, y in available_super_positions[:super_used])
         
         # Corridor items spawn immediately (not room-based)
         random.shuffle(corridor_positions)
         corridor_item_count = len(corridor_positions) // CORRIDOR_ITEM_DENSITY
-        for i in range(min(corridor_item_count, len(corridor_positions))):
-            x, y = corridor_positions[i]
-            
-            item_types = [ItemType.TREASURE, ItemType.HEALTH_POTION]
-            weights = [2, 1]
-            item_type = random.choices(item_types, weights=weights)[0]
-            
-            value = 1
-            if item_type == ItemType.TREASURE:
-                value = random.randint(5, 20)
-            elif item_type == ItemType.HEALTH_POTION:
-                value = random.randint(10, 25)
-            
-            self.items.append(Item(x, y, item_type, value))
-            used_positions.add((x, y))
+        item_types, cum_weights, value_ranges = self.LOOT_TABLES['corridor']
+        drawn_types = random.choices(item_types, cum_weights=cum_weights, 
+                                     k=min(corridor_item_count, len(corridor_positions)))
+        values = [random.choice(value_ranges[item_type]) for item_type in drawn_types]
+        for (x, y), item_type, value in zip(corridor_positions, drawn_types, values):
+            self._add_item(Item(x, y, item_type, value))
+        used_positions.update(y * width + x for x, y in corridor_positions[:len(drawn_types)])
         
         # === STORE MONSTER DATA IN ROOMS ===
         
         # Store monsters in treasure rooms (guardians)
-        available_treasure_positions = [pos for pos in treasure_room_positions if pos not in used_positions]
+        available_treasure_positions = [(x, y) for x, y in treasure_room_positions if y * width + x not in used_positions]
         random.shuffle(available_treasure_positions)
         
-        for i in range(min(len(available_treasure_positions)//TREASURE_MONSTER_DENSITY, len(self.treasure_rooms))):
-            x, y = available_treasure_positions[i]
-            
-            # Find which treasure room this position belongs to
-            for room in self.treasure_rooms:
-                if room.collidepoint(x, y):
-                    hp = random.randint(4, 6)
-                    room.monster_data.append((x, y, hp))
-                    used_positions.add((x, y))
-                    break
+        treasure_monster_count = min(len(available_treasure_positions)//TREASURE_MONSTER_DENSITY, len(self.treasure_rooms))
+        for x, y in available_treasure_positions[:treasure_monster_count]:
+            # Look up which treasure room this position belongs to
+            room = self.all_rooms[self.room_of[y][x]]
+            hp = random.randint(4, 6)
+            room.monster_data.append((x, y, hp))
+        used_positions.update(y * width + x for x, y in available_treasure_positions[:treasure_monster_count])
         
         # Generate obstacles for all rooms (2-5 per room)
-        all_game_rooms = []
-        if hasattr(self, 'rooms'):
-            all_game_rooms.extend(self.rooms)
-        if hasattr(self, 'treasure_rooms'):
-            all_game_rooms.extend(self.treasure_rooms)
-        if hasattr(self, 'shop_rooms'):
-            all_game_rooms.extend(self.shop_rooms)
-        if hasattr(self, 'secret_rooms'):
-            all_game_rooms.extend(self.secret_rooms)
-        if hasattr(self, 'super_secret_rooms'):
-            all_game_rooms.extend(self.super_secret_rooms)
-        
-        for room in all_game_rooms:
+        obstacle_spacing = self.OBSTACLE_SPACING
+        for room in self.all_rooms:
             # Skip starting room
-            if hasattr(room, 'is_starting_room') and room.is_starting_room:
+            if room.is_starting_room:
                 continue
             
             # 2-5 obstacles per room
             num_obstacles = random.randint(2, 5)
             obstacles_placed = 0
-            attempts = 0
             max_attempts = 50
+            # Cells too close to an obstacle already placed in this room
+            room_left, room_top = room.left, room.top
+            blocked = [bytearray(room.width) for _ in range(room.height)]
             
-            while obstacles_placed < num_obstacles and attempts < max_attempts:
-                attempts += 1
-                
-                # Random position inside room (not on edges)
-                ox = random.randint(room.left + 2, room.right - 3)
-                oy = random.randint(room.top + 2, room.bottom - 3)
+            # Draw every candidate position inside the room (not on edges) up front
+            candidates = zip(random.choices(range(room.left + 2, room.right - 2), k=max_attempts),
+                             random.choices(range(room.top + 2, room.bottom - 2), k=max_attempts))
+            
+            for ox, oy in candidates:
+                if obstacles_placed >= num_obstacles:
+                    break
                 
                 # Check if position is valid (not occupied)
-                if (ox, oy) in used_positions:
+                if oy * width + ox in used_positions:
                     continue
-                if self.maze[oy][ox] != ' ':  # Only place on floor
+                if maze[oy][ox] != FLOOR:  # Only place on floor
                     continue
                 
                 # Check not too close to other obstacles
-                too_close = False
-                for obs_x, obs_y, _ in room.obstacle_data:
-                    if abs(ox - obs_x) + abs(oy - obs_y) < 3:  # Manhattan distance
-                        too_close = True
-                        break
-                
-                if too_close:
+                local_x, local_y = ox - room_left, oy - room_top
+                if blocked[local_y][local_x]:
                     continue
                 
                 # Random size
                 size = random.choice(["small", "medium", "medium", "large"])  # More mediums
                 room.obstacle_data.append((ox, oy, size))
-                used_positions.add((ox, oy))
+                # Added at once: overlapping rooms may draw the same cell
+                used_positions.add(oy * width + ox)
                 obstacles_placed += 1
+                
+                # Candidates sit 2 cells inside the room, so the stamp never leaves it
+                for dx, dy in obstacle_spacing:
+                    blocked[local_y + dy][local_x + dx] = 1
         
         # Store monsters in main rooms (SKIP starting room!)
-        available_main_positions = [(x, y, room) for x, y, room in main_room_positions if (x, y) not in used_positions]
+        # CRITICAL: Never spawn monsters in the starting room - its cells are
+        # never candidates, so no spawn slot is wasted on them
+        available_main_positions = [(x, y, room) for x, y, room in main_room_positions 
+                                    if room is not self.starting_room and y * width + x not in used_positions]
         random.shuffle(available_main_positions)
         main_monster_count = len(available_main_positions) // MAIN_MONSTER_DENSITY
         
-        for i in range(min(main_monster_count, len(available_main_positions))):
-            x, y, room = available_main_positions[i]
-            
-            # CRITICAL: Never spawn monsters in the starting room
-            if hasattr(room, 'is_starting_room') and room.is_starting_room:
-                continue
-            
+        for x, y, room in available_main_positions[:main_monster_count]:
             hp = random.randint(2, 4)
             room.monster_data.append((x, y, hp))
-            used_positions.add((x, y))
+        used_positions.update(y * width + x for x, y, _ in available_main_positions[:main_monster_count])
         
         # Corridor monsters spawn immediately (not room-based)
-        available_corridor_positions = [pos for pos in corridor_positions if pos not in used_positions]
+        available_corridor_positions = [(x, y) for x, y in corridor_positions if y * width + x not in used_positions]
         random.shuffle(available_corridor_positions)
         # corridor_monster_count = len(available_corridor_positions) // CORRIDOR_MONSTER_DENSITY
         
@@ -854,7 +940,7 @@ class EnhancedMazeGame:
         keys_placed = 0
         for i in range(min(num_keys_needed, len(key_room_positions))):
             x, y = key_room_positions[i]
-            self.items.append(Item(x, y, ItemType.KEY, 1))
+            self._add_item(Item(x, y, ItemType.KEY, 1))
             keys_placed += 1
         
         # All doors start OPEN by default (will close when entering rooms with enemies)
@@ -877,37 +963,11 @@ class EnhancedMazeGame:
         This creates engaging risk/reward balance where treasure areas
         are dangerous but rewarding, while main progression is manageable.
         """
-        # Categorize floor positions by room type
-        main_room_positions = []
-        treasure_room_positions = []
-        corridor_positions = []
-        
-        for y, row in enumerate(self.maze):
-            for x, cell in enumerate(row):
-                if cell in [' ', 'S', 'E'] and (x, y) not in [self.start_pos, self.end_pos]:
-                    # Check if position is in a main room
-                    in_main_room = False
-                    if hasattr(self, 'rooms'):
-                        for room in self.rooms:
-                            if room.collidepoint(x, y):
-                                main_room_positions.append((x, y, room.room_index))
-                                in_main_room = True
-                                break
-                    
-                    # Check if position is in a treasure room
-                    in_treasure_room = False
-                    if hasattr(self, 'treasure_rooms'):
-                        for room in self.treasure_rooms:
-                            if room.collidepoint(x, y):
-                                treasure_room_positions.append((x, y))
-                                in_treasure_room = True
-                                break
-                    
-                    # If not in any room, it's a corridor
-                    if not in_main_room and not in_treasure_room:
-                        corridor_positions.append((x, y))
-        
-        # All doors start OPEN by default (will close when entering rooms with enemies)
+    
+    def _add_item(self, item: Item):
+        """Add a live item to the item list and the per-cell item index."""
+        self.items.append(item)
+        self.item_at.setdefault((item.x, item.y), []).append(item)
     
     def load_room_content(self, room):
         """
@@ -920,48 +980,44 @@ class EnhancedMazeGame:
             return  # Already loaded
         
         room.visited = True
+        left, right = max(0, room.left), min(self.maze_width, room.right)
+        if left < right:
+            room_span = b'\x01' * (right - left)
+            for row in self.visited_room_mask[max(0, room.top):min(self.maze_height, room.bottom)]:
+                row[left:right] = room_span
         
         # Spawn monsters from stored data (ignore old HP data, use new types)
-        # Skip monsters that are too close to the player
+        # Skip monsters that are too close to the player (squared distances, no sqrt)
+        min_distance_sq = MIN_ENEMY_SPAWN_DISTANCE * MIN_ENEMY_SPAWN_DISTANCE
         for x, y, _ in room.monster_data:
             # Calculate distance from player
-            import math
             dx = x - self.player.x
             dy = y - self.player.y
-            distance = math.sqrt(dx * dx + dy * dy)
             
             # Skip this monster if it's too close to the player
-            if distance < MIN_ENEMY_SPAWN_DISTANCE:
+            if dx * dx + dy * dy < min_distance_sq:
                 continue
             
             # Create skeleton with random difficulty
-            import random
             difficulty = random.randint(1, 3)  # 1=easy, 2=medium, 3=hard
             monster = Monster(x, y, difficulty)
             monster.spawn_room = room  # Lock monster to this room
             self.monsters.append(monster)
+            self.monster_at.setdefault((x, y), []).append(monster)
             room.monsters_in_room.append(monster)
         
         # Spawn obstacles from stored data
         for x, y, size in room.obstacle_data:
             obstacle = Obstacle(x, y, size)
             self.obstacles.append(obstacle)
+            self.obstacle_mask[y][x] = 1
         
         # Spawn items from stored data
         for x, y, item_type, value in room.item_data:
-            item = Item(x, y, item_type, value)
-            self.items.append(item)
-        
-        # Close doors if room has monsters
-        if len(room.monster_data) > 0:
-            room.doors_closed = True
-            for door_x, door_y in room.doors:
-                if 0 <= door_y < len(self.maze) and 0 <= door_x < len(self.maze[0]):
-                    self.maze[door_y][door_x] = 'R'  # Close door
-        else:
-            # Room is empty, mark as cleared
-            room.cleared = True
-            room.doors_closed = False
+            self._add_item(Item(x, y, item_type, value))
+        
+        # Close doors if monsters spawned, otherwise mark the room as cleared
+        self._update_room_doors_for(room)
     
     # ---- GAME LOOP & INPUT METHODS ----
     
@@ -1139,24 +1195,12 @@ class EnhancedMazeGame:
         Returns:
             Room object if position is in a room, None otherwise
         """
-        # Check all room types in priority order
-        room_lists = [
-            ('rooms', self.rooms) if hasattr(self, 'rooms') else None,
-            ('treasure_rooms', self.treasure_rooms) if hasattr(self, 'treasure_rooms') else None,
-            ('shop_rooms', self.shop_rooms) if hasattr(self, 'shop_rooms') else None,
-            ('secret_rooms', self.secret_rooms) if hasattr(self, 'secret_rooms') else None,
-            ('super_secret_rooms', self.super_secret_rooms) if hasattr(self, 'super_secret_rooms') else None,
-        ]
-        
-        for room_list in room_lists:
-            if room_list is None:
-                continue
-            _, rooms = room_list
-            for room in rooms:
-                if room.collidepoint(x, y):
-                    return room
-        
-        return None
+        # The room index map already resolves overlaps in priority order
+        # (main, treasure, shop, secret, super secret)
+        if not (0 <= y < self.maze_height and 0 <= x < self.maze_width):
+            return None
+        room_index = self.room_of[y][x]
+        return self.all_rooms[room_index] if room_index >= 0 else None
     
     def process_player_action(self):
         """
@@ -1175,15 +1219,20 @@ class EnhancedMazeGame:
         # Reveal the entire room when entering it
         self.reveal_room_at_position(self.player.x, self.player.y)
         
-        # Check for items
-        for item in self.items:
-            if not item.collected and (item.x, item.y) == player_pos:
-                self.collect_item(item)
+        # Check for items (collected items leave the live list, like sprite.Group.kill):
+        # collect_item marks them, then the list is swept once instead of list.remove
+        collected = self.item_at.pop(player_pos, ())
+        for item in collected:
+            self.collect_item(item)
+        if collected:
+            self.items[:] = [item for item in self.items if not item.collected]
         
         # Check for monsters
-        for monster in self.monsters:
-            if monster.alive and (monster.x, monster.y) == player_pos:
-                self.combat(monster)
+        fought = [monster for monster in self.monster_at.get(player_pos, ()) if monster.alive]
+        for monster in fought:
+            self.combat(monster)
+        if any(not monster.alive for monster in fought):
+            self._remove_dead_monsters()
         
         # Check win condition
         if player_pos == self.end_pos:
@@ -1216,7 +1265,7 @@ class EnhancedMazeGame:
                 self.current_room = current_room
             
             # Clear all previously visited cells - only show current room
-            self.player.visited_cells.clear()
+            self._clear_visited_mask()
             
             # Load room content if this is the first visit
             if not current_room.visited:
@@ -1227,73 +1276,49 @@ class EnhancedMazeGame:
             prev_x, prev_y = self.player.prev_x, self.player.prev_y
             if not current_room.collidepoint(prev_x, prev_y):
                 # Player entered from outside the room
-                # Find which door they came through (closest door to previous position)
-                min_dist = float('inf')
-                entry_door = None
-                for door_x, door_y in current_room.doors:
-                    dist = abs(door_x - prev_x) + abs(door_y - prev_y)
-                    if dist < min_dist:
-                        min_dist = dist
-                        entry_door = (door_x, door_y)
-                if entry_door and min_dist <= 1:  # Must be adjacent
-                    current_room.entry_door = entry_door
-            
-            # Reveal room interior
-            for room_y in range(current_room.top, current_room.bottom):
-                for room_x in range(current_room.left, current_room.right):
-                    if (0 <= room_x < len(self.maze[0]) and 
-                        0 <= room_y < len(self.maze) and
-                        self.maze[room_y][room_x] != '#'):  # Only reveal floor tiles
-                        self.player.visited_cells.add((room_x, room_y))
+                # Find which door they came through: one of this room's doors on or
+                # next to the previous position, looked up in the door table
+                for door in ((prev_x, prev_y), (prev_x - 1, prev_y), (prev_x + 1, prev_y),
+                             (prev_x, prev_y - 1), (prev_x, prev_y + 1)):
+                    if current_room in self.door_rooms.get(door, ()):
+                        current_room.entry_door = door
+                        break
+            
+            # Reveal room interior: every non-wall cell, one row slice at a time
+            maze, visited_mask = self.maze, self.visited_mask
+            maze_width, maze_height = self.maze_width, self.maze_height
+            left, right = max(0, current_room.left), min(maze_width, current_room.right)
+            for room_y in range(max(0, current_room.top), min(maze_height, current_room.bottom)):
+                visited_mask[room_y][left:right] = maze[room_y][left:right].translate(self.ROOM_REVEAL)
             
             # Reveal only doors that are directly adjacent to this room's boundaries
-            for door_x, door_y in current_room.doors:
-                if (0 <= door_x < len(self.maze[0]) and 
-                    0 <= door_y < len(self.maze)):
-                    # Check if door is actually adjacent to THIS room's boundaries
-                    is_adjacent = (
-                        (door_x == current_room.left - 1 and current_room.top <= door_y < current_room.bottom) or  # Left edge
-                        (door_x == current_room.right and current_room.top <= door_y < current_room.bottom) or      # Right edge
-                        (door_y == current_room.top - 1 and current_room.left <= door_x < current_room.right) or    # Top edge
-                        (door_y == current_room.bottom and current_room.left <= door_x < current_room.right)         # Bottom edge
-                    )
-                    if is_adjacent:
-                        self.player.visited_cells.add((door_x, door_y))
+            # (door coordinates are bounds-checked when the doors are created)
+            for door_x, door_y in current_room.adjacent_doors:
+                visited_mask[door_y][door_x] = 1
         else:
             # If not in a room, we're in a corridor - reveal nearby corridor tiles
             # BUT DO NOT reveal doors (R or O) - only walls and floors
             
             # Clear previous visibility - only show current corridor area
-            self.player.visited_cells.clear()
-            
-            for dy in range(-2, 3):  # Reveal 5x5 area around player in corridors
-                for dx in range(-2, 3):
-                    corridor_x = x + dx
-                    corridor_y = y + dy
-                    if (0 <= corridor_x < len(self.maze[0]) and 
-                        0 <= corridor_y < len(self.maze)):
-                        cell = self.maze[corridor_y][corridor_x]
-                        # Don't reveal walls or doors in corridors
-                        if cell not in ['#', 'R', 'O', 'D']:
-                            self.player.visited_cells.add((corridor_x, corridor_y))
+            self._clear_visited_mask()
+            
+            # Reveal 5x5 area around player in corridors, one row slice at a time
+            # Don't reveal walls or doors in corridors
+            maze, visited_mask = self.maze, self.visited_mask
+            left, right = max(0, x - 2), min(self.maze_width, x + 3)
+            for corridor_y in range(max(0, y - 2), min(self.maze_height, y + 3)):
+                visited_mask[corridor_y][left:right] = maze[corridor_y][left:right].translate(self.CORRIDOR_REVEAL)
+    
+    def _clear_visited_mask(self):
+        """Hide every cell of the fog-of-war mask."""
+        blank = bytes(self.maze_width)
+        for row in self.visited_mask:
+            row[:] = blank
     
     def collect_item(self, item: Item):
         """Collect an item"""
         item.collected = True
-        
-        if item.type == ItemType.TREASURE:
-            self.player.treasure += item.value
-            self.player.score += item.value
-        elif item.type == ItemType.HEALTH_POTION:
-            healed = self.player.heal(item.value)
-            if healed > 0:
-                pass  # Visual feedback handled in heal method
-        elif item.type == ItemType.KEY:
-            self.player.keys += 1
-        elif item.type == ItemType.SWORD:
-            self.player.attack += item.value * 5
-        elif item.type == ItemType.SHIELD:
-            self.player.defense += item.value * 3
+        ItemManager.apply_effect(item, self.player)
     
     def combat(self, monster: Monster):
         """
@@ -1317,7 +1342,7 @@ class EnhancedMazeGame:
             monster.alive = False
             self.player.score += 25
             # Update doors immediately when monster dies
-            self._update_room_doors()
+            self._update_room_doors_for(monster.spawn_room)
         else:
             # Monster attacks back
             monster_damage = random.randint(3, 8)
@@ -1326,6 +1351,29 @@ class EnhancedMazeGame:
             if self.player.hp <= 0:
                 self.game_over = True
     
+    def _remove_dead_monsters(self):
+        """
+        Drop defeated monsters from the live monster list.
+        
+        Mirrors sprite.Group.kill(): once removed, every per-frame loop
+        (AI, collision, door checks, drawing) only walks living monsters.
+        """
+        # Walk the list backwards so dead entries can be deleted in place,
+        # without rebuilding the whole list for the usual one or two kills
+        monsters = self.monsters
+        for i in range(len(monsters) - 1, -1, -1):
+            monster = monsters[i]
+            if not monster.alive:
+                self._unindex_monster(monster, (monster.x, monster.y))
+                del monsters[i]
+    
+    def _unindex_monster(self, monster: Monster, pos: Tuple[int, int]):
+        """Remove a monster from the per-cell monster index at pos."""
+        occupants = self.monster_at[pos]
+        occupants.remove(monster)
+        if not occupants:
+            del self.monster_at[pos]
+    
     def update_monsters(self):
         """
         Execute AI behavior for all living skeleton monsters.
@@ -1337,59 +1385,76 @@ class EnhancedMazeGame:
         
         This creates challenging melee combat with parry opportunities.
         """
+        # Monsters are locked to their spawn room, whose doors stay closed while any
+        # of them live, so only the player's current room needs AI this frame
+        current_room = self.current_room
+        player_real_x, player_real_y = self.player.real_x, self.player.real_y
+        player_x, player_y = int(round(player_real_x)), int(round(player_real_y))
         for monster in self.monsters:
-            if not monster.alive:
+            if not monster.alive or monster.spawn_room is not current_room:
                 continue
             
             # Update AI to chase player and manage attack states
-            monster.update_ai(self.player.real_x, self.player.real_y)
-            
-            # Update monster position with collision (including obstacles)
-            monster.update_position(self.maze, self.monsters, self.obstacles)
-            
-            # Check if monster is attacking and hits player
-            if monster.attack_state == "attacking":
-                attack_positions = monster.get_attack_area()
-                player_pos = (int(round(self.player.real_x)), int(round(self.player.real_y)))
-                
-                if player_pos in attack_positions:
-                    # Monster hits player - can be parried
-                    self.player.take_damage(monster.damage, can_be_parried=True)
+            monster.update_ai(player_real_x, player_real_y)
+            
+            # Update monster position with collision (including obstacles); only
+            # monsters sharing its room can ever be close enough to block it
+            old_pos = (monster.x, monster.y)
+            monster.update_position(self.maze, current_room.monsters_in_room, self.obstacle_mask)
+            if (monster.x, monster.y) != old_pos:
+                self._unindex_monster(monster, old_pos)
+                self.monster_at.setdefault((monster.x, monster.y), []).append(monster)
+            
+            # Check if monster is attacking and hits player (a bounds test on the
+            # player's cell instead of building the 8-cell attack area)
+            if monster.hits_cell(player_x, player_y):
+                # Monster hits player - can be parried
+                self.player.take_damage(monster.damage, can_be_parried=True)
+    
+    def _update_room_doors_for(self, room):
+        """
+        Update one room's door state after its monsters changed.
+        
+        Only a kill or the room's first visit can change whether a room still
+        has living monsters, so those events resync just that room and its
+        doors instead of sweeping the whole dungeon.
+        """
+        room.monsters_in_room = [monster for monster in room.monsters_in_room if monster.alive]
+        
+        # Mark room as cleared if no monsters remain
+        if not room.monsters_in_room:
+            room.cleared = True
+        room.doors_closed = len(room.monsters_in_room) > 0
+        
+        # A door closes if EITHER visited room it joins has monsters
+        for door_x, door_y in room.doors:
+            room1, room2 = self.door_rooms[(door_x, door_y)]
+            door_should_be_closed = ((room1.visited and room1.doors_closed) or 
+                                     (room2.visited and room2.doors_closed))
+            self.maze[door_y][door_x] = DOOR_CLOSED if door_should_be_closed else DOOR_OPEN
+        self._minimap_dirty = True
     
     def _update_room_doors(self):
-        """Update door states based on whether rooms have living monsters."""
-        all_rooms = []
-        
-        # Collect all rooms
-        if hasattr(self, 'rooms'):
-            all_rooms.extend(self.rooms)
-        if hasattr(self, 'treasure_rooms'):
-            all_rooms.extend(self.treasure_rooms)
-        if hasattr(self, 'shop_rooms'):
-            all_rooms.extend(self.shop_rooms)
-        if hasattr(self, 'secret_rooms'):
-            all_rooms.extend(self.secret_rooms)
-        if hasattr(self, 'super_secret_rooms'):
-            all_rooms.extend(self.super_secret_rooms)
+        """Update door states of every room based on whether it has living monsters."""
+        # Bucket living monsters by the room that owns their cell, in one pass
+        # (cells outside every room, such as doors, belong to no room)
+        room_of = self.room_of
+        monsters_by_room = {}
+        for monster in self.monsters:
+            if not monster.alive:
+                continue
+            room_index = room_of[monster.y][monster.x]
+            if room_index >= 0:
+                monsters_by_room.setdefault(room_index, []).append(monster)
         
         # First pass: count monsters in each room
-        for room in all_rooms:
+        for room_index, room in enumerate(self.all_rooms):
             # Only update rooms that have been visited
             if not room.visited:
                 continue
-                
-            # Count living monsters in this room
-            # Only count monsters that are strictly inside the room (use pygame rect bounds)
-            monsters_in_room = []
-            for monster in self.monsters:
-                if not monster.alive:
-                    continue
-                
-                # Use strict room bounds (monsters must be inside, not on doors)
-                if (room.left <= monster.x < room.right and 
-                    room.top <= monster.y < room.bottom):
-                    monsters_in_room.append(monster)
             
+            # Living monsters strictly inside this room
+            monsters_in_room = monsters_by_room.get(room_index, [])
             room.monsters_in_room = monsters_in_room
             
             # Mark room as cleared if no monsters remain
@@ -1399,35 +1464,19 @@ class EnhancedMazeGame:
             room.doors_closed = len(monsters_in_room) > 0
         
         # Second pass: update door visuals
-        # A door should be closed if ANY connected room has monsters
-        processed_doors = set()
-        
-        for room in all_rooms:
-            # Only process doors for visited rooms
-            if not room.visited:
+        # Each door is visited once through the door table, and only its two
+        # rooms are consulted: it closes if EITHER visited room has monsters
+        for (door_x, door_y), (room1, room2) in self.door_rooms.items():
+            # Only process doors of visited rooms
+            if not (room1.visited or room2.visited):
                 continue
-                
-            for door_x, door_y in room.doors:
-                if (door_x, door_y) in processed_doors:
-                    continue  # Skip if we already processed this door
-                
-                processed_doors.add((door_x, door_y))
-                
-                if 0 <= door_y < len(self.maze) and 0 <= door_x < len(self.maze[0]):
-                    # Check if ANY room containing this door has monsters
-                    door_should_be_closed = False
-                    for check_room in all_rooms:
-                        if (door_x, door_y) in check_room.doors:
-                            # Only check visited rooms
-                            if check_room.visited and check_room.doors_closed:
-                                door_should_be_closed = True
-                                break
-                    
-                    # Update door state
-                    if door_should_be_closed:
-                        self.maze[door_y][door_x] = 'R'
-                    else:
-                        self.maze[door_y][door_x] = 'O'
+            
+            door_should_be_closed = ((room1.visited and room1.doors_closed) or 
+                                     (room2.visited and room2.doors_closed))
+            
+            # Update door state
+            self.maze[door_y][door_x] = DOOR_CLOSED if door_should_be_closed else DOOR_OPEN
+        self._minimap_dirty = True
     
     def update(self):
         """Update game state"""
@@ -1437,12 +1486,9 @@ class EnhancedMazeGame:
             # Update monsters with AI
             self.update_monsters()
             
-            # Update sword combat
+            # Update sword combat (kills update their room's doors)
             self.update_combat()
             
-            # Update door states based on room clearing
-            self._update_room_doors()
-            
             # Update player invincibility
             self.player.update_invincibility()
             
@@ -1458,7 +1504,7 @@ class EnhancedMazeGame:
         
         self.camera.update(
             self.player.real_x, self.player.real_y,
-            len(self.maze[0]), len(self.maze),
+            self.maze_width, self.maze_height,
             self.cell_size,
             current_room=self.current_room
         )
@@ -1471,27 +1517,629 @@ class EnhancedMazeGame:
         # Handle player sword attacks
         if self.player.current_swing and self.player.current_swing.active:
             swing_positions = self.player.current_swing.get_swing_area()
+            monster_killed = False
             
-            for monster in self.monsters:
+            # Broad phase: only monsters standing on a swept cell can be hit, so
+            # look them up through the per-cell monster index
+            swept = [monster for pos in dict.fromkeys(swing_positions)
+                     for monster in self.monster_at.get(pos, ())]
+            for monster in swept:
                 if not monster.alive:
                     continue
                 
-                monster_pos = (monster.x, monster.y)
-                
-                # Check if monster is in swing area and not already hit
-                if (monster_pos in swing_positions and 
-                    monster not in self.player.current_swing.hit_entities):
+                # Check monster was not already hit by this swing
+                if monster not in self.player.current_swing.hit_entities:
                     
                     # Hit the monster
                     monster.take_damage(self.player.current_swing.damage)
                     self.player.current_swing.hit_entities.add(monster)
                     
-                    # Award points
+                    # Award points and reopen the room's doors once it is cleared
                     if not monster.alive:
                         self.player.score += 25
+                        monster_killed = True
+                        self._update_room_doors_for(monster.spawn_room)
+            
+            if monster_killed:
+                self._remove_dead_monsters()
     
     # ---- RENDERING METHODS ----
     
+    def _build_sprite_caches(self):
+        """
+        (Re)build every pre-rendered sprite cache for the current cell size.
+        
+        The surfaces are converted to the display's pixel format, so the
+        display must already be set up. The sprites are only valid at the
+        cell_size they were built for, so anything that changes cell_size
+        must call this again.
+        """
+        self._tile_cache = self._build_tile_cache()  # Pre-rendered terrain tiles
+        self._item_cache = self._build_item_cache()  # Pre-rendered item sprites
+        self._rock_cache = {}  # (x, y, pixel_size) -> pre-rendered rock surface
+        self._monster_cache = {}  # (size, body color, glowing eyes) -> skeleton surface
+        self._swing_cache = {}  # Swing fade alpha -> cell outline surface
+        self._parry_cache = {}  # Parry fade alpha -> ring surface
+        self._player_cache = {}  # Body color -> player figure surface
+        
+        # Treasure sparkle dot, stamped four times per visible treasure
+        self._sparkle_sprite = pygame.Surface((5, 5), pygame.SRCALPHA)
+        pygame.draw.circle(self._sparkle_sprite, COLORS['WHITE'], (2, 2), 2)
+        self._sparkle_sprite = self._sparkle_sprite.convert_alpha()
+        
+        # Low-HP glow around the player: three translucent rings, blended onto
+        # the screen one after another, so each keeps its own surface
+        self._low_hp_glow = []
+        for i in range(3):
+            glow_radius = self.PLAYER_BODY_SIZE // 2 + 2 + i  # Just outside the player's body
+            glow_alpha = 50 - i * 15
+            glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
+            pygame.draw.circle(glow_surface, (*COLORS['RED'], glow_alpha), 
+                               (glow_radius, glow_radius), glow_radius)
+            self._low_hp_glow.append((glow_surface, glow_radius))
+    
+    def _build_tile_cache(self):
+        """
+        Pre-render every terrain tile once at the current cell size.
+        
+        Tiles look the same wherever they appear, so draw_maze blits these
+        surfaces instead of re-issuing their draw calls for every visible cell.
+        
+        Returns:
+            Dict of tile code (plus 'wall_alt' and 'unexplored') -> Surface
+        """
+        size = self.cell_size
+        tile_rect = pygame.Rect(0, 0, size, size)
+        
+        def new_tile(color):
+            tile = pygame.Surface((size, size)).convert()
+            tile.fill(color)
+            return tile
+        
+        # Wall
+        wall = new_tile(WALL_COLOR)
+        # Add texture to walls
+        pygame.draw.rect(wall, COLORS['LIGHT_GRAY'], tile_rect, 1)
+        wall_alt = wall.copy()  # Some variety in wall appearance
+        pygame.draw.rect(wall_alt, COLORS['GRAY'], pygame.Rect(2, 2, size - 4, size - 4))
+        
+        # Locked Door: darker brown with thicker border to make it more prominent
+        locked_door = new_tile(COLORS['DARK_BROWN'])
+        pygame.draw.rect(locked_door, COLORS['GOLD'], tile_rect, 4)
+        # Add wood grain effect
+        grain_color = (120, 60, 15)  # Darker brown for grain
+        for i in range(3):
+            grain_y = 3 + i * 5
+            pygame.draw.line(locked_door, grain_color, (2, grain_y), (size - 2, grain_y), 1)
+        # Add door handle (bigger and more visible)
+        handle_size = 10
+        handle_x = size - handle_size - 6
+        handle_y = size // 2 - handle_size // 2
+        pygame.draw.rect(locked_door, COLORS['GOLD'], 
+                         pygame.Rect(handle_x, handle_y, handle_size, handle_size))
+        pygame.draw.rect(locked_door, COLORS['YELLOW'], 
+                         pygame.Rect(handle_x + 2, handle_y + 2, handle_size - 4, handle_size - 4))
+        # Add keyhole (bigger)
+        keyhole_size = 6
+        keyhole_x = size - keyhole_size - 16
+        keyhole_y = size // 2 - keyhole_size // 2
+        pygame.draw.rect(locked_door, COLORS['BLACK'], 
+                         pygame.Rect(keyhole_x, keyhole_y, keyhole_size, keyhole_size))
+        
+        # Closed Room Door (monsters present): dark brown base, red border
+        closed_door = new_tile((139, 69, 19))
+        pygame.draw.rect(closed_door, COLORS['RED'], tile_rect, 4)
+        # Add warning indicators
+        for i in range(2):
+            warning_y = 8 + i * 12
+            pygame.draw.line(closed_door, COLORS['RED'], (4, warning_y), (size - 4, warning_y), 2)
+        # Add door handle
+        handle_size = 8
+        handle_x = size - handle_size - 6
+        handle_y = size // 2 - handle_size // 2
+        pygame.draw.rect(closed_door, COLORS['DARK_GRAY'], 
+                         pygame.Rect(handle_x, handle_y, handle_size, handle_size))
+        
+        # Open Room Door (no monsters): light brown, green border
+        open_door = new_tile(COLORS['BROWN'])
+        pygame.draw.rect(open_door, COLORS['GREEN'], tile_rect, 3)
+        # Add wood grain effect
+        grain_color = (160, 80, 20)
+        for i in range(2):
+            grain_y = 5 + i * 8
+            pygame.draw.line(open_door, grain_color, (3, grain_y), (size - 3, grain_y), 1)
+        # Add door handle
+        handle_size = 6
+        handle_x = size - handle_size - 6
+        handle_y = size // 2 - handle_size // 2
+        pygame.draw.rect(open_door, COLORS['GOLD'], 
+                         pygame.Rect(handle_x, handle_y, handle_size, handle_size))
+        
+        return {
+            WALL: wall,
+            'wall_alt': wall_alt,
+            DOOR: locked_door,
+            DOOR_CLOSED: closed_door,
+            DOOR_OPEN: open_door,
+            START: new_tile(START_COLOR),
+            END: new_tile(END_COLOR),
+            FLOOR: new_tile(FLOOR_COLOR),
+            'unexplored': new_tile(UNEXPLORED_COLOR),
+        }
+    
+    def _build_item_cache(self):
+        """
+        Pre-render every item type once at the current cell size.
+        
+        Item artwork never changes, so draw_maze blits these surfaces instead
+        of re-issuing a few dozen draw calls per visible item every frame.
+        
+        Returns:
+            Dict of ItemType -> Surface; TREASURE maps to a (coin, gem) pair
+            indexed by whether the treasure is high value
+        """
+        center_x = center_y = self.cell_size // 2
+        
+        def new_sprite():
+            return pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA).convert_alpha()
+        
+        # Treasure: coin/gem (the blinking sparkles are drawn per frame)
+        coin = new_sprite()
+        
+        # Main coin body
+        pygame.draw.circle(coin, TREASURE_COLOR, (center_x, center_y), 14)
+        pygame.draw.circle(coin, COLORS['YELLOW'], (center_x, center_y), 14, 3)
+        pygame.draw.circle(coin, COLORS['GOLD'], (center_x, center_y), 10)
+        
+        gem = coin.copy()  # High value = gem
+        gem_points = [
+            (center_x, center_y - 8),
+            (center_x + 6, center_y - 3),
+            (center_x + 4, center_y + 6),
+            (center_x - 4, center_y + 6),
+            (center_x - 6, center_y - 3)
+        ]
+        pygame.draw.polygon(gem, COLORS['WHITE'], gem_points)
+        pygame.draw.polygon(gem, COLORS['CYAN'], gem_points, 2)
+        
+        # Lower value = coin with simplified dollar sign
+        pygame.draw.line(coin, COLORS['WHITE'], 
+                         (center_x, center_y - 8), (center_x, center_y + 8), 3)
+        pygame.draw.arc(coin, COLORS['WHITE'],
+                        pygame.Rect(center_x - 6, center_y - 6, 12, 8), 0.5, 3.14, 3)
+        pygame.draw.arc(coin, COLORS['WHITE'],
+                        pygame.Rect(center_x - 6, center_y - 2, 12, 8), 3.64, 6.28, 3)
+        
+        # Draw detailed potion bottle
+        potion = new_sprite()
+        
+        # Main bottle body (rounded glass)
+        main_bottle = pygame.Rect(center_x - 8, center_y - 6, 16, 20)
+        pygame.draw.rect(potion, COLORS['DARK_GREEN'], main_bottle, border_radius=4)
+        pygame.draw.rect(potion, COLORS['GREEN'], main_bottle, 2, border_radius=4)
+        
+        # Bottle neck
+        neck_rect = pygame.Rect(center_x - 4, center_y - 12, 8, 8)
+        pygame.draw.rect(potion, COLORS['DARK_GREEN'], neck_rect)
+        pygame.draw.rect(potion, COLORS['GREEN'], neck_rect, 2)
+        
+        # Cork with wood texture
+        cork_rect = pygame.Rect(center_x - 5, center_y - 16, 10, 6)
+        pygame.draw.rect(potion, COLORS['BROWN'], cork_rect, border_radius=2)
+        pygame.draw.line(potion, COLORS['DARK_BROWN'],
+                         (center_x - 3, center_y - 15), (center_x + 3, center_y - 15), 1)
+        pygame.draw.line(potion, COLORS['DARK_BROWN'],
+                         (center_x - 2, center_y - 13), (center_x + 2, center_y - 13), 1)
+        
+        # Red liquid with bubbles
+        liquid_rect = pygame.Rect(center_x - 6, center_y - 2, 12, 14)
+        pygame.draw.rect(potion, COLORS['RED'], liquid_rect, border_radius=2)
+        # Liquid surface with meniscus
+        pygame.draw.ellipse(potion, COLORS['LIGHT_RED'], 
+                            pygame.Rect(center_x - 6, center_y - 4, 12, 4))
+        # Bubbles for magical effect
+        bubble_positions = [(center_x - 2, center_y + 2), (center_x + 3, center_y + 6)]
+        for bx, by in bubble_positions:
+            pygame.draw.circle(potion, COLORS['LIGHT_RED'], (bx, by), 2)
+            pygame.draw.circle(potion, COLORS['WHITE'], (bx - 1, by - 1), 1)
+        
+        # Paper label with cross
+        label_rect = pygame.Rect(center_x - 5, center_y + 1, 10, 8)
+        pygame.draw.rect(potion, COLORS['WHITE'], label_rect, border_radius=1)
+        pygame.draw.rect(potion, COLORS['GRAY'], label_rect, 1, border_radius=1)
+        # Red medical cross
+        pygame.draw.line(potion, COLORS['RED'], 
+                         (center_x, center_y + 3), (center_x, center_y + 7), 2)
+        pygame.draw.line(potion, COLORS['RED'],
+                         (center_x - 2, center_y + 5), (center_x + 2, center_y + 5), 2)
+        
+        # Glass shine effect
+        shine_rect = pygame.Rect(center_x - 6, center_y - 4, 3, 12)
+        pygame.draw.rect(potion, COLORS['WHITE'], shine_rect)
+        
+        # Draw detailed key
+        key = new_sprite()
+        
+        # Key shaft (body)
+        shaft_rect = pygame.Rect(center_x - 12, center_y - 2, 18, 4)
+        pygame.draw.rect(key, KEY_COLOR, shaft_rect, border_radius=2)
+        pygame.draw.rect(key, COLORS['GOLD'], shaft_rect, 2, border_radius=2)
+        
+        # Key head (circular with hole)
+        head_center = (center_x - 10, center_y)
+        pygame.draw.circle(key, KEY_COLOR, head_center, 8)
+        pygame.draw.circle(key, COLORS['GOLD'], head_center, 8, 2)
+        # Inner hole
+        pygame.draw.circle(key, COLORS['BLACK'], head_center, 4)
+        pygame.draw.circle(key, COLORS['GOLD'], head_center, 4, 1)
+        
+        # Key teeth (more detailed)
+        tooth_positions = [
+            pygame.Rect(center_x + 4, center_y - 4, 3, 4),
+            pygame.Rect(center_x + 4, center_y + 1, 5, 3),
+            pygame.Rect(center_x + 2, center_y + 1, 2, 2)
+        ]
+        for tooth in tooth_positions:
+            pygame.draw.rect(key, KEY_COLOR, tooth)
+            pygame.draw.rect(key, COLORS['GOLD'], tooth, 1)
+        
+        # Metallic shine on shaft
+        shine_line = pygame.Rect(center_x - 10, center_y - 1, 14, 1)
+        pygame.draw.rect(key, COLORS['WHITE'], shine_line)
+        
+        # Ring for keychain
+        ring_center = (center_x - 16, center_y)
+        pygame.draw.circle(key, KEY_COLOR, ring_center, 4)
+        pygame.draw.circle(key, COLORS['GOLD'], ring_center, 4, 2)
+        pygame.draw.circle(key, COLORS['BLACK'], ring_center, 2)
+        
+        # Draw detailed sword
+        sword = new_sprite()
+        
+        # Sword blade (tapered)
+        blade_points = [
+            (center_x, center_y - 14),        # Tip
+            (center_x - 3, center_y + 6),    # Left edge
+            (center_x + 3, center_y + 6)     # Right edge
+        ]
+        pygame.draw.polygon(sword, COLORS['SILVER'], blade_points)
+        pygame.draw.polygon(sword, COLORS['WHITE'], blade_points, 2)
+        
+        # Fuller (blood groove) in blade
+        fuller_points = [
+            (center_x, center_y - 12),
+            (center_x - 1, center_y + 4),
+            (center_x + 1, center_y + 4)
+        ]
+        pygame.draw.polygon(sword, COLORS['GRAY'], fuller_points)
+        
+        # Cross guard (hilt)
+        hilt_rect = pygame.Rect(center_x - 8, center_y + 6, 16, 3)
+        pygame.draw.rect(sword, COLORS['GOLD'], hilt_rect, border_radius=1)
+        pygame.draw.rect(sword, COLORS['YELLOW'], hilt_rect, 1, border_radius=1)
+        
+        # Handle (grip)
+        handle_rect = pygame.Rect(center_x - 2, center_y + 9, 4, 8)
+        pygame.draw.rect(sword, COLORS['BROWN'], handle_rect)
+        # Handle wrapping texture
+        for i in range(3):
+            y_pos = center_y + 10 + i * 2
+            pygame.draw.line(sword, COLORS['DARK_BROWN'],
+                             (center_x - 2, y_pos), (center_x + 2, y_pos), 1)
+        
+        # Pommel (end cap)
+        pommel_center = (center_x, center_y + 18)
+        pygame.draw.circle(sword, COLORS['GOLD'], pommel_center, 3)
+        pygame.draw.circle(sword, COLORS['YELLOW'], pommel_center, 3, 1)
+        pygame.draw.circle(sword, COLORS['WHITE'], pommel_center, 1)
+        
+        # Blade shine effects
+        shine_points = [
+            (center_x - 1, center_y - 12),
+            (center_x - 1, center_y + 2)
+        ]
+        pygame.draw.line(sword, COLORS['WHITE'], shine_points[0], shine_points[1], 1)
+        
+        # Draw detailed medieval shield
+        shield = new_sprite()
+        
+        # Shield shape (kite shield)
+        shield_points = [
+            (center_x, center_y - 12),        # Top
+            (center_x - 8, center_y - 8),    # Top left
+            (center_x - 10, center_y + 2),   # Mid left
+            (center_x - 6, center_y + 10),   # Bottom left
+            (center_x, center_y + 14),       # Bottom point
+            (center_x + 6, center_y + 10),   # Bottom right
+            (center_x + 10, center_y + 2),   # Mid right
+            (center_x + 8, center_y - 8)     # Top right
+        ]
+        pygame.draw.polygon(shield, COLORS['BLUE'], shield_points)
+        pygame.draw.polygon(shield, COLORS['SILVER'], shield_points, 3)
+        
+        # Shield boss (center metal dome)
+        pygame.draw.circle(shield, COLORS['SILVER'], (center_x, center_y), 6)
+        pygame.draw.circle(shield, COLORS['GRAY'], (center_x, center_y), 6, 2)
+        pygame.draw.circle(shield, COLORS['WHITE'], (center_x - 2, center_y - 2), 2)
+        
+        # Shield rim studs
+        stud_positions = [
+            (center_x - 6, center_y - 6), (center_x + 6, center_y - 6),
+            (center_x - 8, center_y + 2), (center_x + 8, center_y + 2),
+            (center_x - 4, center_y + 8), (center_x + 4, center_y + 8)
+        ]
+        for stud_pos in stud_positions:
+            pygame.draw.circle(shield, COLORS['SILVER'], stud_pos, 2)
+            pygame.draw.circle(shield, COLORS['WHITE'], stud_pos, 1)
+        
+        # Heraldic cross design
+        pygame.draw.line(shield, COLORS['WHITE'],
+                         (center_x, center_y - 8), (center_x, center_y + 8), 2)
+        pygame.draw.line(shield, COLORS['WHITE'],
+                         (center_x - 6, center_y), (center_x + 6, center_y), 2)
+        
+        # Shield handle (visible from side)
+        handle_rect = pygame.Rect(center_x + 8, center_y - 3, 3, 6)
+        pygame.draw.rect(shield, COLORS['BROWN'], handle_rect)
+        pygame.draw.rect(shield, COLORS['DARK_BROWN'], handle_rect, 1)
+        
+        return {
+            ItemType.TREASURE: (coin, gem),
+            ItemType.HEALTH_POTION: potion,
+            ItemType.KEY: key,
+            ItemType.SWORD: sword,
+            ItemType.SHIELD: shield,
+        }
+    
+    def _render_text(self, font: pygame.font.Font, text: str, color):
+        """
+        Render a fixed line of UI text, reusing the surface from an earlier frame.
+        
+        Labels and titles never change, so each (font, text, color) is
+        rasterized only once. The cache is never trimmed: text showing a
+        changing value (counts, score, debug readouts) must be rendered
+        directly instead, or every value would stay in it.
+        
+        Returns:
+            Anti-aliased text Surface
+        """
+        key = (font, text, color)
+        text_surface = self._text_cache.get(key)
+        if text_surface is None:
+            text_surface = self._text_cache[key] = font.render(text, True, color)
+        return text_surface
+    
+    def _build_ui_icons(self):
+        """
+        Pre-render the side panel's hearts and stat icons once.
+        
+        Each icon is drawn at its usual offsets onto a small transparent
+        surface, so draw_ui blits one surface per heart or stat instead of
+        re-issuing up to seven draw calls for it every frame.
+        
+        Returns:
+            Dict of icon name (or ('skull', color) for the enemy counter and
+            ('heart_glow', pulse) for the heart glow) -> Surface
+        """
+        def new_icon(width, height):
+            return pygame.Surface((width, height), pygame.SRCALPHA).convert_alpha()
+        
+        icons = {}
+        
+        # Hearts: two circles and a triangle, outlined in black; full hearts
+        # are red with a highlight, empty ones dark grey
+        triangle_points = [(2, 6), (10, 6), (6, 12)]
+        for name, heart_color in (('heart_filled', COLORS['RED']), ('heart_empty', COLORS['DARK_GRAY'])):
+            heart = new_icon(14, 14)
+            pygame.draw.circle(heart, heart_color, (4, 4), 4)
+            pygame.draw.circle(heart, heart_color, (8, 4), 4)
+            pygame.draw.polygon(heart, heart_color, triangle_points)
+            if name == 'heart_filled':
+                # Add white highlight for depth
+                pygame.draw.circle(heart, (255, 200, 200), (3, 3), 1)
+                pygame.draw.circle(heart, (255, 200, 200), (7, 3), 1)
+            pygame.draw.circle(heart, COLORS['BLACK'], (4, 4), 4, 1)
+            pygame.draw.circle(heart, COLORS['BLACK'], (8, 4), 4, 1)
+            pygame.draw.polygon(heart, COLORS['BLACK'], triangle_points, 1)
+            icons[name] = heart
+        
+        # Translucent glow behind the last full heart, one per pulse step
+        for pulse in (1, 2):
+            glow_radius = 8 + pulse
+            glow = new_icon(glow_radius * 2, glow_radius * 2)
+            pygame.draw.circle(glow, (255, 0, 0, 50), (glow_radius, glow_radius), glow_radius)
+            icons[('heart_glow', pulse)] = glow
+        
+        # Enemy counter skull, in each of the counter's border colors
+        for color in (COLORS['GREEN'], COLORS['YELLOW'], COLORS['RED']):
+            skull = new_icon(12, 16)
+            pygame.draw.ellipse(skull, color, pygame.Rect(0, 0, 12, 14))
+            pygame.draw.rect(skull, color, pygame.Rect(2, 10, 8, 6))
+            # Eye sockets
+            pygame.draw.circle(skull, COLORS['BLACK'], (3, 5), 2)
+            pygame.draw.circle(skull, COLORS['BLACK'], (9, 5), 2)
+            icons[('skull', color)] = skull
+        
+        # Stat icons, drawn relative to (ui_x + 14, y_offset + 5) of their panel
+        sword = new_icon(16, 16)
+        pygame.draw.line(sword, COLORS['YELLOW'], (4, 3), (11, 10), 2)
+        pygame.draw.line(sword, COLORS['YELLOW'], (1, 7), (14, 7), 1)
+        icons['ATTACK'] = sword
+        
+        shield = new_icon(16, 16)
+        pygame.draw.circle(shield, COLORS['CYAN'], (8, 7), 6, 2)
+        icons['DEFENSE'] = shield
+        
+        key = new_icon(16, 16)
+        pygame.draw.circle(key, COLORS['GOLD'], (4, 5), 3, 2)
+        pygame.draw.line(key, COLORS['GOLD'], (7, 7), (13, 7), 2)
+        icons['KEYS'] = key
+        
+        gem = new_icon(16, 16)
+        pygame.draw.polygon(gem, COLORS['GREEN'], [(8, 2), (12, 5), (8, 12), (4, 5)], 2)
+        icons['TREASURE'] = gem
+        return icons
+    
+    def _build_door_label_cache(self):
+        """
+        Pre-render the door labels ("LOCKED", "ENEMIES", "CLEAR") once.
+        
+        Text rendering is one of pygame's slowest operations, and these
+        strings never change, so each label is rasterized together with its
+        background box for draw_maze to blit.
+        
+        Returns:
+            Dict of door tile code -> label Surface (text plus a 2px margin)
+        """
+        labels = {}
+        for cell, (text, text_color, background_color, _) in self.DOOR_LABELS.items():
+            text_surface = self.small_font.render(text, True, text_color)
+            # Add text background for better visibility
+            label = pygame.Surface((text_surface.get_width() + 4,
+                                    text_surface.get_height() + 4)).convert()
+            label.fill(background_color)
+            label.blit(text_surface, (2, 2))
+            labels[cell] = label
+        return labels
+    
+    def _render_rock(self, obstacle: Obstacle):
+        """
+        Render an obstacle's rock onto its own cell-sized transparent surface.
+        
+        The rock's shape is derived from a RNG seeded by its position, so it
+        never changes and is drawn once instead of every frame.
+        
+        Args:
+            obstacle: The Obstacle to render
+            
+        Returns:
+            Surface to blit at the obstacle's cell position
+        """
+        rock = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA).convert_alpha()
+        center_x = center_y = self.cell_size // 2
+        
+        # Rock color - grey with variation
+        rock_base = (100, 100, 100)
+        rock_highlight = (140, 140, 140)
+        rock_shadow = (60, 60, 60)
+        
+        # Draw rock as irregular polygon
+        half_size = obstacle.pixel_size // 2
+        
+        # Main rock body (slightly irregular pentagon/hexagon)
+        rng = random.Random(obstacle.x * 1000 + obstacle.y)  # Consistent randomness
+        rock_points = []
+        for i in range(6):
+            angle = i * 3.14159 * 2 / 6 + rng.uniform(-0.3, 0.3)
+            radius = half_size + rng.randint(-3, 3)
+            px = center_x + int(radius * math.cos(angle))
+            py = center_y + int(radius * math.sin(angle))
+            rock_points.append((px, py))
+        
+        # Draw rock with shading
+        pygame.draw.polygon(rock, rock_shadow, rock_points)
+        pygame.draw.polygon(rock, rock_base, rock_points)
+        pygame.draw.polygon(rock, rock_highlight, rock_points, 2)
+        
+        # Add some detail/cracks
+        for i in range(2):
+            crack_start = rock_points[i]
+            crack_end = rock_points[(i + 3) % len(rock_points)]
+            crack_mid_x = (crack_start[0] + crack_end[0]) // 2 + rng.randint(-3, 3)
+            crack_mid_y = (crack_start[1] + crack_end[1]) // 2 + rng.randint(-3, 3)
+            pygame.draw.line(rock, rock_shadow, crack_start, (crack_mid_x, crack_mid_y), 1)
+        
+        return rock
+    
+    def _render_player(self, body_color):
+        """
+        Render the knight-like player figure onto its own cell-sized transparent surface.
+        
+        Args:
+            body_color: Body color, which flashes on damage and healing
+            
+        Returns:
+            Surface to blit at the player's cell position
+        """
+        knight = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA).convert_alpha()
+        center_x = center_y = self.cell_size // 2
+        body_size = self.PLAYER_BODY_SIZE
+        
+        # Body (circle)
+        pygame.draw.circle(knight, body_color, (center_x, center_y), body_size // 2)
+        pygame.draw.circle(knight, COLORS['WHITE'], (center_x, center_y), body_size // 2, 3)
+        
+        # Helmet/face details
+        pygame.draw.circle(knight, COLORS['BLUE'], (center_x - 4, center_y - 2), 2)  # Left eye
+        pygame.draw.circle(knight, COLORS['BLUE'], (center_x + 4, center_y - 2), 2)  # Right eye
+        
+        # Armor shine effect
+        for dx, dy in self.PLAYER_SHINE_OFFSETS:
+            pygame.draw.circle(knight, COLORS['WHITE'], (center_x + dx, center_y + dy), 2)
+        return knight
+    
+    def _render_skeleton(self, body_size: int, base_color, glowing_eyes: bool):
+        """
+        Render a skeleton onto its own cell-sized transparent surface.
+        
+        Args:
+            body_size: Skull diameter in pixels (depends on difficulty)
+            base_color: Bone color for the current attack/damage state
+            glowing_eyes: Whether the eye sockets glow red (winding up/attacking)
+            
+        Returns:
+            Surface to blit at the monster's cell position
+        """
+        skeleton = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA).convert_alpha()
+        center_x = center_y = self.cell_size // 2
+        
+        # Skeleton body (main skull/torso)
+        pygame.draw.ellipse(skeleton, base_color, 
+                            pygame.Rect(center_x - body_size//2, center_y - body_size//2, 
+                                        body_size, body_size))
+        pygame.draw.ellipse(skeleton, (150, 150, 130), 
+                            pygame.Rect(center_x - body_size//2, center_y - body_size//2, 
+                                        body_size, body_size), 2)
+        
+        # Skull details
+        # Eye sockets
+        eye_size = max(2, body_size // 6)
+        pygame.draw.circle(skeleton, COLORS['BLACK'], 
+                           (center_x - body_size//4, center_y - body_size//6), eye_size)
+        pygame.draw.circle(skeleton, COLORS['BLACK'], 
+                           (center_x + body_size//4, center_y - body_size//6), eye_size)
+        
+        # Glowing red eyes
+        if glowing_eyes:
+            pygame.draw.circle(skeleton, COLORS['RED'], 
+                               (center_x - body_size//4, center_y - body_size//6), eye_size//2)
+            pygame.draw.circle(skeleton, COLORS['RED'], 
+                               (center_x + body_size//4, center_y - body_size//6), eye_size//2)
+        
+        # Nasal cavity
+        nasal_points = [
+            (center_x, center_y),
+            (center_x - 2, center_y + 4),
+            (center_x + 2, center_y + 4)
+        ]
+        pygame.draw.polygon(skeleton, COLORS['BLACK'], nasal_points)
+        
+        # Jaw/mouth
+        jaw_width = body_size // 2
+        jaw_y = center_y + body_size//4
+        pygame.draw.arc(skeleton, COLORS['BLACK'], 
+                        pygame.Rect(center_x - jaw_width//2, jaw_y - 2, jaw_width, 6), 
+                        0, 3.14159, 2)
+        
+        # Bone joints/shoulders
+        joint_size = max(2, body_size // 8)
+        pygame.draw.circle(skeleton, (200, 200, 180), 
+                           (center_x - body_size//2 - 2, center_y), joint_size)
+        pygame.draw.circle(skeleton, (200, 200, 180), 
+                           (center_x + body_size//2 + 2, center_y), joint_size)
+        
+        return skeleton
+    
     def draw_maze(self):
         """
         Render the complete dungeon with enhanced graphics and fog of war.
@@ -1517,521 +2165,205 @@ class EnhancedMazeGame:
         # Calculate visible area with proper bounds checking
         # Only render cells that are currently visible on screen for performance
         start_x = max(0, int(self.camera.x // self.cell_size) - 1)
-        end_x = min(len(self.maze[0]), int((self.camera.x + self.camera.width) // self.cell_size + 3))
+        end_x = min(self.maze_width, int((self.camera.x + self.camera.width) // self.cell_size + 3))
         start_y = max(0, int(self.camera.y // self.cell_size) - 1)
-        end_y = min(len(self.maze), int((self.camera.y + self.camera.height) // self.cell_size + 3))
-        
-        # Draw visible cells
+        end_y = min(self.maze_height, int((self.camera.y + self.camera.height) // self.cell_size + 3))
+        
+        # Terrain tiles are pre-rendered; anything else is plain floor
+        tile_cache = self._tile_cache
+        floor_tile = tile_cache[FLOOR]
+        
+        # Most visible cells are floor, so paint the whole visible cell range
+        # with the floor color in one fill and blit only the other tiles on top
+        # (edges truncated the same way blit truncates each tile's position)
+        fill_left = int(start_x * self.cell_size - self.camera.x)
+        fill_top = int(start_y * self.cell_size - self.camera.y)
+        fill_right = int((end_x - 1) * self.cell_size - self.camera.x) + self.cell_size
+        fill_bottom = int((end_y - 1) * self.cell_size - self.camera.y) + self.cell_size
+        self.screen.fill(FLOOR_COLOR, pygame.Rect(fill_left, fill_top,
+                                                  fill_right - fill_left, fill_bottom - fill_top))
+        
+        # Collect every visible tile and blit them in one batched call (the loop
+        # over the list runs in C); door labels are drawn afterwards, on top
+        tile_blits = []
+        door_labels = []
+        
+        # Draw visible cells (the bounds above are already clamped to the maze);
+        # slicing each bytearray row yields its tile codes without per-cell
+        # indexing, and the fog-of-war mask row is sliced alongside it
+        maze, visited_mask = self.maze, self.visited_mask
+        cell_size = self.cell_size
+        camera_x, camera_y = self.camera.x, self.camera.y
+        player_x, player_y = self.player.x, self.player.y
+        door_labels_table = self.DOOR_LABELS
+        unexplored_tile, wall_alt_tile = tile_cache['unexplored'], tile_cache['wall_alt']
+        # Column screen positions are the same for every row
+        columns = range(start_x, end_x)
+        screen_xs = [x * cell_size - camera_x for x in columns]
         for y in range(start_y, end_y):
-            for x in range(start_x, end_x):
-                if y >= len(self.maze) or x >= len(self.maze[0]):
-                    continue
-                
-                cell = self.maze[y][x]
-                
-                # Calculate screen position
-                screen_x = x * self.cell_size - self.camera.x
-                screen_y = y * self.cell_size - self.camera.y
-                
-                rect = pygame.Rect(screen_x, screen_y, self.cell_size, self.cell_size)
-                
+            # Calculate screen position
+            screen_y = y * cell_size - camera_y
+            for x, screen_x, cell, visible in zip(columns, screen_xs, maze[y][start_x:end_x],
+                                                  visited_mask[y][start_x:end_x]):
                 # Fog of War System: Only render areas the player has explored
                 # This creates strategic tension and rewards exploration
-                if (x, y) in self.player.visited_cells:
-                    if cell == '#':  # Wall
-                        pygame.draw.rect(self.screen, WALL_COLOR, rect)
-                        # Add texture to walls
-                        pygame.draw.rect(self.screen, COLORS['LIGHT_GRAY'], rect, 1)
-                        if (x + y) % 3 == 0:  # Some variety in wall appearance
-                            pygame.draw.rect(self.screen, COLORS['GRAY'], 
-                                           pygame.Rect(screen_x + 2, screen_y + 2, 
-                                                     self.cell_size - 4, self.cell_size - 4))
-                    elif cell == 'D':  # Locked Door
-                        # Make door more prominent with darker brown and thicker border
-                        pygame.draw.rect(self.screen, COLORS['DARK_BROWN'], rect)
-                        pygame.draw.rect(self.screen, COLORS['GOLD'], rect, 4)
-                        
-                        # Add wood grain effect
-                        grain_color = (120, 60, 15)  # Darker brown for grain
-                        for i in range(3):
-                            grain_y = screen_y + 3 + i * 5
-                            pygame.draw.line(self.screen, grain_color, 
-                                (screen_x + 2, grain_y), 
-                                (screen_x + self.cell_size - 2, grain_y), 1)
-                        
-                        # Add door handle (bigger and more visible)
-                        handle_size = 10
-                        handle_x = screen_x + self.cell_size - handle_size - 6
-                        handle_y = screen_y + self.cell_size // 2 - handle_size // 2
-                        pygame.draw.rect(self.screen, COLORS['GOLD'], 
-                                       pygame.Rect(handle_x, handle_y, handle_size, handle_size))
-                        pygame.draw.rect(self.screen, COLORS['YELLOW'], 
-                                       pygame.Rect(handle_x + 2, handle_y + 2, handle_size - 4, handle_size - 4))
-                        
-                        # Add keyhole (bigger)
-                        keyhole_size = 6
-                        keyhole_x = screen_x + self.cell_size - keyhole_size - 16
-                        keyhole_y = screen_y + self.cell_size // 2 - keyhole_size // 2
-                        pygame.draw.rect(self.screen, COLORS['BLACK'], 
-                                       pygame.Rect(keyhole_x, keyhole_y, keyhole_size, keyhole_size))
-                        
-                        # Add "LOCKED" text if door is nearby
-                        player_dist = abs(self.player.x - x) + abs(self.player.y - y)
-                        if player_dist <= 1:
-                            lock_text = self.small_font.render("LOCKED", True, COLORS['RED'])
-                            text_x = screen_x + self.cell_size // 2 - lock_text.get_width() // 2
-                            text_y = screen_y - 20
-                            # Add text background for better visibility
-                            text_bg = pygame.Rect(text_x - 2, text_y - 2, 
-                                                lock_text.get_width() + 4, lock_text.get_height() + 4)
-                            pygame.draw.rect(self.screen, COLORS['BLACK'], text_bg)
-                            self.screen.blit(lock_text, (text_x, text_y))
-                    
-                    elif cell == 'R':  # Closed Room Door (monsters present)
-                        # Dark red door indicating monsters are inside
-                        pygame.draw.rect(self.screen, (139, 69, 19), rect)  # Dark brown base
-                        pygame.draw.rect(self.screen, COLORS['RED'], rect, 4)  # Red border
-                        
-                        # Add warning indicators
-                        warning_color = COLORS['RED']
-                        for i in range(2):
-                            warning_y = screen_y + 8 + i * 12
-                            pygame.draw.line(self.screen, warning_color, 
-                                (screen_x + 4, warning_y), 
-                                (screen_x + self.cell_size - 4, warning_y), 2)
-                        
-                        # Add door handle
-                        handle_size = 8
-                        handle_x = screen_x + self.cell_size - handle_size - 6
-                        handle_y = screen_y + self.cell_size // 2 - handle_size // 2
-                        pygame.draw.rect(self.screen, COLORS['DARK_GRAY'], 
-                            pygame.Rect(handle_x, handle_y, handle_size, handle_size))
-                        
-                        # Show enemy indicator with distance check
-                        player_dist = abs(self.player.x - x) + abs(self.player.y - y)
-                        if player_dist <= 2:
-                            enemy_text = self.small_font.render("ENEMIES", True, COLORS['WHITE'])
-                            text_x = screen_x + self.cell_size // 2 - enemy_text.get_width() // 2
-                            text_y = screen_y - 20
-                            
-                            # Add background
-                            text_bg = pygame.Rect(text_x - 2, text_y - 2, 
-                                                enemy_text.get_width() + 4, enemy_text.get_height() + 4)
-                            pygame.draw.rect(self.screen, COLORS['RED'], text_bg)
-                            self.screen.blit(enemy_text, (text_x, text_y))
-                    
-                    elif cell == 'O':  # Open Room Door (no monsters)
-                        # Light brown door indicating room is clear
-                        pygame.draw.rect(self.screen, COLORS['BROWN'], rect)
-                        pygame.draw.rect(self.screen, COLORS['GREEN'], rect, 3)  # Green border
-                        
-                        # Add wood grain effect  
-                        grain_color = (160, 80, 20)
-                        for i in range(2):
-                            grain_y = screen_y + 5 + i * 8
-                            pygame.draw.line(self.screen, grain_color, 
-                                (screen_x + 3, grain_y), 
-                                (screen_x + self.cell_size - 3, grain_y), 1)
-                        
-                        # Add door handle
-                        handle_size = 6
-                        handle_x = screen_x + self.cell_size - handle_size - 6
-                        handle_y = screen_y + self.cell_size // 2 - handle_size // 2
-                        pygame.draw.rect(self.screen, COLORS['GOLD'], 
-                                       pygame.Rect(handle_x, handle_y, handle_size, handle_size))
-                        
-                        # Show clear indicator with distance check
-                        player_dist = abs(self.player.x - x) + abs(self.player.y - y)
-                        if player_dist <= 2:
-                            clear_text = self.small_font.render("CLEAR", True, COLORS['WHITE'])
-                            text_x = screen_x + self.cell_size // 2 - clear_text.get_width() // 2
-                            text_y = screen_y - 20
-                            
-                            # Add background
-                            text_bg = pygame.Rect(text_x - 2, text_y - 2, 
-                                                clear_text.get_width() + 4, clear_text.get_height() + 4)
-                            pygame.draw.rect(self.screen, COLORS['GREEN'], text_bg)
-                            self.screen.blit(clear_text, (text_x, text_y))
+                if visible:
+                    if cell == WALL and (x + y) % 3 == 0:  # Some variety in wall appearance
+                        tile_blits.append((wall_alt_tile, (screen_x, screen_y)))
+                    else:
+                        tile = tile_cache.get(cell, floor_tile)
+                        if tile is not floor_tile:  # Floor is already filled in
+                            tile_blits.append((tile, (screen_x, screen_y)))
                     
-                    else:  # Floor
-                        if cell == 'S':
-                            pygame.draw.rect(self.screen, START_COLOR, rect)
-                        elif cell == 'E':
-                            pygame.draw.rect(self.screen, END_COLOR, rect)
-                        else:
-                            pygame.draw.rect(self.screen, FLOOR_COLOR, rect)
+                    # Label doors the player is standing next to
+                    if cell in door_labels_table:
+                        player_dist = abs(player_x - x) + abs(player_y - y)
+                        if player_dist <= door_labels_table[cell][3]:
+                            door_labels.append((cell, screen_x, screen_y))
                 else:
                     # Unexplored - pure black for fog of war effect
-                    pygame.draw.rect(self.screen, UNEXPLORED_COLOR, rect)
+                    tile_blits.append((unexplored_tile, (screen_x, screen_y)))
         
-        # Draw obstacles (rocks)
-        for obstacle in self.obstacles:
-            if (obstacle.x, obstacle.y) in self.player.visited_cells:
-                screen_x = obstacle.x * self.cell_size - self.camera.x
-                screen_y = obstacle.y * self.cell_size - self.camera.y
-                center_x = screen_x + self.cell_size // 2
-                center_y = screen_y + self.cell_size // 2
-                
-                # Rock color - grey with variation
-                rock_base = (100, 100, 100)
-                rock_highlight = (140, 140, 140)
-                rock_shadow = (60, 60, 60)
-                
-                # Draw rock as irregular polygon
-                size = obstacle.pixel_size
-                half_size = size // 2
-                
-                # Main rock body (slightly irregular pentagon/hexagon)
-                import random
-                random.seed(obstacle.x * 1000 + obstacle.y)  # Consistent randomness
-                rock_points = []
-                for i in range(6):
-                    angle = i * 3.14159 * 2 / 6 + random.uniform(-0.3, 0.3)
-                    radius = half_size + random.randint(-3, 3)
-                    px = center_x + int(radius * math.cos(angle))
-                    py = center_y + int(radius * math.sin(angle))
-                    rock_points.append((px, py))
-                
-                # Draw rock with shading
-                pygame.draw.polygon(self.screen, rock_shadow, rock_points)
-                pygame.draw.polygon(self.screen, rock_base, rock_points)
-                pygame.draw.polygon(self.screen, rock_highlight, rock_points, 2)
-                
-                # Add some detail/cracks
-                for i in range(2):
-                    crack_start = rock_points[i]
-                    crack_end = rock_points[(i + 3) % len(rock_points)]
-                    crack_mid_x = (crack_start[0] + crack_end[0]) // 2 + random.randint(-3, 3)
-                    crack_mid_y = (crack_start[1] + crack_end[1]) // 2 + random.randint(-3, 3)
-                    pygame.draw.line(self.screen, rock_shadow, crack_start, (crack_mid_x, crack_mid_y), 1)
-                
-                random.seed()  # Reset random seed
+        self.screen.blits(tile_blits, doreturn=False)
         
-        # Draw items with enhanced graphics
+        # "LOCKED" / "ENEMIES" / "CLEAR" labels above nearby doors
+        for cell, screen_x, screen_y in door_labels:
+            label = self._door_label_cache[cell]
+            # The cached label includes a 2px background margin
+            text_x = screen_x + cell_size // 2 - (label.get_width() - 4) // 2
+            self.screen.blit(label, (text_x - 2, screen_y - 22))
+        
+        # Draw obstacles (rocks), each pre-rendered once; anything outside the
+        # visible cell range is skipped before touching the fog-of-war mask
+        for obstacle in self.obstacles:
+            if (start_x <= obstacle.x < end_x and start_y <= obstacle.y < end_y and
+                    visited_mask[obstacle.y][obstacle.x]):
+                screen_x = obstacle.x * cell_size - camera_x
+                screen_y = obstacle.y * cell_size - camera_y
+                key = (obstacle.x, obstacle.y, obstacle.pixel_size)
+                rock = self._rock_cache.get(key)
+                if rock is None:
+                    rock = self._rock_cache[key] = self._render_rock(obstacle)
+                self.screen.blit(rock, (screen_x, screen_y))
+        
+        # Draw items from their pre-rendered sprites in one batched blits() call;
+        # treasure sparkles go on top afterwards
+        item_sprites = self._item_cache
+        item_blits = []
+        treasure_centers = []
         for item in self.items:
             if (not item.collected and 
-                (item.x, item.y) in self.player.visited_cells):
+                start_x <= item.x < end_x and start_y <= item.y < end_y and
+                visited_mask[item.y][item.x]):
                 
-                screen_x = item.x * self.cell_size - self.camera.x
-                screen_y = item.y * self.cell_size - self.camera.y
+                screen_x = item.x * cell_size - camera_x
+                screen_y = item.y * cell_size - camera_y
                 
-                # Draw different shapes for different item types
+                sprite = item_sprites[item.type]
                 if item.type == ItemType.TREASURE:
-                    # Draw treasure as detailed coin/gem
-                    center_x = screen_x + self.cell_size // 2
-                    center_y = screen_y + self.cell_size // 2
-                    
-                    # Main coin body
-                    pygame.draw.circle(self.screen, TREASURE_COLOR, (center_x, center_y), 14)
-                    pygame.draw.circle(self.screen, COLORS['YELLOW'], (center_x, center_y), 14, 3)
-                    pygame.draw.circle(self.screen, COLORS['GOLD'], (center_x, center_y), 10)
-                    
-                    # Inner design - dollar sign or gem pattern
-                    if item.value >= 100:  # High value = gem
-                        gem_points = [
-                            (center_x, center_y - 8),
-                            (center_x + 6, center_y - 3),
-                            (center_x + 4, center_y + 6),
-                            (center_x - 4, center_y + 6),
-                            (center_x - 6, center_y - 3)
-                        ]
-                        pygame.draw.polygon(self.screen, COLORS['WHITE'], gem_points)
-                        pygame.draw.polygon(self.screen, COLORS['CYAN'], gem_points, 2)
-                    else:  # Lower value = coin with symbol
-                        # Draw simplified dollar sign
-                        pygame.draw.line(self.screen, COLORS['WHITE'], 
-                                       (center_x, center_y - 8), (center_x, center_y + 8), 3)
-                        pygame.draw.arc(self.screen, COLORS['WHITE'],
-                                      pygame.Rect(center_x - 6, center_y - 6, 12, 8), 0.5, 3.14, 3)
-                        pygame.draw.arc(self.screen, COLORS['WHITE'],
-                                      pygame.Rect(center_x - 6, center_y - 2, 12, 8), 3.64, 6.28, 3)
-                    
-                    # Sparkle effect
-                    sparkle_positions = [
-                        (center_x - 10, center_y - 8), (center_x + 12, center_y - 6),
-                        (center_x - 8, center_y + 10), (center_x + 8, center_y + 12)
-                    ]
-                    for i, pos in enumerate(sparkle_positions):
-                        if (pygame.time.get_ticks() + i * 200) % 1000 < 500:  # Blinking effect
-                            pygame.draw.circle(self.screen, COLORS['WHITE'], pos, 2)
-                
-                elif item.type == ItemType.HEALTH_POTION:
-                    # Draw detailed potion bottle
-                    center_x = screen_x + self.cell_size // 2
-                    center_y = screen_y + self.cell_size // 2
-                    
-                    # Main bottle body (rounded glass)
-                    main_bottle = pygame.Rect(center_x - 8, center_y - 6, 16, 20)
-                    pygame.draw.rect(self.screen, COLORS['DARK_GREEN'], main_bottle, border_radius=4)
-                    pygame.draw.rect(self.screen, COLORS['GREEN'], main_bottle, 2, border_radius=4)
-                    
-                    # Bottle neck
-                    neck_rect = pygame.Rect(center_x - 4, center_y - 12, 8, 8)
-                    pygame.draw.rect(self.screen, COLORS['DARK_GREEN'], neck_rect)
-                    pygame.draw.rect(self.screen, COLORS['GREEN'], neck_rect, 2)
-                    
-                    # Cork with wood texture
-                    cork_rect = pygame.Rect(center_x - 5, center_y - 16, 10, 6)
-                    pygame.draw.rect(self.screen, COLORS['BROWN'], cork_rect, border_radius=2)
-                    pygame.draw.line(self.screen, COLORS['DARK_BROWN'],
-                                   (center_x - 3, center_y - 15), (center_x + 3, center_y - 15), 1)
-                    pygame.draw.line(self.screen, COLORS['DARK_BROWN'],
-                                   (center_x - 2, center_y - 13), (center_x + 2, center_y - 13), 1)
-                    
-                    # Red liquid with bubbles
-                    liquid_rect = pygame.Rect(center_x - 6, center_y - 2, 12, 14)
-                    pygame.draw.rect(self.screen, COLORS['RED'], liquid_rect, border_radius=2)
-                    # Liquid surface with meniscus
-                    pygame.draw.ellipse(self.screen, COLORS['LIGHT_RED'], 
-                                      pygame.Rect(center_x - 6, center_y - 4, 12, 4))
-                    # Bubbles for magical effect
-                    bubble_positions = [(center_x - 2, center_y + 2), (center_x + 3, center_y + 6)]
-                    for bx, by in bubble_positions:
-                        pygame.draw.circle(self.screen, COLORS['LIGHT_RED'], (bx, by), 2)
-                        pygame.draw.circle(self.screen, COLORS['WHITE'], (bx - 1, by - 1), 1)
-                    
-                    # Paper label with cross
-                    label_rect = pygame.Rect(center_x - 5, center_y + 1, 10, 8)
-                    pygame.draw.rect(self.screen, COLORS['WHITE'], label_rect, border_radius=1)
-                    pygame.draw.rect(self.screen, COLORS['GRAY'], label_rect, 1, border_radius=1)
-                    # Red medical cross
-                    pygame.draw.line(self.screen, COLORS['RED'], 
-                                   (center_x, center_y + 3), (center_x, center_y + 7), 2)
-                    pygame.draw.line(self.screen, COLORS['RED'],
-                                   (center_x - 2, center_y + 5), (center_x + 2, center_y + 5), 2)
-                    
-                    # Glass shine effect
-                    shine_rect = pygame.Rect(center_x - 6, center_y - 4, 3, 12)
-                    pygame.draw.rect(self.screen, COLORS['WHITE'], shine_rect)
-                
-                elif item.type == ItemType.KEY:
-                    # Draw detailed key
-                    center_x = screen_x + self.cell_size // 2
-                    center_y = screen_y + self.cell_size // 2
-                    
-                    # Key shaft (body)
-                    shaft_rect = pygame.Rect(center_x - 12, center_y - 2, 18, 4)
-                    pygame.draw.rect(self.screen, KEY_COLOR, shaft_rect, border_radius=2)
-                    pygame.draw.rect(self.screen, COLORS['GOLD'], shaft_rect, 2, border_radius=2)
-                    
-                    # Key head (circular with hole)
-                    head_center = (center_x - 10, center_y)
-                    pygame.draw.circle(self.screen, KEY_COLOR, head_center, 8)
-                    pygame.draw.circle(self.screen, COLORS['GOLD'], head_center, 8, 2)
-                    # Inner hole
-                    pygame.draw.circle(self.screen, COLORS['BLACK'], head_center, 4)
-                    pygame.draw.circle(self.screen, COLORS['GOLD'], head_center, 4, 1)
-                    
-                    # Key teeth (more detailed)
-                    tooth_positions = [
-                        pygame.Rect(center_x + 4, center_y - 4, 3, 4),
-                        pygame.Rect(center_x + 4, center_y + 1, 5, 3),
-                        pygame.Rect(center_x + 2, center_y + 1, 2, 2)
-                    ]
-                    for tooth in tooth_positions:
-                        pygame.draw.rect(self.screen, KEY_COLOR, tooth)
-                        pygame.draw.rect(self.screen, COLORS['GOLD'], tooth, 1)
-                    
-                    # Metallic shine on shaft
-                    shine_line = pygame.Rect(center_x - 10, center_y - 1, 14, 1)
-                    pygame.draw.rect(self.screen, COLORS['WHITE'], shine_line)
-                    
-                    # Ring for keychain
-                    ring_center = (center_x - 16, center_y)
-                    pygame.draw.circle(self.screen, KEY_COLOR, ring_center, 4)
-                    pygame.draw.circle(self.screen, COLORS['GOLD'], ring_center, 4, 2)
-                    pygame.draw.circle(self.screen, COLORS['BLACK'], ring_center, 2)
-                
-                elif item.type == ItemType.SWORD:
-                    # Draw detailed sword
-                    center_x = screen_x + self.cell_size // 2
-                    center_y = screen_y + self.cell_size // 2
-                    
-                    # Sword blade (tapered)
-                    blade_points = [
-                        (center_x, center_y - 14),        # Tip
-                        (center_x - 3, center_y + 6),    # Left edge
-                        (center_x + 3, center_y + 6)     # Right edge
-                    ]
-                    pygame.draw.polygon(self.screen, COLORS['SILVER'], blade_points)
-                    pygame.draw.polygon(self.screen, COLORS['WHITE'], blade_points, 2)
-                    
-                    # Fuller (blood groove) in blade
-                    fuller_points = [
-                        (center_x, center_y - 12),
-                        (center_x - 1, center_y + 4),
-                        (center_x + 1, center_y + 4)
-                    ]
-                    pygame.draw.polygon(self.screen, COLORS['GRAY'], fuller_points)
-                    
-                    # Cross guard (hilt)
-                    hilt_rect = pygame.Rect(center_x - 8, center_y + 6, 16, 3)
-                    pygame.draw.rect(self.screen, COLORS['GOLD'], hilt_rect, border_radius=1)
-                    pygame.draw.rect(self.screen, COLORS['YELLOW'], hilt_rect, 1, border_radius=1)
-                    
-                    # Handle (grip)
-                    handle_rect = pygame.Rect(center_x - 2, center_y + 9, 4, 8)
-                    pygame.draw.rect(self.screen, COLORS['BROWN'], handle_rect)
-                    # Handle wrapping texture
-                    for i in range(3):
-                        y_pos = center_y + 10 + i * 2
-                        pygame.draw.line(self.screen, COLORS['DARK_BROWN'],
-                                       (center_x - 2, y_pos), (center_x + 2, y_pos), 1)
-                    
-                    # Pommel (end cap)
-                    pommel_center = (center_x, center_y + 18)
-                    pygame.draw.circle(self.screen, COLORS['GOLD'], pommel_center, 3)
-                    pygame.draw.circle(self.screen, COLORS['YELLOW'], pommel_center, 3, 1)
-                    pygame.draw.circle(self.screen, COLORS['WHITE'], pommel_center, 1)
-                    
-                    # Blade shine effects
-                    shine_points = [
-                        (center_x - 1, center_y - 12),
-                        (center_x - 1, center_y + 2)
-                    ]
-                    pygame.draw.line(self.screen, COLORS['WHITE'], shine_points[0], shine_points[1], 1)
-                
-                elif item.type == ItemType.SHIELD:
-                    # Draw detailed medieval shield
-                    center_x = screen_x + self.cell_size // 2
-                    center_y = screen_y + self.cell_size // 2
-                    
-                    # Shield shape (kite shield)
-                    shield_points = [
-                        (center_x, center_y - 12),        # Top
-                        (center_x - 8, center_y - 8),    # Top left
-                        (center_x - 10, center_y + 2),   # Mid left
-                        (center_x - 6, center_y + 10),   # Bottom left
-                        (center_x, center_y + 14),       # Bottom point
-                        (center_x + 6, center_y + 10),   # Bottom right
-                        (center_x + 10, center_y + 2),   # Mid right
-                        (center_x + 8, center_y - 8)     # Top right
-                    ]
-                    pygame.draw.polygon(self.screen, COLORS['BLUE'], shield_points)
-                    pygame.draw.polygon(self.screen, COLORS['SILVER'], shield_points, 3)
-                    
-                    # Shield boss (center metal dome)
-                    pygame.draw.circle(self.screen, COLORS['SILVER'], (center_x, center_y), 6)
-                    pygame.draw.circle(self.screen, COLORS['GRAY'], (center_x, center_y), 6, 2)
-                    pygame.draw.circle(self.screen, COLORS['WHITE'], (center_x - 2, center_y - 2), 2)
-                    
-                    # Shield rim studs
-                    stud_positions = [
-                        (center_x - 6, center_y - 6), (center_x + 6, center_y - 6),
-                        (center_x - 8, center_y + 2), (center_x + 8, center_y + 2),
-                        (center_x - 4, center_y + 8), (center_x + 4, center_y + 8)
-                    ]
-                    for stud_pos in stud_positions:
-                        pygame.draw.circle(self.screen, COLORS['SILVER'], stud_pos, 2)
-                        pygame.draw.circle(self.screen, COLORS['WHITE'], stud_pos, 1)
-                    
-                    # Heraldic cross design
-                    pygame.draw.line(self.screen, COLORS['WHITE'],
-                                   (center_x, center_y - 8), (center_x, center_y + 8), 2)
-                    pygame.draw.line(self.screen, COLORS['WHITE'],
-                                   (center_x - 6, center_y), (center_x + 6, center_y), 2)
-                    
-                    # Shield handle (visible from side)
-                    handle_rect = pygame.Rect(center_x + 8, center_y - 3, 3, 6)
-                    pygame.draw.rect(self.screen, COLORS['BROWN'], handle_rect)
-                    pygame.draw.rect(self.screen, COLORS['DARK_BROWN'], handle_rect, 1)
+                    sprite = sprite[item.value >= 100]
+                    treasure_centers.append((screen_x + cell_size // 2, screen_y + cell_size // 2))
+                item_blits.append((sprite, (screen_x, screen_y)))
         
-        # Draw monsters with enhanced graphics - unique sprites per type
-        for monster in self.monsters:
-            if (monster.alive and 
-                (monster.x, monster.y) in self.player.visited_cells):
-                
-                screen_x = monster.real_x * self.cell_size - self.camera.x
-                screen_y = monster.real_y * self.cell_size - self.camera.y
-                center_x = screen_x + self.cell_size // 2
-                center_y = screen_y + self.cell_size // 2
-                
-                # Get time for animations
-                tick = pygame.time.get_ticks()
-                
-                # Draw skeleton enemy with animated attacks
-                body_size = monster.size
-                
-                # Base color depends on attack state
+        self.screen.blits(item_blits, doreturn=False)
+        
+        # The screen, rect drawing and frame time are bound to locals once
+        # rather than looked up again for every sparkle and health bar below
+        screen = self.screen
+        draw_rect = pygame.draw.rect
+        tick = pygame.time.get_ticks()
+        
+        # Sparkle effect, stamped from one pre-rendered dot in a single call
+        sparkle_sprite = self._sparkle_sprite
+        sparkle_blits = []
+        for center_x, center_y in treasure_centers:
+            sparkle_positions = [
+                (center_x - 10, center_y - 8), (center_x + 12, center_y - 6),
+                (center_x - 8, center_y + 10), (center_x + 8, center_y + 12)
+            ]
+            for i, (sparkle_x, sparkle_y) in enumerate(sparkle_positions):
+                if (tick + i * 200) % 1000 < 500:  # Blinking effect
+                    sparkle_blits.append((sparkle_sprite, (sparkle_x - 2, sparkle_y - 2)))
+        screen.blits(sparkle_blits, doreturn=False)
+        
+        # Draw monsters from pre-rendered sprites, one per distinct appearance,
+        # in one batched blits() call; health bars go on top afterwards
+        monster_sprites = self._monster_cache
+        monster_blits = []
+        health_bars = []
+        # Filter to living, on-screen monsters on revealed cells in one pass up
+        # front (the cheap visible-range compares run before the mask lookup)
+        visible_monsters = [monster for monster in self.monsters
+                            if monster.alive and
+                            start_x <= monster.x < end_x and start_y <= monster.y < end_y and
+                            visited_mask[monster.y][monster.x]]
+        
+        # Body color and eye glow of the attack states that override the
+        # idle look, looked up per monster instead of comparing states. The
+        # windup flash only depends on the time, so it is worked out once a
+        # frame: red, stepped through 16 shades so every frame of the flash
+        # is a cached sprite (warning for parry)
+        flash_phase = tick % 400 // 25 * 25
+        flash_intensity = int(abs(flash_phase - 200) / 200 * 255)
+        attack_looks = {
+            "windup": ((255, flash_intensity, flash_intensity), True),
+            "attacking": ((255, 100, 100), True),  # Red during attack
+        }
+        
+        for monster in visible_monsters:
+            screen_x = monster.real_x * cell_size - camera_x
+            screen_y = monster.real_y * cell_size - camera_y
+            
+            # Base color depends on attack state
+            looks = attack_looks.get(monster.attack_state)
+            if looks is not None:
+                base_color, glowing_eyes = looks
+            else:
+                glowing_eyes = False
                 base_color = (240, 240, 220)  # Bone white
-                if monster.attack_state == "windup":
-                    # Flash red during windup (warning for parry)
-                    flash_intensity = int(abs(tick % 400 - 200) / 200 * 255)
-                    base_color = (255, flash_intensity, flash_intensity)
-                elif monster.attack_state == "attacking":
-                    base_color = (255, 100, 100)  # Red during attack
-                elif monster.flash_timer > 0:
+                if monster.flash_timer > 0:
                     base_color = (255, 150, 150)  # Damage flash
-                
-                # Skeleton body (main skull/torso)
-                pygame.draw.ellipse(self.screen, base_color, 
-                                  pygame.Rect(center_x - body_size//2, center_y - body_size//2, 
-                                            body_size, body_size))
-                pygame.draw.ellipse(self.screen, (150, 150, 130), 
-                                  pygame.Rect(center_x - body_size//2, center_y - body_size//2, 
-                                            body_size, body_size), 2)
-                
-                # Skull details
-                # Eye sockets
-                eye_size = max(2, body_size // 6)
-                pygame.draw.circle(self.screen, COLORS['BLACK'], 
-                                 (center_x - body_size//4, center_y - body_size//6), eye_size)
-                pygame.draw.circle(self.screen, COLORS['BLACK'], 
-                                 (center_x + body_size//4, center_y - body_size//6), eye_size)
-                
-                # Glowing red eyes
-                if monster.attack_state in ["windup", "attacking"]:
-                    pygame.draw.circle(self.screen, COLORS['RED'], 
-                                     (center_x - body_size//4, center_y - body_size//6), eye_size//2)
-                    pygame.draw.circle(self.screen, COLORS['RED'], 
-                                     (center_x + body_size//4, center_y - body_size//6), eye_size//2)
-                
-                # Nasal cavity
-                nasal_points = [
-                    (center_x, center_y),
-                    (center_x - 2, center_y + 4),
-                    (center_x + 2, center_y + 4)
-                ]
-                pygame.draw.polygon(self.screen, COLORS['BLACK'], nasal_points)
-                
-                # Jaw/mouth
-                jaw_width = body_size // 2
-                jaw_y = center_y + body_size//4
-                pygame.draw.arc(self.screen, COLORS['BLACK'], 
-                              pygame.Rect(center_x - jaw_width//2, jaw_y - 2, jaw_width, 6), 
-                              0, 3.14159, 2)
-                
-                # Bone joints/shoulders
-                joint_size = max(2, body_size // 8)
-                pygame.draw.circle(self.screen, (200, 200, 180), 
-                                 (center_x - body_size//2 - 2, center_y), joint_size)
-                pygame.draw.circle(self.screen, (200, 200, 180), 
-                                 (center_x + body_size//2 + 2, center_y), joint_size)
-
-                
-                # Health bar for monsters with >1 HP
-                if monster.max_hp > 1:
-                    bar_width = self.cell_size - 8
-                    bar_height = 6
-                    bar_x = screen_x + 4
-                    bar_y = screen_y - 12
-                    
-                    # Background
-                    pygame.draw.rect(self.screen, COLORS['BLACK'], 
-                                   pygame.Rect(bar_x - 1, bar_y - 1, bar_width + 2, bar_height + 2))
-                    pygame.draw.rect(self.screen, COLORS['DARK_GRAY'], 
-                                   pygame.Rect(bar_x, bar_y, bar_width, bar_height))
-                    
-                    # Health
-                    health_width = int((monster.hp / monster.max_hp) * bar_width)
-                    health_color = COLORS['GREEN']
-                    if monster.hp / monster.max_hp < 0.3:
-                        health_color = COLORS['RED']
-                    elif monster.hp / monster.max_hp < 0.6:
-                        health_color = COLORS['ORANGE']
-                    
-                    pygame.draw.rect(self.screen, health_color, 
-                                   pygame.Rect(bar_x, bar_y, health_width, bar_height))
+            
+            # Draw skeleton enemy with animated attacks from its cached sprite
+            sprite_key = (monster.size, base_color, glowing_eyes)
+            sprite = monster_sprites.get(sprite_key)
+            if sprite is None:
+                sprite = monster_sprites[sprite_key] = self._render_skeleton(*sprite_key)
+            monster_blits.append((sprite, (screen_x, screen_y)))
+            
+            # Health bar for monsters with >1 HP
+            if monster.max_hp > 1:
+                health_bars.append((monster, screen_x, screen_y))
+        
+        self.screen.blits(monster_blits, doreturn=False)
+        
+        # Health bar rects relative to a monster's cell origin, built once and
+        # moved into place per monster
+        bar_width = self.cell_size - 8
+        bar_height = 6
+        bar_border = pygame.Rect(3, -13, bar_width + 2, bar_height + 2)
+        bar_track = pygame.Rect(4, -12, bar_width, bar_height)
+        black = COLORS['BLACK']
+        dark_gray = COLORS['DARK_GRAY']
+        green = COLORS['GREEN']
+        red = COLORS['RED']
+        orange = COLORS['ORANGE']
+        for monster, screen_x, screen_y in health_bars:
+            # Background
+            draw_rect(screen, black, bar_border.move(screen_x, screen_y))
+            health_rect = bar_track.move(screen_x, screen_y)
+            draw_rect(screen, dark_gray, health_rect)
+            
+            # Health
+            health_ratio = monster.hp / monster.max_hp
+            health_rect.width = int(health_ratio * bar_width)
+            health_color = green
+            if health_ratio < 0.3:
+                health_color = red
+            elif health_ratio < 0.6:
+                health_color = orange
+            
+            draw_rect(screen, health_color, health_rect)
         
         # Draw player with enhanced graphics
         player_screen_x = self.player.real_x * self.cell_size - self.camera.x
@@ -2043,157 +2375,124 @@ class EnhancedMazeGame:
         player_color = PLAYER_COLOR
         flash_alpha = False
         if self.player.damage_flash > 0:
-            player_color = COLORS['RED']
+            player_color = red
         elif self.player.heal_flash > 0:
-            player_color = COLORS['GREEN']
+            player_color = green
         
         # Invincibility flashing
         if self.player.invincibility_frames > 0:
             if (self.player.invincibility_frames // 4) % 2 == 0:
                 flash_alpha = True
         
-        # Define body size for player rendering
-        body_size = 24
-        
         if not flash_alpha:
-            # Draw player as a knight-like figure
-            # Body (circle)
-            pygame.draw.circle(self.screen, player_color, (center_x, center_y), body_size // 2)
-            pygame.draw.circle(self.screen, COLORS['WHITE'], (center_x, center_y), body_size // 2, 3)
-            
-            # Helmet/face details
-            pygame.draw.circle(self.screen, COLORS['BLUE'], (center_x - 4, center_y - 2), 2)  # Left eye
-            pygame.draw.circle(self.screen, COLORS['BLUE'], (center_x + 4, center_y - 2), 2)  # Right eye
-            
-            # Armor shine effect
-            shine_points = [
-                (center_x - 4, center_y - 6),
-                (center_x + 2, center_y - 4)
-            ]
-            for point in shine_points:
-                pygame.draw.circle(self.screen, COLORS['WHITE'], point, 2)
+            # Draw player as a knight-like figure from its cached sprite, one
+            # blit instead of five circles per frame
+            knight = self._player_cache.get(player_color)
+            if knight is None:
+                knight = self._player_cache[player_color] = self._render_player(player_color)
+            screen.blit(knight, (player_screen_x, player_screen_y))
         
         # Draw sword swing
         if self.player.current_swing and self.player.current_swing.active:
             swing_positions = self.player.current_swing.get_swing_area()
-            for swing_x, swing_y in swing_positions:
-                swing_screen_x = swing_x * self.cell_size - self.camera.x
-                swing_screen_y = swing_y * self.cell_size - self.camera.y
-                
-                # Draw swing arc effect
-                swing_alpha = int(255 * (1.0 - self.player.current_swing.frame / self.player.current_swing.duration))
-                swing_color = (*COLORS['YELLOW'], swing_alpha)
-                swing_rect = pygame.Rect(swing_screen_x, swing_screen_y, self.cell_size, self.cell_size)
-                
+            
+            # Draw swing arc effect; the outline only varies with its fade, so
+            # each alpha level is rendered once and reused for every swept cell
+            swing_alpha = int(255 * (1.0 - self.player.current_swing.frame / self.player.current_swing.duration))
+            swing_surface = self._swing_cache.get(swing_alpha)
+            if swing_surface is None:
                 # Create surface for alpha blending
                 swing_surface = pygame.Surface((self.cell_size, self.cell_size), pygame.SRCALPHA)
+                swing_color = (*COLORS['YELLOW'], swing_alpha)
                 pygame.draw.rect(swing_surface, swing_color, (0, 0, self.cell_size, self.cell_size), 3)
-                self.screen.blit(swing_surface, (swing_screen_x, swing_screen_y))
+                self._swing_cache[swing_alpha] = swing_surface
+            
+            self.screen.blits([(swing_surface, (swing_x * self.cell_size - self.camera.x,
+                                                swing_y * self.cell_size - self.camera.y))
+                               for swing_x, swing_y in swing_positions], doreturn=False)
         
-        # Draw parry indicator
+        # Draw parry indicator (a fading ring, pre-rendered once per fade level)
         if self.player.is_parrying():
             parry_radius = 30
             parry_alpha = int(255 * (self.player.parry_timer / self.player.parry_duration))
-            parry_color = (*COLORS['BLUE'], parry_alpha)
-            
-            # Create surface for alpha blending
-            parry_surface = pygame.Surface((parry_radius * 2, parry_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(parry_surface, parry_color, (parry_radius, parry_radius), parry_radius, 4)
+            parry_surface = self._parry_cache.get(parry_alpha)
+            if parry_surface is None:
+                # Create surface for alpha blending
+                parry_color = (*COLORS['BLUE'], parry_alpha)
+                parry_surface = pygame.Surface((parry_radius * 2, parry_radius * 2), pygame.SRCALPHA)
+                pygame.draw.circle(parry_surface, parry_color, (parry_radius, parry_radius), parry_radius, 4)
+                self._parry_cache[parry_alpha] = parry_surface
             self.screen.blit(parry_surface, (center_x - parry_radius, center_y - parry_radius))
         
         # Health indicator around player (optional visual feedback)
         if self.player.hp < self.player.max_hp * 0.3:
-            # Low health - red glow
-            for i in range(3):
-                glow_radius = body_size // 2 + 2 + i
-                glow_alpha = 50 - i * 15
-                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (*COLORS['RED'], glow_alpha), 
-                                 (glow_radius, glow_radius), glow_radius)
-                self.screen.blit(glow_surface, (center_x - glow_radius, center_y - glow_radius))
+            # Low health - red glow, from its pre-rendered rings
+            self.screen.blits([(glow_surface, (center_x - glow_radius, center_y - glow_radius))
+                               for glow_surface, glow_radius in self._low_hp_glow],
+                              doreturn=False)
     
-    def draw_minimap(self):
-        """Draw enhanced minimap with room exploration tracking"""
+    def _layout_minimap_frame(self):
+        """
+        Lay out the rectangles of the minimap's frame, which never move.
+        
+        Returns:
+            Tuple of (title background, shadow, background, inner glow,
+            border) Rects; the border is relative to the minimap surface
+        """
         # Position minimap within the UI area, not overlapping
         minimap_x = WINDOW_WIDTH - self.ui_width + 10  # Inside UI area
         minimap_y = 40  # Leave space for title
+        size = self.minimap_size
+        return (
+            pygame.Rect(minimap_x - 5, minimap_y - 35, size + 10, 30),
+            pygame.Rect(minimap_x - 3, minimap_y - 3, size + 16, size + 16),
+            pygame.Rect(minimap_x - 5, minimap_y - 5, size + 10, size + 10),
+            pygame.Rect(minimap_x - 3, minimap_y - 3, size + 6, size + 6),
+            pygame.Rect(0, 0, size, size),
+        )
+    
+    def _render_minimap_base(self, scale: float, offset_x: float, offset_y: float):
+        """
+        Render the static layer of the minimap: rooms, room icons, doors and markers.
         
-        # Draw minimap title with better background
-        title_text = self.small_font.render("MAP", True, COLORS['WHITE'])
-        title_pos = (minimap_x + (self.minimap_size - title_text.get_width()) // 2, minimap_y - 28)
-        title_bg = pygame.Rect(minimap_x - 5, minimap_y - 35, 
-                              self.minimap_size + 10, 30)
-        pygame.draw.rect(self.screen, (30, 25, 35), title_bg, border_radius=5)
-        pygame.draw.rect(self.screen, COLORS['GOLD'], title_bg, 2, border_radius=5)
-        self.screen.blit(title_text, title_pos)
-        
-        # Draw background for minimap with shadow effect
-        shadow_rect = pygame.Rect(minimap_x - 3, minimap_y - 3, 
-                                 self.minimap_size + 16, self.minimap_size + 16)
-        pygame.draw.rect(self.screen, COLORS['BLACK'], shadow_rect, border_radius=8)
-        
-        bg_rect = pygame.Rect(minimap_x - 5, minimap_y - 5, 
-                             self.minimap_size + 10, self.minimap_size + 10)
-        pygame.draw.rect(self.screen, (15, 15, 20), bg_rect, border_radius=6)
-        pygame.draw.rect(self.screen, COLORS['GOLD'], bg_rect, 3, border_radius=6)
-        
-        # Inner glow effect
-        inner_glow = pygame.Rect(minimap_x - 3, minimap_y - 3, 
-                                self.minimap_size + 6, self.minimap_size + 6)
-        pygame.draw.rect(self.screen, (60, 50, 40), inner_glow, 1, border_radius=5)
-        
-        # Create minimap surface
+        Args:
+            scale: Minimap pixels per maze cell
+            offset_x: Horizontal offset that centers the maze in the minimap
+            offset_y: Vertical offset that centers the maze in the minimap
+            
+        Returns:
+            Minimap-sized Surface for draw_minimap to copy and draw entities onto
+        """
         minimap_surface = pygame.Surface((self.minimap_size, self.minimap_size))
         minimap_surface.fill(COLORS['BLACK'])  # Solid background
         
-        # Calculate scale
-        maze_width = len(self.maze[0])
-        maze_height = len(self.maze)
-        scale_x = (self.minimap_size - 4) / maze_width  # Leave border space
-        scale_y = (self.minimap_size - 4) / maze_height
-        scale = min(scale_x, scale_y)
-        
-        # Center the maze in minimap
-        maze_pixel_width = maze_width * scale
-        maze_pixel_height = maze_height * scale
-        offset_x = (self.minimap_size - maze_pixel_width) // 2
-        offset_y = (self.minimap_size - maze_pixel_height) // 2
-        
         # First, draw all explored rooms with a distinct color
-        all_rooms = []
-        if hasattr(self, 'rooms'):
-            all_rooms.extend(self.rooms)
-        if hasattr(self, 'treasure_rooms'):
-            all_rooms.extend(self.treasure_rooms)
-        if hasattr(self, 'shop_rooms'):
-            all_rooms.extend(self.shop_rooms)
-        if hasattr(self, 'secret_rooms'):
-            all_rooms.extend(self.secret_rooms)
-        if hasattr(self, 'super_secret_rooms'):
-            all_rooms.extend(self.super_secret_rooms)
-        
-        # Collect adjacent unexplored rooms (rooms connected to visited rooms via doors)
-        adjacent_unexplored_rooms = set()
-        for room in all_rooms:
-            if room.visited:
-                # Check all doors of this visited room
-                for door_x, door_y in room.doors:
-                    # Find the room on the other side of this door
-                    for other_room in all_rooms:
-                        if not other_room.visited and (door_x, door_y) in other_room.doors:
-                            adjacent_unexplored_rooms.add(other_room)
+        all_rooms = self.all_rooms
+        
+        # Collect adjacent unexplored rooms (rooms connected to visited rooms via
+        # doors); the door table names both rooms a door joins
+        door_rooms = self.door_rooms
+        adjacent_unexplored_rooms = {other_room
+                                     for room in all_rooms if room.visited
+                                     for door in room.doors
+                                     for other_room in door_rooms[door]
+                                     if not other_room.visited}
+        
+        # Minimap rectangle of every room that shows up, worked out once here
+        # rather than again by each pass below
+        room_rects = {room: pygame.Rect(int(offset_x + room.left * scale),
+                                        int(offset_y + room.top * scale),
+                                        int(room.width * scale),
+                                        int(room.height * scale))
+                      for room in all_rooms
+                      if room.visited or room in adjacent_unexplored_rooms}
         
         # Draw adjacent unexplored rooms in grey first
         for room in adjacent_unexplored_rooms:
             room_color = (50, 50, 50)  # Dark grey for unexplored adjacent rooms
             
             # Draw the room rectangle
-            mini_left = int(offset_x + room.left * scale)
-            mini_top = int(offset_y + room.top * scale)
-            mini_width = int((room.right - room.left) * scale)
-            mini_height = int((room.bottom - room.top) * scale)
-            
-            room_rect = pygame.Rect(mini_left, mini_top, mini_width, mini_height)
+            room_rect = room_rects[room]
             minimap_surface.fill(room_color, room_rect)
             
             # Add border to make rooms distinct (darker border for unexplored)
@@ -2206,20 +2505,15 @@ class EnhancedMazeGame:
                 room_color = (80, 80, 80)  # Grey for all rooms
                 
                 # Draw the room rectangle
-                mini_left = int(offset_x + room.left * scale)
-                mini_top = int(offset_y + room.top * scale)
-                mini_width = int((room.right - room.left) * scale)
-                mini_height = int((room.bottom - room.top) * scale)
-                
-                room_rect = pygame.Rect(mini_left, mini_top, mini_width, mini_height)
+                room_rect = room_rects[room]
                 minimap_surface.fill(room_color, room_rect)
                 
                 # Add border to make rooms distinct
                 pygame.draw.rect(minimap_surface, COLORS['WHITE'], room_rect, 1)
                 
                 # Draw icon for special room types only (normal rooms have no icon)
-                center_x = mini_left + mini_width // 2
-                center_y = mini_top + mini_height // 2
+                center_x = room_rect.x + room_rect.width // 2
+                center_y = room_rect.y + room_rect.height // 2
                 
                 # Use PixelArtRenderer from PixelArtAssets module
                 PixelArtRenderer.draw_room_icon(minimap_surface, center_x, center_y, 
@@ -2228,98 +2522,115 @@ class EnhancedMazeGame:
         
         # Draw icons on adjacent unexplored rooms (dimmed versions)
         for room in adjacent_unexplored_rooms:
-            mini_left = int(offset_x + room.left * scale)
-            mini_top = int(offset_y + room.top * scale)
-            mini_width = int((room.right - room.left) * scale)
-            mini_height = int((room.bottom - room.top) * scale)
-            
-            center_x = mini_left + mini_width // 2
-            center_y = mini_top + mini_height // 2
+            room_rect = room_rects[room]
+            center_x = room_rect.x + room_rect.width // 2
+            center_y = room_rect.y + room_rect.height // 2
             
             # Draw dimmed version of icon using PixelArtRenderer
             PixelArtRenderer.draw_room_icon(minimap_surface, center_x, center_y,
                                            room.room_type, dimmed=True)
         
-        # Draw maze details on top (walls, doors, special markers)
-        for y, row in enumerate(self.maze):
-            for x, cell in enumerate(row):
-                mini_x = int(offset_x + x * scale)
-                mini_y = int(offset_y + y * scale)
-                mini_size = max(1, int(scale))
-                
-                mini_rect = pygame.Rect(mini_x, mini_y, mini_size, mini_size)
-                
-                # Only draw specific features (doors, markers)
-                if cell == 'D':  # Locked doors - show if adjacent to visited room or unexplored adjacent room
-                    # Check if any adjacent room is visited or is an unexplored adjacent room
-                    show_door = False
-                    for room in all_rooms:
-                        if (room.visited or room in adjacent_unexplored_rooms) and (x, y) in room.doors:
-                            show_door = True
-                            break
-                    
-                    if show_door:
-                        minimap_surface.fill(COLORS['DARK_BROWN'], mini_rect)
-                        pygame.draw.rect(minimap_surface, COLORS['GOLD'], mini_rect, 1)
-                
-                elif cell == 'R':  # Closed room door - show if adjacent to visited room or unexplored adjacent room
-                    # Check if any adjacent room is visited or is an unexplored adjacent room
-                    show_door = False
-                    for room in all_rooms:
-                        if (room.visited or room in adjacent_unexplored_rooms) and (x, y) in room.doors:
-                            show_door = True
-                            break
-                    
-                    if show_door:
-                        minimap_surface.fill(COLORS['RED'], mini_rect)
-                        pygame.draw.rect(minimap_surface, COLORS['DARK_BROWN'], mini_rect, 1)
-                
-                elif cell == 'O':  # Open room door - show if adjacent to visited room or unexplored adjacent room
-                    # Check if any adjacent room is visited or is an unexplored adjacent room
-                    show_door = False
-                    for room in all_rooms:
-                        if (room.visited or room in adjacent_unexplored_rooms) and (x, y) in room.doors:
-                            show_door = True
-                            break
-                    
-                    if show_door:
-                        minimap_surface.fill(COLORS['GREEN'], mini_rect)
-                        pygame.draw.rect(minimap_surface, COLORS['BROWN'], mini_rect, 1)
-                
-                elif cell == 'S':  # Start marker
-                    minimap_surface.fill(START_COLOR, mini_rect)
-                
-                elif cell == 'E':  # End marker - only show if in visited room
-                    for room in all_rooms:
-                        if room.visited and room.collidepoint(x, y):
-                            minimap_surface.fill(END_COLOR, mini_rect)
-                            break
+        # Draw maze details on top (doors, special markers). Only door, start
+        # and end cells ever leave a mark, so visit just those cells instead of
+        # the whole grid: the room doors come from the door table (locked doors
+        # belong to no room's door list, so they never show), and the start and
+        # end markers sit at the positions found when the maze was generated
+        mini_size = max(1, int(scale))
+        for (x, y), joined_rooms in door_rooms.items():
+            cell = self.maze[y][x]
+            if cell not in self.MINIMAP_DOOR_COLORS:
+                continue
+            
+            # Show doors adjacent to a visited room or an unexplored adjacent room
+            show_door = any(room.visited or room in adjacent_unexplored_rooms
+                            for room in joined_rooms)
+            
+            if show_door:
+                fill_color, border_color = self.MINIMAP_DOOR_COLORS[cell]
+                mini_rect = pygame.Rect(int(offset_x + x * scale), int(offset_y + y * scale),
+                                        mini_size, mini_size)
+                minimap_surface.fill(fill_color, mini_rect)
+                pygame.draw.rect(minimap_surface, border_color, mini_rect, 1)
+        
+        start_x, start_y = self.start_pos
+        if self.maze[start_y][start_x] == START:  # Start marker
+            minimap_surface.fill(START_COLOR, pygame.Rect(int(offset_x + start_x * scale),
+                                                          int(offset_y + start_y * scale),
+                                                          mini_size, mini_size))
+        
+        end_x, end_y = self.end_pos
+        if self.maze[end_y][end_x] == END:  # End marker - only show if in visited room
+            for room in all_rooms:
+                if room.visited and room.collidepoint(end_x, end_y):
+                    minimap_surface.fill(END_COLOR, pygame.Rect(int(offset_x + end_x * scale),
+                                                                int(offset_y + end_y * scale),
+                                                                mini_size, mini_size))
+                    break
+        return minimap_surface
+    
+    def draw_minimap(self):
+        """Draw enhanced minimap with room exploration tracking"""
+        # Position minimap within the UI area, not overlapping
+        minimap_x = WINDOW_WIDTH - self.ui_width + 10  # Inside UI area
+        minimap_y = 40  # Leave space for title
+        
+        # Frame rectangles, laid out once by _layout_minimap_frame
+        title_bg, shadow_rect, bg_rect, inner_glow, border_rect = self._minimap_frame
+        
+        # Draw minimap title with better background
+        title_text = self._render_text(self.small_font, "MAP", COLORS['WHITE'])
+        title_pos = (minimap_x + (self.minimap_size - title_text.get_width()) // 2, minimap_y - 28)
+        pygame.draw.rect(self.screen, (30, 25, 35), title_bg, border_radius=5)
+        pygame.draw.rect(self.screen, COLORS['GOLD'], title_bg, 2, border_radius=5)
+        self.screen.blit(title_text, title_pos)
+        
+        # Draw background for minimap with shadow effect
+        pygame.draw.rect(self.screen, COLORS['BLACK'], shadow_rect, border_radius=8)
+        
+        pygame.draw.rect(self.screen, (15, 15, 20), bg_rect, border_radius=6)
+        pygame.draw.rect(self.screen, COLORS['GOLD'], bg_rect, 3, border_radius=6)
+        
+        # Inner glow effect
+        pygame.draw.rect(self.screen, (60, 50, 40), inner_glow, 1, border_radius=5)
+        
+        # Calculate scale
+        maze_width = self.maze_width
+        maze_height = self.maze_height
+        scale_x = (self.minimap_size - 4) / maze_width  # Leave border space
+        scale_y = (self.minimap_size - 4) / maze_height
+        scale = min(scale_x, scale_y)
+        
+        # Center the maze in minimap
+        maze_pixel_width = maze_width * scale
+        maze_pixel_height = maze_height * scale
+        offset_x = (self.minimap_size - maze_pixel_width) // 2
+        offset_y = (self.minimap_size - maze_pixel_height) // 2
+        
+        # Rooms, doors and markers only change when a room is first visited or
+        # doors open/close, so they are redrawn into a cached surface only then
+        if self._minimap_dirty:
+            self._minimap_cache = self._render_minimap_base(scale, offset_x, offset_y)
+            self._minimap_dirty = False
+        minimap_surface = self._minimap_cache.copy()
+        # "Is this cell in a visited room?" is one lookup in the visited-room mask
+        visited_room_mask = self.visited_room_mask
+        
+        # Item and monster markers share one size, worked out once
+        marker_size = max(2, int(scale))
         
         # Draw items on minimap (only in visited rooms)
         for item in self.items:
-            if not item.collected:
-                # Check if item is in a visited room
-                for room in all_rooms:
-                    if room.visited and room.collidepoint(item.x, item.y):
-                        mini_x = int(offset_x + item.x * scale)
-                        mini_y = int(offset_y + item.y * scale)
-                        item_size = max(2, int(scale))
-                        minimap_surface.fill(TREASURE_COLOR, 
-                                           pygame.Rect(mini_x, mini_y, item_size, item_size))
-                        break
+            if not item.collected and visited_room_mask[item.y][item.x]:
+                mini_x = int(offset_x + item.x * scale)
+                mini_y = int(offset_y + item.y * scale)
+                minimap_surface.fill(TREASURE_COLOR, (mini_x, mini_y, marker_size, marker_size))
         
         # Draw monsters on minimap (only in visited rooms)
         for monster in self.monsters:
-            if monster.alive:
-                # Check if monster is in a visited room
-                for room in all_rooms:
-                    if room.visited and room.collidepoint(monster.x, monster.y):
-                        mini_x = int(offset_x + monster.real_x * scale)
-                        mini_y = int(offset_y + monster.real_y * scale)
-                        monster_size = max(2, int(scale))
-                        minimap_surface.fill(MONSTER_COLOR, 
-                                           pygame.Rect(mini_x, mini_y, monster_size, monster_size))
-                        break
+            if monster.alive and visited_room_mask[monster.y][monster.x]:
+                mini_x = int(offset_x + monster.real_x * scale)
+                mini_y = int(offset_y + monster.real_y * scale)
+                minimap_surface.fill(MONSTER_COLOR, (mini_x, mini_y, marker_size, marker_size))
         
         # Draw player (make it more visible)
         player_mini_x = int(offset_x + self.player.real_x * scale)
@@ -2333,42 +2644,191 @@ class EnhancedMazeGame:
         pygame.draw.rect(minimap_surface, COLORS['WHITE'], player_rect, 1)
         
         # Border
-        pygame.draw.rect(minimap_surface, COLORS['WHITE'], 
-                        pygame.Rect(0, 0, self.minimap_size, self.minimap_size), 2)
+        pygame.draw.rect(minimap_surface, COLORS['WHITE'], border_rect, 2)
         
         # Blit to screen
         self.screen.blit(minimap_surface, (minimap_x, minimap_y))
     
-    def draw_ui(self):
-        """Draw Isaac-like enhanced UI"""
-        ui_x = WINDOW_WIDTH - self.ui_width
+    def _build_ui_background(self, heart_rows: int):
+        """
+        Render the static chrome of the side panel once.
+        
+        Panel backgrounds and borders, section titles, stat icons and labels,
+        the empty progress bar and the controls/legend sections never change,
+        so they are drawn into one panel-sized surface that draw_ui blits
+        before adding the live values on top.
+        
+        Args:
+            heart_rows: Rows of hearts, which push every section below them down
+            
+        Returns:
+            Surface the size of the side panel
+        """
+        ui_width = self.ui_width
+        background = pygame.Surface((ui_width, WINDOW_HEIGHT)).convert()
         
         # Background with gradient effect
-        ui_rect = pygame.Rect(ui_x, 0, self.ui_width, WINDOW_HEIGHT)
-        pygame.draw.rect(self.screen, (20, 20, 30), ui_rect)  # Dark blue-gray
-        pygame.draw.rect(self.screen, (100, 80, 60), ui_rect, 3)  # Brown border
+        ui_rect = background.get_rect()
+        pygame.draw.rect(background, (20, 20, 30), ui_rect)  # Dark blue-gray
+        pygame.draw.rect(background, (100, 80, 60), ui_rect, 3)  # Brown border
         
         # Inner border with highlight
-        inner_rect = pygame.Rect(ui_x + 5, 5, self.ui_width - 10, WINDOW_HEIGHT - 10)
-        pygame.draw.rect(self.screen, (40, 35, 50), inner_rect, 2)
+        inner_rect = pygame.Rect(5, 5, ui_width - 10, WINDOW_HEIGHT - 10)
+        pygame.draw.rect(background, (40, 35, 50), inner_rect, 2)
+        
+        y_offset = self.minimap_size + 60
+        
+        # Health title (the hearts themselves are drawn live)
+        health_title = self._render_text(self.small_font, "HEALTH", COLORS['WHITE'])
+        background.blit(health_title, (15, y_offset))
+        
+        # Skip the hearts and the enemy counter, whose colors change
+        y_offset += 60 + heart_rows * 18 + 45
+        
+        # Stat panels with their icons and labels
+        for label, color in self.STAT_PANELS:
+            stat_rect = pygame.Rect(10, y_offset, ui_width - 20, 25)
+            pygame.draw.rect(background, (30, 25, 40), stat_rect, border_radius=3)
+            pygame.draw.rect(background, color, stat_rect, 2, border_radius=3)
+            
+            # Icon (simplified since unicode might not render well): sword,
+            # shield, key or gem, pre-rendered by _build_ui_icons
+            background.blit(self._ui_icons[label], (14, y_offset + 5))
+            
+            label_text = self._render_text(self.small_font, f"{label}:", COLORS['WHITE'])
+            background.blit(label_text, (35, y_offset + 5))
+            
+            y_offset += 30
+        
+        # Score panel
+        y_offset += 10
+        score_rect = pygame.Rect(10, y_offset, ui_width - 20, 30)
+        pygame.draw.rect(background, (50, 40, 60), score_rect, border_radius=5)
+        pygame.draw.rect(background, COLORS['GOLD'], score_rect, 2, border_radius=5)
+        
+        score_label = self._render_text(self.small_font, "SCORE:", COLORS['WHITE'])
+        background.blit(score_label, (20, y_offset + 8))
+        
+        y_offset += 40
+        
+        # Exploration panel
+        exp_rect = pygame.Rect(10, y_offset, ui_width - 20, 50)
+        pygame.draw.rect(background, (25, 35, 45), exp_rect, border_radius=5)
+        pygame.draw.rect(background, COLORS['CYAN'], exp_rect, 2, border_radius=5)
+        
+        exp_title = self._render_text(self.small_font, "MAP COMPLETION", COLORS['WHITE'])
+        background.blit(exp_title, (20, y_offset + 5))
+        
+        # Background bar with inner shadow
+        bar_bg = pygame.Rect(25, y_offset + 25, ui_width - 50, 12)
+        pygame.draw.rect(background, COLORS['BLACK'], bar_bg, border_radius=6)
+        pygame.draw.rect(background, COLORS['DARK_GRAY'], bar_bg, 2, border_radius=6)
+        
+        y_offset += 70
+        
+        # Controls section with Isaac-style design
+        controls_rect = pygame.Rect(10, y_offset, ui_width - 20, 120)
+        pygame.draw.rect(background, (20, 25, 35), controls_rect, border_radius=5)
+        pygame.draw.rect(background, COLORS['ORANGE'], controls_rect, 2, border_radius=5)
+        
+        # Controls header
+        controls_title = self._render_text(self.small_font, "CONTROLS", COLORS['ORANGE'])
+        background.blit(controls_title, (20, y_offset + 5))
+        
+        control_items = [
+            ("WASD", "Move", COLORS['WHITE']),
+            ("ESC", "Quit", COLORS['RED']),
+            ("R", "Restart", COLORS['YELLOW'])
+        ]
+        
+        for i, (key, action, color) in enumerate(control_items):
+            item_y = y_offset + 25 + i * 20
+            # Key button
+            key_rect = pygame.Rect(20, item_y, 30, 15)
+            pygame.draw.rect(background, color, key_rect, border_radius=3)
+            pygame.draw.rect(background, COLORS['BLACK'], key_rect, 1, border_radius=3)
+            
+            key_text = self._render_text(self.mini_font, key, COLORS['BLACK'])
+            key_text_rect = key_text.get_rect(center=key_rect.center)
+            background.blit(key_text, key_text_rect)
+            
+            # Action text
+            action_text = self._render_text(self.small_font, action, COLORS['WHITE'])
+            background.blit(action_text, (55, item_y))
+        
+        y_offset += 130
+        
+        # Legend section
+        legend_rect = pygame.Rect(10, y_offset, ui_width - 20, 100)
+        pygame.draw.rect(background, (30, 20, 40), legend_rect, border_radius=5)
+        pygame.draw.rect(background, COLORS['PURPLE'], legend_rect, 2, border_radius=5)
+        
+        legend_title = self._render_text(self.small_font, "LEGEND", COLORS['PURPLE'])
+        background.blit(legend_title, (20, y_offset + 5))
+        
+        legend_items = [
+            ("Locked Doors", COLORS['BROWN']),
+            ("Treasure Rooms", COLORS['GOLD']),
+            ("Key Rooms", COLORS['YELLOW']),
+        ]
+        
+        for i, (text, color) in enumerate(legend_items):
+            item_y = y_offset + 25 + i * 18
+            # Simple icon representation (colored square)
+            icon_rect = pygame.Rect(20, item_y, 12, 12)
+            if "Door" in text:
+                pygame.draw.rect(background, COLORS['BROWN'], icon_rect)
+            elif "Treasure" in text:
+                diamond_points = [
+                    (26, item_y + 2),
+                    (30, item_y + 6),
+                    (26, item_y + 10),
+                    (22, item_y + 6)
+                ]
+                pygame.draw.polygon(background, COLORS['GOLD'], diamond_points)
+            elif "Key" in text:
+                pygame.draw.circle(background, COLORS['YELLOW'], (24, item_y + 4), 3, 2)
+                pygame.draw.line(background, COLORS['YELLOW'],
+                               (27, item_y + 6), (30, item_y + 6), 2)
+            
+            legend_text = self._render_text(self.tiny_font, text, color)
+            background.blit(legend_text, (38, item_y))
+        return background
+    
+    def _redraw_ui_panel(self, pulse: int, visited_count: int, locked_doors_remaining: int):
+        """
+        Redraw the side panel's hearts, counters and map completion into the cached panel.
+        
+        Args:
+            pulse: Glow size (0-2) of the last full heart this frame
+            visited_count: Number of revealed cells, for map completion
+            locked_doors_remaining: Locked doors left, for the legend
+        """
+        panel = self._ui_panel
+        
+        # Health hearts wrap onto more rows as max HP grows
+        heart_size = 16
+        hearts_per_row = 6
+        heart_rows = (self.player.max_hp - 1) // hearts_per_row + 1
+        
+        # Static panel chrome, re-rendered only when the heart rows change
+        # its layout; everything drawn below is live on top of it
+        if self._ui_background_rows != heart_rows:
+            self._ui_background = self._build_ui_background(heart_rows)
+            self._ui_background_rows = heart_rows
+        panel.blit(self._ui_background, (0, 0))
         
         y_offset = self.minimap_size + 60
         
         # Player stats with icons and bars
         # Health bar (Isaac-style)
         health_y = y_offset
-        health_title = self.small_font.render("HEALTH", True, COLORS['WHITE'])
-        self.screen.blit(health_title, (ui_x + 15, health_y))
         
         # Health hearts with animations
-        heart_size = 16
-        hearts_per_row = 6
-        tick = pygame.time.get_ticks()
-        
         for i in range(self.player.max_hp):
             row = i // hearts_per_row
             col = i % hearts_per_row
-            heart_x = ui_x + 15 + col * (heart_size + 2)
+            heart_x = 15 + col * (heart_size + 2)
             heart_y = health_y + 20 + row * (heart_size + 2)
             
             # Determine if heart is filled
@@ -2377,45 +2837,22 @@ class EnhancedMazeGame:
             # Pulsing animation for filled hearts
             pulse_offset = 0
             if is_filled:
-                pulse = int(abs(tick % 1000 - 500) / 250)  # 0-2 pulse range
                 pulse_offset = pulse if i == self.player.hp - 1 else 0  # Only last heart pulses
             
-            # Heart color
-            heart_color = COLORS['RED'] if is_filled else COLORS['DARK_GRAY']
-            
             # Glow effect for filled hearts
             if is_filled and pulse_offset > 0:
-                glow_radius = 8 + pulse_offset
-                glow_surface = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-                pygame.draw.circle(glow_surface, (255, 0, 0, 50), (glow_radius, glow_radius), glow_radius)
-                self.screen.blit(glow_surface, (heart_x + 2 - pulse_offset, heart_y + 4 - pulse_offset))
-            
-            # Heart shape using circles and triangle
-            pygame.draw.circle(self.screen, heart_color, (heart_x + 4, heart_y + 4), 4)
-            pygame.draw.circle(self.screen, heart_color, (heart_x + 8, heart_y + 4), 4)
-            triangle_points = [
-                (heart_x + 2, heart_y + 6),
-                (heart_x + 10, heart_y + 6),
-                (heart_x + 6, heart_y + 12)
-            ]
-            pygame.draw.polygon(self.screen, heart_color, triangle_points)
+                panel.blit(self._ui_icons[('heart_glow', pulse_offset)],
+                           (heart_x + 2 - pulse_offset, heart_y + 4 - pulse_offset))
             
-            # Heart outline with highlight
-            outline_color = COLORS['BLACK']
-            if is_filled:
-                # Add white highlight for depth
-                pygame.draw.circle(self.screen, (255, 200, 200), (heart_x + 3, heart_y + 3), 1)
-                pygame.draw.circle(self.screen, (255, 200, 200), (heart_x + 7, heart_y + 3), 1)
-            
-            pygame.draw.circle(self.screen, outline_color, (heart_x + 4, heart_y + 4), 4, 1)
-            pygame.draw.circle(self.screen, outline_color, (heart_x + 8, heart_y + 4), 4, 1)
-            pygame.draw.polygon(self.screen, outline_color, triangle_points, 1)
+            # Heart shape, pre-rendered full or empty
+            panel.blit(self._ui_icons['heart_filled' if is_filled else 'heart_empty'],
+                       (heart_x, heart_y))
         
-        y_offset += 60 + ((self.player.max_hp - 1) // hearts_per_row + 1) * 18
+        y_offset += 60 + heart_rows * 18
         
         # Enemy counter for current room
-        alive_enemies = sum(1 for m in self.monsters if m.alive)
-        enemy_rect = pygame.Rect(ui_x + 10, y_offset, self.ui_width - 20, 35)
+        alive_enemies = len(self.monsters)
+        enemy_rect = pygame.Rect(10, y_offset, self.ui_width - 20, 35)
         
         # Color changes based on enemy count
         if alive_enemies == 0:
@@ -2428,114 +2865,46 @@ class EnhancedMazeGame:
             border_color = COLORS['RED']
             bg_color = (40, 20, 20)
         
-        pygame.draw.rect(self.screen, bg_color, enemy_rect, border_radius=4)
-        pygame.draw.rect(self.screen, border_color, enemy_rect, 2, border_radius=4)
+        pygame.draw.rect(panel, bg_color, enemy_rect, border_radius=4)
+        pygame.draw.rect(panel, border_color, enemy_rect, 2, border_radius=4)
         
         # Enemy icon (skull)
-        skull_x = ui_x + 18
-        skull_y = y_offset + 10
-        pygame.draw.ellipse(self.screen, border_color, 
-                          pygame.Rect(skull_x, skull_y, 12, 14))
-        pygame.draw.rect(self.screen, border_color, 
-                        pygame.Rect(skull_x + 2, skull_y + 10, 8, 6))
-        # Eye sockets
-        pygame.draw.circle(self.screen, COLORS['BLACK'], (skull_x + 3, skull_y + 5), 2)
-        pygame.draw.circle(self.screen, COLORS['BLACK'], (skull_x + 9, skull_y + 5), 2)
+        panel.blit(self._ui_icons[('skull', border_color)], (18, y_offset + 10))
         
         # Enemy count text
-        enemy_label = self.small_font.render("ENEMIES:", True, COLORS['WHITE'])
+        enemy_label = self._render_text(self.small_font, "ENEMIES:", COLORS['WHITE'])
         enemy_count = self.small_font.render(str(alive_enemies), True, border_color)
-        self.screen.blit(enemy_label, (ui_x + 38, y_offset + 10))
-        self.screen.blit(enemy_count, (ui_x + self.ui_width - 35, y_offset + 10))
+        panel.blit(enemy_label, (38, y_offset + 10))
+        panel.blit(enemy_count, (self.ui_width - 35, y_offset + 10))
         
         y_offset += 45
         
-        # Stats with icons
-        stat_items = [
-            ("ATTACK", self.player.attack, COLORS['YELLOW'], "⚔"),
-            ("DEFENSE", self.player.defense, COLORS['CYAN'], "🛡"),
-            ("KEYS", self.player.keys, COLORS['GOLD'], "🗝"),
-            ("TREASURE", self.player.treasure, COLORS['GREEN'], "💎"),
-        ]
+        # Stat values, in STAT_PANELS order
+        stat_values = (self.player.attack, self.player.defense,
+                       self.player.keys, self.player.treasure)
         
-        for label, value, color, icon in stat_items:
-            # Background panel for each stat
-            stat_rect = pygame.Rect(ui_x + 10, y_offset, self.ui_width - 20, 25)
-            pygame.draw.rect(self.screen, (30, 25, 40), stat_rect, border_radius=3)
-            pygame.draw.rect(self.screen, color, stat_rect, 2, border_radius=3)
-            
-            # Icon (simplified since unicode might not render well)
-            icon_rect = pygame.Rect(ui_x + 15, y_offset + 5, 15, 15)
-            if label == "ATTACK":
-                # Draw sword icon
-                pygame.draw.line(self.screen, color, 
-                               (ui_x + 18, y_offset + 8), (ui_x + 25, y_offset + 15), 2)
-                pygame.draw.line(self.screen, color,
-                               (ui_x + 15, y_offset + 12), (ui_x + 28, y_offset + 12), 1)
-            elif label == "DEFENSE":
-                # Draw shield icon
-                pygame.draw.circle(self.screen, color, (ui_x + 22, y_offset + 12), 6, 2)
-            elif label == "KEYS":
-                # Draw key icon
-                pygame.draw.circle(self.screen, color, (ui_x + 18, y_offset + 10), 3, 2)
-                pygame.draw.line(self.screen, color,
-                               (ui_x + 21, y_offset + 12), (ui_x + 27, y_offset + 12), 2)
-            elif label == "TREASURE":
-                # Draw gem icon
-                diamond_points = [
-                    (ui_x + 22, y_offset + 7),
-                    (ui_x + 26, y_offset + 10),
-                    (ui_x + 22, y_offset + 17),
-                    (ui_x + 18, y_offset + 10)
-                ]
-                pygame.draw.polygon(self.screen, color, diamond_points, 2)
-            
-            # Text
-            label_text = self.small_font.render(f"{label}:", True, COLORS['WHITE'])
+        for (label, color), value in zip(self.STAT_PANELS, stat_values):
             value_text = self.small_font.render(str(value), True, color)
-            
-            self.screen.blit(label_text, (ui_x + 35, y_offset + 5))
-            self.screen.blit(value_text, (ui_x + self.ui_width - 40, y_offset + 5))
+            panel.blit(value_text, (self.ui_width - 40, y_offset + 5))
             
             y_offset += 30
         
         # Score with special formatting
         y_offset += 10
-        score_rect = pygame.Rect(ui_x + 10, y_offset, self.ui_width - 20, 30)
-        pygame.draw.rect(self.screen, (50, 40, 60), score_rect, border_radius=5)
-        pygame.draw.rect(self.screen, COLORS['GOLD'], score_rect, 2, border_radius=5)
-        
-        score_label = self.small_font.render("SCORE:", True, COLORS['WHITE'])
         score_value = self.small_font.render(f"{self.player.score:,}", True, COLORS['GOLD'])
-        self.screen.blit(score_label, (ui_x + 20, y_offset + 8))
-        self.screen.blit(score_value, (ui_x + 80, y_offset + 8))
+        panel.blit(score_value, (80, y_offset + 8))
         
         y_offset += 40
         
         # Exploration with Isaac-style design
-        visited_count = len(self.player.visited_cells)
-        total_paths = sum(1 for row in self.maze for cell in row if cell != '#')
-        exploration_percent = (visited_count / total_paths) * 100
-        
-        # Exploration panel
-        exp_rect = pygame.Rect(ui_x + 10, y_offset, self.ui_width - 20, 50)
-        pygame.draw.rect(self.screen, (25, 35, 45), exp_rect, border_radius=5)
-        pygame.draw.rect(self.screen, COLORS['CYAN'], exp_rect, 2, border_radius=5)
-        
-        exp_title = self.small_font.render("MAP COMPLETION", True, COLORS['WHITE'])
-        self.screen.blit(exp_title, (ui_x + 20, y_offset + 5))
+        exploration_percent = (visited_count / self.total_paths) * 100
         
         # Animated progress bar with glow effect
         bar_width = self.ui_width - 50
         bar_height = 12
-        bar_x = ui_x + 25
+        bar_x = 25
         bar_y = y_offset + 25
         
-        # Background bar with inner shadow
-        bar_bg = pygame.Rect(bar_x, bar_y, bar_width, bar_height)
-        pygame.draw.rect(self.screen, COLORS['BLACK'], bar_bg, border_radius=6)
-        pygame.draw.rect(self.screen, COLORS['DARK_GRAY'], bar_bg, 2, border_radius=6)
-        
         # Progress fill with gradient effect
         progress_width = int((exploration_percent / 100) * bar_width)
         if progress_width > 0:
@@ -2544,98 +2913,51 @@ class EnhancedMazeGame:
             
             # Color changes based on completion
             if exploration_percent < 30:
-                progress_color = COLORS['RED']
+                progress_color, lighter_color = self.PROGRESS_BAR_COLORS[0]
             elif exploration_percent < 70:
-                progress_color = COLORS['YELLOW']
+                progress_color, lighter_color = self.PROGRESS_BAR_COLORS[1]
             else:
-                progress_color = COLORS['LIME']
+                progress_color, lighter_color = self.PROGRESS_BAR_COLORS[2]
                 
-            pygame.draw.rect(self.screen, progress_color, progress_rect, border_radius=4)
+            pygame.draw.rect(panel, progress_color, progress_rect, border_radius=4)
             
             # Shine effect on progress bar
             shine_rect = pygame.Rect(bar_x + 2, bar_y + 2, progress_width - 4, 4)
-            lighter_color = tuple(min(255, c + 50) for c in progress_color[:3])
-            pygame.draw.rect(self.screen, lighter_color, shine_rect, border_radius=4)
+            pygame.draw.rect(panel, lighter_color, shine_rect, border_radius=4)
         
         # Percentage text
         exp_percent_text = self.small_font.render(f"{exploration_percent:.1f}%", True, COLORS['WHITE'])
-        text_rect = exp_percent_text.get_rect(center=(ui_x + self.ui_width // 2, bar_y + bar_height // 2))
-        self.screen.blit(exp_percent_text, text_rect)
+        text_rect = exp_percent_text.get_rect(center=(self.ui_width // 2, bar_y + bar_height // 2))
+        panel.blit(exp_percent_text, text_rect)
         
-        y_offset += 70
+        # Skip the controls section, then add the live line under the legend
+        y_offset += 70 + 130
         
-        # Controls section with Isaac-style design
-        controls_rect = pygame.Rect(ui_x + 10, y_offset, self.ui_width - 20, 120)
-        pygame.draw.rect(self.screen, (20, 25, 35), controls_rect, border_radius=5)
-        pygame.draw.rect(self.screen, COLORS['ORANGE'], controls_rect, 2, border_radius=5)
-        
-        # Controls header
-        controls_title = self.small_font.render("CONTROLS", True, COLORS['ORANGE'])
-        self.screen.blit(controls_title, (ui_x + 20, y_offset + 5))
-        
-        control_items = [
-            ("WASD", "Move", COLORS['WHITE']),
-            ("ESC", "Quit", COLORS['RED']),
-            ("R", "Restart", COLORS['YELLOW'])
-        ]
-        
-        for i, (key, action, color) in enumerate(control_items):
-            item_y = y_offset + 25 + i * 20
-            # Key button
-            key_rect = pygame.Rect(ui_x + 20, item_y, 30, 15)
-            pygame.draw.rect(self.screen, color, key_rect, border_radius=3)
-            pygame.draw.rect(self.screen, COLORS['BLACK'], key_rect, 1, border_radius=3)
-            
-            key_text = pygame.font.Font(None, FONT_SIZE_MINI).render(key, True, COLORS['BLACK'])
-            key_text_rect = key_text.get_rect(center=key_rect.center)
-            self.screen.blit(key_text, key_text_rect)
-            
-            # Action text
-            action_text = self.small_font.render(action, True, COLORS['WHITE'])
-            self.screen.blit(action_text, (ui_x + 55, item_y))
-        
-        y_offset += 130
-        
-        # Legend section
-        legend_rect = pygame.Rect(ui_x + 10, y_offset, self.ui_width - 20, 100)
-        pygame.draw.rect(self.screen, (30, 20, 40), legend_rect, border_radius=5)
-        pygame.draw.rect(self.screen, COLORS['PURPLE'], legend_rect, 2, border_radius=5)
-        
-        legend_title = self.small_font.render("LEGEND", True, COLORS['PURPLE'])
-        self.screen.blit(legend_title, (ui_x + 20, y_offset + 5))
+        legend_text = self.tiny_font.render(f"Doors Remaining: {locked_doors_remaining}",
+                                            True, COLORS['WHITE'])
+        panel.blit(legend_text, (20, y_offset + 25 + 3 * 18))
+    
+    def draw_ui(self):
+        """Draw Isaac-like enhanced UI"""
+        ui_x = WINDOW_WIDTH - self.ui_width
         
+        # Everything the side panel shows. Hearts, counters and map completion
+        # only change on these values, so the panel is redrawn just then and
+        # otherwise blitted from the previous frame in one call
+        pulse = int(abs(pygame.time.get_ticks() % 1000 - 500) / 250)  # 0-2 pulse range
+        visited_count = sum(row.count(1) for row in self.visited_mask)
         locked_doors_remaining = len(getattr(self, 'locked_doors', []))
-        
-        legend_items = [
-            ("🚪", "Locked Doors", COLORS['BROWN']),
-            ("💎", "Treasure Rooms", COLORS['GOLD']),
-            ("🗝️", "Key Rooms", COLORS['YELLOW']),
-            ("", f"Doors Remaining: {locked_doors_remaining}", COLORS['WHITE'])
-        ]
-        
-        for i, (icon, text, color) in enumerate(legend_items):
-            item_y = y_offset + 25 + i * 18
-            if icon:
-                # Simple icon representation (colored square)
-                icon_rect = pygame.Rect(ui_x + 20, item_y, 12, 12)
-                if "Door" in text:
-                    pygame.draw.rect(self.screen, COLORS['BROWN'], icon_rect)
-                elif "Treasure" in text:
-                    diamond_points = [
-                        (ui_x + 26, item_y + 2),
-                        (ui_x + 30, item_y + 6),
-                        (ui_x + 26, item_y + 10),
-                        (ui_x + 22, item_y + 6)
-                    ]
-                    pygame.draw.polygon(self.screen, COLORS['GOLD'], diamond_points)
-                elif "Key" in text:
-                    pygame.draw.circle(self.screen, COLORS['YELLOW'], (ui_x + 24, item_y + 4), 3, 2)
-                    pygame.draw.line(self.screen, COLORS['YELLOW'],
-                                   (ui_x + 27, item_y + 6), (ui_x + 30, item_y + 6), 2)
-            
-            text_x = ui_x + 38 if icon else ui_x + 20
-            legend_text = pygame.font.Font(None, FONT_SIZE_TINY).render(text, True, color)
-            self.screen.blit(legend_text, (text_x, item_y))
+        player = self.player
+        panel_state = (player.max_hp, player.hp, pulse,
+                       # Defeated monsters are dropped from the list as soon
+                       # as they die, so its length is the live count
+                       len(self.monsters),
+                       player.attack, player.defense, player.keys, player.treasure,
+                       player.score, visited_count, locked_doors_remaining)
+        if panel_state != self._ui_panel_state:
+            self._redraw_ui_panel(pulse, visited_count, locked_doors_remaining)
+            self._ui_panel_state = panel_state
+        self.screen.blit(self._ui_panel, (ui_x, 0))
         
         # ========== DEBUG PANEL (F3 to toggle) ==========
         if self.debug_enabled:
@@ -2818,7 +3140,7 @@ class EnhancedMazeGame:
                 self.screen.blit(ghost_warning, (debug_x + 15, debug_y))
                 debug_y += 18
                 
-                ghost_tip = pygame.font.Font(None, FONT_SIZE_TINY).render(
+                ghost_tip = self.tiny_font.render(
                     "Use IJKL or Numpad instead",
                     True, COLORS['YELLOW']
                 )
@@ -2833,7 +3155,7 @@ class EnhancedMazeGame:
                 debug_y += 18
             
             # Frame counter
-            frame_line = pygame.font.Font(None, FONT_SIZE_TINY).render(
+            frame_line = self.tiny_font.render(
                 f"Frame: {self.frame_counter}",
                 True, COLORS['DARK_GRAY']
             )
@@ -2841,7 +3163,7 @@ class EnhancedMazeGame:
             debug_y += 18
             
             # FPS
-            fps_line = pygame.font.Font(None, FONT_SIZE_TINY).render(
+            fps_line = self.tiny_font.render(
                 f"FPS: {int(self.clock.get_fps())}",
                 True, COLORS['DARK_GRAY']
             )
@@ -2849,7 +3171,7 @@ class EnhancedMazeGame:
             debug_y += 25
             
             # Help text
-            help_text = pygame.font.Font(None, FONT_SIZE_TINY).render(
+            help_text = self.tiny_font.render(
                 "Press F1 for control help",
                 True, COLORS['CYAN']
             )
@@ -2858,7 +3180,7 @@ class EnhancedMazeGame:
         
         # Game status messages
         if self.game_won:
-            win_text = self.font.render("VICTORY!", True, COLORS['GOLD'])
+            win_text = self._render_text(self.font, "VICTORY!", COLORS['GOLD'])
             win_rect = win_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             
             bg_rect = win_rect.inflate(60, 40)
@@ -2867,12 +3189,12 @@ class EnhancedMazeGame:
             
             self.screen.blit(win_text, win_rect)
             
-            restart_text = self.small_font.render("Press R to play again", True, COLORS['WHITE'])
+            restart_text = self._render_text(self.small_font, "Press R to play again", COLORS['WHITE'])
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             self.screen.blit(restart_text, restart_rect)
         
         elif self.game_over:
-            game_over_text = self.font.render("GAME OVER", True, COLORS['RED'])
+            game_over_text = self._render_text(self.font, "GAME OVER", COLORS['RED'])
             over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
             
             bg_rect = over_rect.inflate(60, 40)
@@ -2881,7 +3203,7 @@ class EnhancedMazeGame:
             
             self.screen.blit(game_over_text, over_rect)
             
-            restart_text = self.small_font.render("Press R to try again", True, COLORS['WHITE'])
+            restart_text = self._render_text(self.small_font, "Press R to try again", COLORS['WHITE'])
             restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
             self.screen.blit(restart_text, restart_rect)
     
@@ -2905,10 +3227,10 @@ class EnhancedMazeGame:
             intensity = 0
         
         if intensity > 0:
-            # Create semi-transparent overlay
-            overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+            # Semi-transparent overlay: the black surface is made once and
+            # only its alpha changes from frame to frame
+            overlay = self._transition_overlay
             overlay.set_alpha(intensity)
-            overlay.fill(COLORS['BLACK'])
             self.screen.blit(overlay, (0, 0))
     
     def run(self):
@@ -9,6 +9,11 @@ from GameConstants import *
 class MonsterManager:
     """Manages monster generation, placement, and behavior in the dungeon."""
     
+    # One-step moves a wandering monster picks from
+    MOVE_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+    # Cells monsters can't enter (walls and every kind of door)
+    BLOCKING_CELLS = frozenset(('#', 'D', 'R', 'O'))
+    
     def __init__(self):
         """Initialize the monster manager."""
         self.monsters = []
@@ -29,20 +34,34 @@ class MonsterManager:
         """
         self.monsters = []
         
+        # Rasterize room membership once: 1 = main room, 2 = treasure room.
+        # Main rooms are stamped last so they win where the two overlap
+        height = len(maze)
+        width = len(maze[0]) if maze else 0
+        room_mask = [bytearray(width) for _ in range(height)]
+        for room_kind, room_list in ((2, treasure_rooms), (1, rooms)):
+            for room in room_list:
+                left, right = max(0, room.left), min(width, room.right)
+                top, bottom = max(0, room.top), min(height, room.bottom)
+                if left >= right or top >= bottom:
+                    continue
+                room_span = bytes((room_kind,)) * (right - left)
+                for mask_row in room_mask[top:bottom]:
+                    mask_row[left:right] = room_span
+        
         # Categorize floor positions
         main_room_positions = []
         treasure_room_positions = []
         corridor_positions = []
         
         for y, row in enumerate(maze):
+            mask_row = room_mask[y]
             for x, cell in enumerate(row):
                 if cell == ' ' and (x, y) not in used_positions:
-                    in_main = any(room.collidepoint(x, y) for room in rooms)
-                    in_treasure = any(room.collidepoint(x, y) for room in treasure_rooms)
-                    
-                    if in_main:
+                    room_kind = mask_row[x]
+                    if room_kind == 1:
                         main_room_positions.append((x, y))
-                    elif in_treasure:
+                    elif room_kind == 2:
                         treasure_room_positions.append((x, y))
                     else:
                         corridor_positions.append((x, y))
@@ -116,25 +135,28 @@ class MonsterManager:
             maze: 2D dungeon grid
             current_time: Current game time in milliseconds
         """
-        for monster in self.monsters:
-            if not monster.alive:
-                continue
+        # Monsters whose move delay has elapsed, with all of their random
+        # directions drawn in a single call
+        due = [monster for monster in self.monsters
+               if monster.alive and current_time - monster.last_move_time > monster.move_delay]
+        if not due:
+            return
+        moves = random.choices(self.MOVE_DIRECTIONS, k=len(due))
+        
+        maze_height, maze_width = len(maze), len(maze[0])
+        blocking_cells = self.BLOCKING_CELLS
+        for monster, (dx, dy) in zip(due, moves):
+            new_x = monster.x + dx
+            new_y = monster.y + dy
+            
+            # Check if move is valid (monsters can't pass through doors)
+            if (0 <= new_y < maze_height and 
+                0 <= new_x < maze_width and 
+                maze[new_y][new_x] not in blocking_cells):
+                monster.x = new_x
+                monster.y = new_y
             
-            if current_time - monster.last_move_time > monster.move_delay:
-                directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-                dx, dy = random.choice(directions)
-                
-                new_x = monster.x + dx
-                new_y = monster.y + dy
-                
-                # Check if move is valid (monsters can't pass through doors)
-                if (0 <= new_y < len(maze) and 
-                    0 <= new_x < len(maze[0]) and 
-                    maze[new_y][new_x] not in ['#', 'D', 'R', 'O']):
-                    monster.x = new_x
-                    monster.y = new_y
-                
-                monster.last_move_time = current_time
+            monster.last_move_time = current_time
     
     def combat(self, monster: Monster, player) -> Tuple[bool, bool]:
         """